@@ -0,0 +1,74 @@
+import asyncio
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_BODY = json.dumps({"data": {"ok": True}}).encode("utf-8")
+
+
+async def _serve(latency, body, ready):
+    head = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n\r\n"
+    )
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in request.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                if latency:
+                    await asyncio.sleep(latency)
+                writer.write(head + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=4096)
+    ready.send(server.sockets[0].getsockname()[1])
+    async with server:
+        await server.serve_forever()
+
+
+def _run(latency, body, ready):
+    asyncio.run(_serve(latency, body, ready))
+
+
+class StandInServer:
+    """Local HTTP/1.1 server standing in for sellerapi.kaufland.com.
+
+    Runs in a separate process so it does not compete with the client for the GIL.
+    """
+
+    def __init__(self, *, latency=0.0, body=None):
+        self._ready, child = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_run, args=(latency, body or DEFAULT_BODY, child), daemon=True
+        )
+        self.port = None
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.port}/v2"
+
+    def __enter__(self):
+        self._process.start()
+        self.port = self._ready.recv()
+        return self
+
+    def __exit__(self, *args):
+        self._process.terminate()
+        self._process.join()
@@ -0,0 +1,47 @@
+"""Cost of creating API clients that may never send a request.
+
+Compares the lazy transport with building an httpx client (and SSL context) per
+instance, as every ``Client()`` used to. Run with
+``python benchmarks/bench_client_construction.py``.
+"""
+
+import timeit
+
+import _server  # noqa: F401
+import httpx
+
+from kaufland.api.orders import Orders
+
+CLIENTS = 200
+
+
+def eager():
+    client = Orders(client_key="ck", secret_key="sk")
+    client._transport._client
+    client._transport._httpx_client = httpx.Client(timeout=None)
+    client.close()
+
+
+def lazy():
+    Orders(client_key="ck", secret_key="sk").close()
+
+
+def first_request_ready():
+    client = Orders(client_key="ck", secret_key="sk")
+    client._transport._client
+    client.close()
+
+
+def main():
+    cases = {
+        "httpx client per instance": eager,
+        "lazy, never used": lazy,
+        "lazy, first use": first_request_ready,
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=CLIENTS, repeat=3))
+        print(f"{name:<26} {elapsed / CLIENTS * 1e3:7.3f} ms/client")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Client-side cost of the full prepare_request -> parse_response path.
+
+Requests are routed in-process to a WSGI/ASGI app, so no sockets are involved.
+Run with ``python benchmarks/bench_inprocess.py``.
+"""
+
+import asyncio
+import json
+import time
+
+import _server  # noqa: F401
+
+from kaufland import Client, WSGITransport
+from kaufland.asyncio import ASGITransport
+from kaufland.asyncio import Client as AsyncClient
+
+REQUESTS = 20000
+BODY = json.dumps({"data": {"id_unit": 1, "price": 1000}}).encode("utf-8")
+HEADERS = [("Content-Type", "application/json")]
+
+
+def wsgi_app(environ, start_response):
+    start_response("200 OK", HEADERS)
+    return [BODY]
+
+
+async def asgi_app(scope, receive, send):
+    await receive()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": BODY})
+
+
+def report(name, elapsed):
+    print(
+        f"{name:<6} {REQUESTS / elapsed:8.0f} req/s "
+        f"{elapsed / REQUESTS * 1e6:8.1f} us/request"
+    )
+
+
+def bench_sync():
+    client = Client(
+        client_key="ck",
+        secret_key="sk",
+        storefront="de",
+        endpoint="http://testserver/v2",
+        transport=WSGITransport(wsgi_app),
+    )
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        client._request(f"/units/{i}", params={"embedded": "product"})
+    report("wsgi", time.perf_counter() - start)
+
+
+async def bench_async():
+    client = AsyncClient(
+        client_key="ck",
+        secret_key="sk",
+        storefront="de",
+        endpoint="http://testserver/v2",
+        transport=ASGITransport(asgi_app),
+    )
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        await client._request(f"/units/{i}", params={"embedded": "product"})
+    report("asgi", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    bench_sync()
+    asyncio.run(bench_async())
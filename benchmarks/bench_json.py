@@ -0,0 +1,86 @@
+"""Encode/decode cost per JSON codec on realistic payloads.
+
+Encodes a full 150-unit ``bulk_update_units`` body and decodes a 100-item
+``/order-units`` listing. Run with ``python benchmarks/bench_json.py``.
+"""
+
+import timeit
+
+import _server  # noqa: F401
+
+from kaufland.base import json_codec
+
+BULK = [
+    {
+        "id_unit": 100000 + i,
+        "unit_data": {
+            "listing_price": 1999 + i,
+            "minimum_price": 1499,
+            "amount": i % 40,
+            "note": "Größe XL – schnelle Lieferung",
+            "handling_time": 2,
+            "id_shipping_group": 3421,
+            "id_warehouse": 12,
+        },
+    }
+    for i in range(150)
+]
+
+ORDER_UNIT = {
+    "id_order_unit": 0,
+    "id_order": "MGNW1RF",
+    "id_offer": "OFFER-123",
+    "status": "sent",
+    "price": 2599,
+    "revenue_gross": 2599,
+    "revenue_net": 2184,
+    "shipping_rate": 495,
+    "storefront": "de",
+    "fulfillment_type": "fulfilled_by_merchant",
+    "ts_created_iso": "2024-05-01T10:00:00Z",
+    "ts_updated_iso": "2024-05-02T08:30:00Z",
+    "shipping_address": {
+        "first_name": "Erika",
+        "last_name": "Mustermann",
+        "street": "Heinestraße",
+        "house_number": "12",
+        "postcode": "10115",
+        "city": "Berlin",
+        "country": "DE",
+    },
+    "product": {
+        "id_product": 20574181,
+        "title": "Kaffeevollautomat mit Milchschaumdüse",
+        "eans": ["4006381333931"],
+        "main_picture": "https://media.cdn.kaufland.de/product-images/1024x1024/a.jpg",
+        "id_category": 15761,
+    },
+}
+
+
+def listing():
+    data = [dict(ORDER_UNIT, id_order_unit=i) for i in range(100)]
+    payload = {"data": data, "pagination": {"offset": 0, "limit": 100, "total": 5000}}
+    return json_codec.JsonCodec().dumps(payload)
+
+
+def main():
+    body = listing()
+    print(f"bulk body: 150 units; listing: {len(body) / 1024:.0f} KiB")
+    for name in json_codec.CODECS:
+        try:
+            codec = json_codec.set_codec(name)
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        encode = min(timeit.repeat(lambda: codec.dumps(BULK), number=200, repeat=5))
+        decode = min(timeit.repeat(lambda: codec.loads(body), number=200, repeat=5))
+        print(
+            f"{name:<8} encode bulk {encode / 200 * 1e6:8.1f} us  "
+            f"decode listing {decode / 200 * 1e6:8.1f} us"
+        )
+    json_codec.set_codec(None)
+
+
+if __name__ == "__main__":
+    main()
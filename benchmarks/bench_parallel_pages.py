@@ -0,0 +1,64 @@
+"""Full 50k-unit listing, serial vs parallel page fetching.
+
+Pages are served in-process by an ASGI app that adds a fixed latency per request.
+Run with ``python benchmarks/bench_parallel_pages.py``.
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+import _server  # noqa: F401
+
+from kaufland.asyncio import ASGITransport
+from kaufland.asyncio.api.units import Units
+
+TOTAL = 50_000
+LATENCY = 0.1
+
+
+async def app(scope, receive, send):
+    await receive()
+    query = parse_qs(scope["query_string"].decode())
+    offset, limit = int(query["offset"][0]), int(query["limit"][0])
+    await asyncio.sleep(LATENCY)
+    data = [{"id_unit": i} for i in range(offset, min(offset + limit, TOTAL))]
+    body = json.dumps(
+        {"data": data, "pagination": {"offset": offset, "limit": limit, "total": TOTAL}}
+    ).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def run(concurrency):
+    units = Units(
+        client_key="ck",
+        secret_key="sk",
+        storefront="de",
+        endpoint="http://testserver/v2",
+        transport=ASGITransport(app),
+    )
+    start = time.perf_counter()
+    count = 0
+    async for _ in units.iter_units(concurrency=concurrency):
+        count += 1
+    assert count == TOTAL
+    return time.perf_counter() - start
+
+
+def main():
+    for concurrency in (None, 8, 32):
+        elapsed = asyncio.run(run(concurrency))
+        label = "serial" if concurrency is None else f"concurrency={concurrency}"
+        print(f"{label:<16} {TOTAL} units in {elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
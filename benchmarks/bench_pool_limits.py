@@ -0,0 +1,72 @@
+"""Async fan-out throughput and client CPU for different connection-pool limits.
+
+Each case keeps at most ``max_connections`` requests in flight, as ``Client.map``
+does with a matching ``concurrency``. Run with
+``python benchmarks/bench_pool_limits.py``.
+
+More connections only pay off while ``max_keepalive_connections`` stays small.
+On every request and response httpcore's pool polls each connection for expiry
+and, per idle connection, counts the idle ones again, so a pool that keeps many
+idle connections alive spends its time on bookkeeping instead of requests.
+
+HTTP/2 needs a TLS endpoint and the ``h2`` package, so it is not exercised against
+the local stand-in server.
+"""
+
+import asyncio
+import time
+
+import httpx
+from _server import StandInServer
+
+from kaufland.asyncio import Client
+
+REQUESTS = 500
+ROUNDS = 3
+LATENCY = 0.1
+
+CASES = {
+    "max_connections=10": httpx.Limits(max_connections=10),
+    "httpx default (100/20)": httpx.Limits(
+        max_connections=100, max_keepalive_connections=20
+    ),
+    "200, keepalive 20": httpx.Limits(
+        max_connections=200, max_keepalive_connections=20
+    ),
+    "200, keepalive 200": httpx.Limits(
+        max_connections=200, max_keepalive_connections=200
+    ),
+}
+
+
+async def run(endpoint, limits):
+    async with Client(
+        client_key="ck", secret_key="sk", endpoint=endpoint, limits=limits
+    ) as client:
+        semaphore = asyncio.Semaphore(limits.max_connections)
+
+        async def call():
+            async with semaphore:
+                await client._request("/units", add_storefront=False)
+
+        best = None
+        for _ in range(ROUNDS):
+            start, cpu = time.perf_counter(), time.process_time()
+            await asyncio.gather(*(call() for _ in range(REQUESTS)))
+            result = (time.perf_counter() - start, time.process_time() - cpu)
+            best = result if best is None else min(best, result)
+        return best
+
+
+def main():
+    with StandInServer(latency=LATENCY) as server:
+        for name, limits in CASES.items():
+            elapsed, cpu = asyncio.run(run(server.endpoint, limits))
+            print(
+                f"{name:<24} {REQUESTS / elapsed:6.0f} req/s  "
+                f"client cpu {cpu / REQUESTS * 1e3:5.2f} ms/request"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Client-side cost per generated call: routing, URL, signing, headers, parsing.
+
+The transport returns a canned response, so everything measured happens in the
+client. ``kaufland_endpoint`` is the decorator generated clients used before
+compiled routes; it puts the path template into the call's kwargs, leaving
+``fill_query_params`` to search it and ``resolve_method`` to recover the method.
+Run with ``python benchmarks/bench_request_overhead.py``.
+"""
+
+import timeit
+
+import _server  # noqa: F401
+
+from kaufland.api.order_units import OrderUnits
+from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+
+REQUESTS = 20000
+BODY = b'{"data": {"id_order_unit": 1, "status": "sent"}}'
+
+
+class CannedResponse:
+    status_code = 200
+    headers = {"Content-Type": "application/json"}
+    content = BODY
+    text = BODY.decode("utf-8")
+
+
+class CannedTransport:
+    def request(self, *, method, url, headers=None, content=None):
+        return CannedResponse()
+
+    def close(self):
+        pass
+
+
+class DecoratedOrderUnits(OrderUnits):
+    @kaufland_endpoint("/order-units/{}", method="GET")
+    def get_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
+        return self._request(
+            fill_query_params(kwargs.pop("path"), id_order_unit),
+            params=kwargs,
+            add_storefront=False,
+        )
+
+
+def main():
+    options = {"client_key": "ck", "secret_key": "sk", "storefront": "de"}
+    client = OrderUnits(transport=CannedTransport(), **options)
+    decorated = DecoratedOrderUnits(transport=CannedTransport(), **options)
+    since = "2024-01-01T00:00:00Z"
+    cases = {
+        "decorator, path param": lambda: decorated.get_order_unit(1, embedded="x"),
+        "route, path param": lambda: client.get_order_unit(1, embedded="x"),
+        "route, list filters": lambda: client.get_order_units(
+            limit=100, offset=0, ts_updated_from_iso=since
+        ),
+        "route, json body": lambda: client.cancel_order_unit(
+            1, body={"reason": "product_broken"}
+        ),
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=REQUESTS, repeat=5))
+        print(f"{name:<24} {elapsed / REQUESTS * 1e6:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
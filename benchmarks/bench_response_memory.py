@@ -0,0 +1,82 @@
+"""Memory held by 100k responses, eager dict-based vs slotted lazy ApiResponse.
+
+Run with ``python benchmarks/bench_response_memory.py``.
+"""
+
+import gc
+import json
+import tracemalloc
+
+import _server  # noqa: F401
+import httpx
+
+from kaufland.base._core import parse_response
+
+RESPONSES = 100_000
+BODY = json.dumps(
+    {
+        "data": {
+            "id_unit": 123456789,
+            "id_product": 20574181,
+            "id_offer": "OFFER-123",
+            "status": "AVAILABLE",
+            "condition": "NEW",
+            "listing_price": 1999,
+            "minimum_price": 1499,
+            "amount": 7,
+            "note": "Größe XL",
+            "handling_time": 2,
+            "storefront": "de",
+            "date_lastchange_iso": "2024-05-02T08:30:00Z",
+        }
+    }
+).encode("utf-8")
+HEADERS = [
+    ("content-type", "application/json"),
+    ("date", "Thu, 02 May 2024 08:30:00 GMT"),
+    ("x-request-id", "5f2b1c9e-0c1e-4a4e-9a7f-0a2c9f5f1d3e"),
+]
+
+
+class EagerResponse:
+    # Shape of ApiResponse before it became slotted and lazy.
+    def __init__(self, payload=None, headers=None, status_code=None, raw=None):
+        self.payload = payload
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.raw = raw
+
+
+def eager(res):
+    return EagerResponse(
+        payload=res.json(), headers=dict(res.headers), status_code=200, raw=res.text
+    )
+
+
+def lazy(res):
+    return parse_response(res, method="GET")
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    held = [
+        build(httpx.Response(200, headers=HEADERS, content=BODY))
+        for _ in range(RESPONSES)
+    ]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main():
+    for name, build in (("eager dict", eager), ("slotted lazy", lazy)):
+        size = measure(build)
+        print(
+            f"{name:<13} {size / 2**20:7.1f} MiB  ({size / RESPONSES:6.0f} B/response)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Per-request cost of signing with and without a pre-keyed HMAC state.
+
+Run with ``python benchmarks/bench_signing.py``.
+"""
+
+import hashlib
+import hmac
+import timeit
+
+import _server  # noqa: F401
+
+from kaufland.base._core import sign_request, signing_key
+
+REQUESTS = 60000
+SECRET = "a7d0cb1da1ddbc86c96ee5fedd341b7d8ebfbb2f5c83cfe0909f4e57f05dd403"
+URL = "https://sellerapi.kaufland.com/v2/units/?storefront=de&limit=100&offset=0"
+
+
+def rekeyed(method, uri, body, timestamp, secret_key):
+    # Previous sign_request: keys a fresh HMAC for every request.
+    string = "\n".join([method, uri, body or "", str(timestamp)])
+    return hmac.new(
+        secret_key.encode("utf-8"), string.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def main():
+    key = signing_key(SECRET)
+    cases = {
+        "re-keyed per request": lambda: rekeyed("GET", URL, "", 1411055926, SECRET),
+        "pre-keyed copy": lambda: sign_request("GET", URL, "", 1411055926, key),
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=REQUESTS, repeat=5))
+        print(
+            f"{name:<22} {elapsed / REQUESTS * 1e6:6.2f} us/signature  "
+            f"{elapsed:.3f}s per {REQUESTS} requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,25 @@
-from .base import ApiResponse, BaseClient, Client, fill_query_params, kaufland_endpoint
+from .base import (
+    ApiResponse,
+    AsyncTransport,
+    BaseClient,
+    CircuitBreaker,
+    Client,
+    HttpxTransport,
+    MemoryCache,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    Route,
+    Session,
+    SqliteCache,
+    Transport,
+    WSGITransport,
+    fill_query_params,
+    kaufland_endpoint,
+)
 from .base.exceptions import (
     ApiException,
+    CircuitOpenException,
     KauflandException,
     MissingCredentialsException,
 )
@@ -9,9 +28,22 @@ __all__ = [
     "ApiResponse",
     "BaseClient",
     "Client",
+    "Session",
+    "Transport",
+    "AsyncTransport",
+    "HttpxTransport",
+    "WSGITransport",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "ResponseCache",
+    "MemoryCache",
+    "SqliteCache",
+    "Route",
     "fill_query_params",
     "kaufland_endpoint",
     "ApiException",
+    "CircuitOpenException",
     "KauflandException",
     "MissingCredentialsException",
 ]
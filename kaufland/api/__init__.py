@@ -1,27 +1,60 @@
-from .assortment_coverage import AssortmentCoverage
-from .attributes import Attributes
-from .buybox import Buybox
-from .carriers import Carriers
-from .categories import Categories
-from .import_files import ImportFiles
-from .info import Info
-from .order_invoices import OrderInvoices
-from .order_units import OrderUnits
-from .orders import Orders
-from .product_data import ProductData
-from .products import Products
-from .reports import Reports
-from .return_units import ReturnUnits
-from .returns import Returns
-from .shipments import Shipments
-from .shipping_groups import ShippingGroups
-from .shipping_labels import ShippingLabels
-from .status import Status
-from .subscriptions import Subscriptions
-from .tickets import Tickets
-from .units import Units
-from .variant_suggestions import VariantSuggestions
-from .warehouses import Warehouses
+"""Generated API clients, imported on first use."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .assortment_coverage import AssortmentCoverage
+    from .attributes import Attributes
+    from .buybox import Buybox
+    from .carriers import Carriers
+    from .categories import Categories
+    from .import_files import ImportFiles
+    from .info import Info
+    from .order_invoices import OrderInvoices
+    from .order_units import OrderUnits
+    from .orders import Orders
+    from .product_data import ProductData
+    from .products import Products
+    from .reports import Reports
+    from .return_units import ReturnUnits
+    from .returns import Returns
+    from .shipments import Shipments
+    from .shipping_groups import ShippingGroups
+    from .shipping_labels import ShippingLabels
+    from .status import Status
+    from .subscriptions import Subscriptions
+    from .tickets import Tickets
+    from .units import Units
+    from .variant_suggestions import VariantSuggestions
+    from .warehouses import Warehouses
+
+_MODULES = {
+    "AssortmentCoverage": "assortment_coverage",
+    "Attributes": "attributes",
+    "Buybox": "buybox",
+    "Carriers": "carriers",
+    "Categories": "categories",
+    "ImportFiles": "import_files",
+    "Info": "info",
+    "OrderInvoices": "order_invoices",
+    "OrderUnits": "order_units",
+    "Orders": "orders",
+    "ProductData": "product_data",
+    "Products": "products",
+    "Reports": "reports",
+    "ReturnUnits": "return_units",
+    "Returns": "returns",
+    "Shipments": "shipments",
+    "ShippingGroups": "shipping_groups",
+    "ShippingLabels": "shipping_labels",
+    "Status": "status",
+    "Subscriptions": "subscriptions",
+    "Tickets": "tickets",
+    "Units": "units",
+    "VariantSuggestions": "variant_suggestions",
+    "Warehouses": "warehouses",
+}
 
 __all__ = [
     "AssortmentCoverage",
@@ -49,3 +82,16 @@ __all__ = [
     "VariantSuggestions",
     "Warehouses",
 ]
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
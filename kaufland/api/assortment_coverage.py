@@ -1,15 +1,35 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_ASSORTMENT_INSIGHT = Route(
+    "/assortment-coverage/insights", "GET", add_storefront=False
+)
 
 
 class AssortmentCoverage(Client):
     """AssortmentCoverage Kaufland API Client."""
 
-    @kaufland_endpoint("/assortment-coverage/insights", method="GET")
+    @_GET_ASSORTMENT_INSIGHT
     def get_assortment_insight(self, **kwargs) -> ApiResponse:
         """
         Args:
         offset: int | optional (query) Offset applied to result set
         limit: int | optional (query) Desired size of result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_ASSORTMENT_INSIGHT.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
+        )
+
+    def paginate_assortment_insight(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_assortment_insight, 5000 per request."""
+        return paginate(self.get_assortment_insight, max_limit=5000, **kwargs)
+
+    def iter_assortment_insight(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_assortment_insight, 5000 per request."""
+        return iter_items(self.get_assortment_insight, max_limit=5000, **kwargs)
@@ -1,11 +1,25 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_ATTRIBUTE_LIST = Route("/attributes", "GET", add_storefront=True)
+_GET_ATTRIBUTE_BY_NAME = Route("/attributes/by-name/{}", "GET", add_storefront=True)
+_GET_ATTRIBUTE_LIST_BY_SEARCH = Route("/attributes/search", "GET", add_storefront=True)
+_GET_ATTRIBUTE = Route("/attributes/{}", "GET", add_storefront=True)
+_GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID = Route(
+    "/attributes/{}/shared-set", "GET", add_storefront=False
+)
+_GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID = Route(
+    "/attributes/{}/shared-set-values", "GET", add_storefront=False
+)
 
 
 class Attributes(Client):
     """Attributes Kaufland API Client."""
 
-    @kaufland_endpoint("/attributes", method="GET")
+    @_GET_ATTRIBUTE_LIST
     def get_attribute_list(self, **kwargs) -> ApiResponse:
         """
         Get an attribute list
@@ -18,9 +32,19 @@ class Attributes(Client):
         offset: int | optional (query) Offset applied to result set
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_ATTRIBUTE_LIST.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_attribute_list(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_attribute_list, 100 per request."""
+        return paginate(self.get_attribute_list, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/attributes/by-name/{}", method="GET")
+    def iter_attribute_list(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_attribute_list, 100 per request."""
+        return iter_items(self.get_attribute_list, max_limit=100, **kwargs)
+
+    @_GET_ATTRIBUTE_BY_NAME
     def get_attribute_by_name(self, name, **kwargs) -> ApiResponse:
         """
         Get attribute by name
@@ -33,12 +57,13 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), name),
+            _GET_ATTRIBUTE_BY_NAME.fill(name),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/attributes/search", method="GET")
+    @_GET_ATTRIBUTE_LIST_BY_SEARCH
     def get_attribute_list_by_search(self, **kwargs) -> ApiResponse:
         """
         Get attributes by search term
@@ -52,9 +77,22 @@ class Attributes(Client):
         offset: int | optional (query) Offset applied to result set
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_ATTRIBUTE_LIST_BY_SEARCH.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
+
+    def paginate_attribute_list_by_search(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_attribute_list_by_search, 100 per request."""
+        return paginate(self.get_attribute_list_by_search, max_limit=100, **kwargs)
+
+    def iter_attribute_list_by_search(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_attribute_list_by_search, 100 per request."""
+        return iter_items(self.get_attribute_list_by_search, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/attributes/{}", method="GET")
+    @_GET_ATTRIBUTE
     def get_attribute(self, id_attribute, **kwargs) -> ApiResponse:
         """
         Get attribute by ID
@@ -67,12 +105,13 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_ATTRIBUTE.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/attributes/{}/shared-set", method="GET")
+    @_GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID
     def get_shared_set_list_by_search_and_attribute_id(
         self, id_attribute, **kwargs
     ) -> ApiResponse:
@@ -89,12 +128,37 @@ class Attributes(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/attributes/{}/shared-set-values", method="GET")
+    def paginate_shared_set_list_by_search_and_attribute_id(
+        self, id_attribute, **kwargs
+    ) -> Iterator[ApiResponse]:
+        """Yield every page of get_shared_set_list_by_search_and_attribute_id, 100 per
+        request."""
+        return paginate(
+            self.get_shared_set_list_by_search_and_attribute_id,
+            id_attribute,
+            max_limit=100,
+            **kwargs,
+        )
+
+    def iter_shared_set_list_by_search_and_attribute_id(
+        self, id_attribute, **kwargs
+    ) -> Iterator[dict]:
+        """Yield every item of get_shared_set_list_by_search_and_attribute_id, 100 per
+        request."""
+        return iter_items(
+            self.get_shared_set_list_by_search_and_attribute_id,
+            id_attribute,
+            max_limit=100,
+            **kwargs,
+        )
+
+    @_GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID
     def get_shared_set_csv_file_by_attribute_id(
         self, id_attribute, **kwargs
     ) -> ApiResponse:
@@ -110,7 +174,8 @@ class Attributes(Client):
         locale: ProductDataLocale | required (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
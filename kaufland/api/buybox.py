@@ -1,11 +1,13 @@
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_GET_OFFERS_RANKINGS = Route("/buybox", "GET", add_storefront=True)
 
 
 class Buybox(Client):
     """Buybox Kaufland API Client."""
 
-    @kaufland_endpoint("/buybox", method="GET")
+    @_GET_OFFERS_RANKINGS
     def get_offers_rankings(self, **kwargs) -> ApiResponse:
         """
         Get a list of offers rankings for a product
@@ -19,4 +21,9 @@ class Buybox(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         condition: BuyboxCondition | required (query) The condition of the offers
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_OFFERS_RANKINGS.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
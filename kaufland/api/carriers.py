@@ -1,15 +1,19 @@
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_GET_CARRIERS = Route("/carriers", "GET", add_storefront=False)
 
 
 class Carriers(Client):
     """Carriers Kaufland API Client."""
 
-    @kaufland_endpoint("/carriers", method="GET")
+    @_GET_CARRIERS
     def get_carriers(self, **kwargs) -> ApiResponse:
         """
         Get a list of available carriers
 
         Get a list of available carriers.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_CARRIERS.fill(), method="GET", params=kwargs, add_storefront=False
+        )
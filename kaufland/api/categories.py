@@ -1,11 +1,19 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_CATEGORIES_LIST = Route("/categories", "GET", add_storefront=True)
+_DECIDE_CATEGORY = Route("/categories/decide", "POST", add_storefront=True)
+_GET_CATEGORY_TREE = Route("/categories/tree", "GET", add_storefront=True)
+_GET_CATEGORY = Route("/categories/{}", "GET", add_storefront=True)
 
 
 class Categories(Client):
     """Categories Kaufland API Client."""
 
-    @kaufland_endpoint("/categories", method="GET")
+    @_GET_CATEGORIES_LIST
     def get_categories_list(self, **kwargs) -> ApiResponse:
         """
         Get category list by search term
@@ -20,9 +28,22 @@ class Categories(Client):
         offset: int | optional (query) Offset applied to result set
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_CATEGORIES_LIST.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
 
-    @kaufland_endpoint("/categories/decide", method="POST")
+    def paginate_categories_list(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_categories_list, 100 per request."""
+        return paginate(self.get_categories_list, max_limit=100, **kwargs)
+
+    def iter_categories_list(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_categories_list, 100 per request."""
+        return iter_items(self.get_categories_list, max_limit=100, **kwargs)
+
+    @_DECIDE_CATEGORY
     def decide_category(self, **kwargs) -> ApiResponse:
         """
         Guess categories
@@ -36,10 +57,14 @@ class Categories(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _DECIDE_CATEGORY.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/categories/tree", method="GET")
+    @_GET_CATEGORY_TREE
     def get_category_tree(self, **kwargs) -> ApiResponse:
         """
         Get complete category tree
@@ -50,9 +75,11 @@ class Categories(Client):
         storefront: Storefront | required (query) Specifies the store by country
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_CATEGORY_TREE.fill(), method="GET", params=kwargs, add_storefront=True
+        )
 
-    @kaufland_endpoint("/categories/{}", method="GET")
+    @_GET_CATEGORY
     def get_category(self, id_category, **kwargs) -> ApiResponse:
         """
         Get category by ID
@@ -66,7 +93,8 @@ class Categories(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_category),
+            _GET_CATEGORY.fill(id_category),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
@@ -1,11 +1,42 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_INVENTORY_COMMAND_IMPORT_FILES = Route(
+    "/import-files/inventory-command", "GET", add_storefront=True
+)
+_CREATE_INVENTORY_COMMAND_IMPORT_FILE = Route(
+    "/import-files/inventory-command", "POST", add_storefront=True
+)
+_GET_INVENTORY_COMMAND_IMPORT_FILE = Route(
+    "/import-files/inventory-command/{}", "GET", add_storefront=True
+)
+_GET_INVENTORY_FEED_IMPORT_FILES = Route(
+    "/import-files/inventory-feed", "GET", add_storefront=True
+)
+_CREATE_INVENTORY_FEED_IMPORT_FILE = Route(
+    "/import-files/inventory-feed", "POST", add_storefront=True
+)
+_GET_INVENTORY_FEED_IMPORT_FILE = Route(
+    "/import-files/inventory-feed/{}", "GET", add_storefront=True
+)
+_GET_ORDER_COMMAND_IMPORT_FILES = Route(
+    "/import-files/order-command", "GET", add_storefront=False
+)
+_CREATE_ORDER_COMMAND_IMPORT_FILE = Route(
+    "/import-files/order-command", "POST", add_storefront=False
+)
+_GET_ORDER_COMMAND_IMPORT_FILE = Route(
+    "/import-files/order-command/{}", "GET", add_storefront=False
+)
 
 
 class ImportFiles(Client):
     """ImportFiles Kaufland API Client."""
 
-    @kaufland_endpoint("/import-files/inventory-command", method="GET")
+    @_GET_INVENTORY_COMMAND_IMPORT_FILES
     def get_inventory_command_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your inventory command import files
@@ -21,9 +52,26 @@ class ImportFiles(Client):
         limit: int | optional (query) Desired size of result set
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_INVENTORY_COMMAND_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
+
+    def paginate_inventory_command_import_files(
+        self, **kwargs
+    ) -> Iterator[ApiResponse]:
+        """Yield every page of get_inventory_command_import_files, 30 per request."""
+        return paginate(self.get_inventory_command_import_files, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/import-files/inventory-command", method="POST")
+    def iter_inventory_command_import_files(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_inventory_command_import_files, 30 per request."""
+        return iter_items(
+            self.get_inventory_command_import_files, max_limit=30, **kwargs
+        )
+
+    @_CREATE_INVENTORY_COMMAND_IMPORT_FILE
     def create_inventory_command_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an INVENTORY_COMMAND file URL
@@ -36,10 +84,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_INVENTORY_COMMAND_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-command/{}", method="GET")
+    @_GET_INVENTORY_COMMAND_IMPORT_FILE
     def get_inventory_command_import_file(
         self, id_import_file, **kwargs
     ) -> ApiResponse:
@@ -53,12 +105,13 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_INVENTORY_COMMAND_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-feed", method="GET")
+    @_GET_INVENTORY_FEED_IMPORT_FILES
     def get_inventory_feed_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your inventory feed import files
@@ -74,9 +127,22 @@ class ImportFiles(Client):
         limit: int | optional (query) Desired size of result set
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_INVENTORY_FEED_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
+
+    def paginate_inventory_feed_import_files(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_inventory_feed_import_files, 30 per request."""
+        return paginate(self.get_inventory_feed_import_files, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/import-files/inventory-feed", method="POST")
+    def iter_inventory_feed_import_files(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_inventory_feed_import_files, 30 per request."""
+        return iter_items(self.get_inventory_feed_import_files, max_limit=30, **kwargs)
+
+    @_CREATE_INVENTORY_FEED_IMPORT_FILE
     def create_inventory_feed_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an INVENTORY_FEED file URL
@@ -89,10 +155,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_INVENTORY_FEED_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-feed/{}", method="GET")
+    @_GET_INVENTORY_FEED_IMPORT_FILE
     def get_inventory_feed_import_file(self, id_import_file, **kwargs) -> ApiResponse:
         """
         Get an inventory feed import file by ID
@@ -104,12 +174,13 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_INVENTORY_FEED_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/order-command", method="GET")
+    @_GET_ORDER_COMMAND_IMPORT_FILES
     def get_order_command_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your order command import files
@@ -124,9 +195,22 @@ class ImportFiles(Client):
         limit: int | optional (query) Desired size of result set
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_ORDER_COMMAND_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
+        )
+
+    def paginate_order_command_import_files(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_order_command_import_files, 30 per request."""
+        return paginate(self.get_order_command_import_files, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/import-files/order-command", method="POST")
+    def iter_order_command_import_files(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_order_command_import_files, 30 per request."""
+        return iter_items(self.get_order_command_import_files, max_limit=30, **kwargs)
+
+    @_CREATE_ORDER_COMMAND_IMPORT_FILE
     def create_order_command_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an ORDER_COMMAND file URL
@@ -138,10 +222,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_ORDER_COMMAND_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/import-files/order-command/{}", method="GET")
+    @_GET_ORDER_COMMAND_IMPORT_FILE
     def get_order_command_import_file(self, id_import_file, **kwargs) -> ApiResponse:
         """
         Get an order command import file by ID
@@ -152,7 +240,8 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_ORDER_COMMAND_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
@@ -1,20 +1,26 @@
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_GET_ALL_LOCALES = Route("/info/locale", "GET", add_storefront=False)
+_GET_ALL_STOREFRONTS = Route("/info/storefront", "GET", add_storefront=False)
+_GET_VAT_INDICATORS = Route("/info/vat-indicators", "GET", add_storefront=True)
 
 
 class Info(Client):
     """Info Kaufland API Client."""
 
-    @kaufland_endpoint("/info/locale", method="GET")
+    @_GET_ALL_LOCALES
     def get_all_locales(self, **kwargs) -> ApiResponse:
         """
         Get values for parameter 'locale'
 
         Get all available values for the parameter 'locale'. This parameter specifies the language of e.g. product data.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_ALL_LOCALES.fill(), method="GET", params=kwargs, add_storefront=False
+        )
 
-    @kaufland_endpoint("/info/storefront", method="GET")
+    @_GET_ALL_STOREFRONTS
     def get_all_storefronts(self, **kwargs) -> ApiResponse:
         """
         Get values for parameter 'storefront'
@@ -22,9 +28,14 @@ class Info(Client):
         Get current seller available values for the parameter 'storefront'. This parameter specifies the country of the store.
         Returns a list of storefronts the seller has created in the sellerportal regardless of storefront status.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
-
-    @kaufland_endpoint("/info/vat-indicators", method="GET")
+        return self._request(
+            _GET_ALL_STOREFRONTS.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
+        )
+
+    @_GET_VAT_INDICATORS
     def get_vat_indicators(self, **kwargs) -> ApiResponse:
         """
         Get a list of Vat Indicators Mappings per Storefront
@@ -35,4 +46,6 @@ class Info(Client):
         Args:
         storefront: Storefront | optional (query) Parameter to select the affected storefront
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_VAT_INDICATORS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
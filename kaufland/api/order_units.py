@@ -1,11 +1,21 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_ORDER_UNITS = Route("/order-units", "GET", add_storefront=True)
+_GET_ORDER_UNIT = Route("/order-units/{}", "GET", add_storefront=False)
+_CANCEL_ORDER_UNIT = Route("/order-units/{}/cancel", "PATCH", add_storefront=False)
+_FULFIL_ORDER_UNIT = Route("/order-units/{}/fulfil", "PATCH", add_storefront=False)
+_REFUND_ORDER_UNIT = Route("/order-units/{}/refund", "PATCH", add_storefront=False)
+_SEND_ORDER_UNIT = Route("/order-units/{}/send", "PATCH", add_storefront=False)
 
 
 class OrderUnits(Client):
     """OrderUnits Kaufland API Client."""
 
-    @kaufland_endpoint("/order-units", method="GET")
+    @_GET_ORDER_UNITS
     def get_order_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of order units
@@ -23,9 +33,19 @@ class OrderUnits(Client):
         limit: int | optional (query) Desired size of result set<br>max: 100, default: 30
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_ORDER_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_order_units(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_order_units, 100 per request."""
+        return paginate(self.get_order_units, max_limit=100, **kwargs)
+
+    def iter_order_units(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_order_units, 100 per request."""
+        return iter_items(self.get_order_units, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/order-units/{}", method="GET")
+    @_GET_ORDER_UNIT
     def get_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Get an order unit by ID
@@ -37,12 +57,13 @@ class OrderUnits(Client):
         embedded: list[OrderUnitEmbeddable] | optional (query) Additional data to be returned
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _GET_ORDER_UNIT.fill(id_order_unit),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/cancel", method="PATCH")
+    @_CANCEL_ORDER_UNIT
     def cancel_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Cancel an order unit
@@ -56,13 +77,14 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _CANCEL_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/fulfil", method="PATCH")
+    @_FULFIL_ORDER_UNIT
     def fulfil_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Mark an order unit to be in fulfillment
@@ -73,12 +95,13 @@ class OrderUnits(Client):
         id_order_unit: int | required (path) Order unit ID, unique across all order units
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _FULFIL_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/refund", method="PATCH")
+    @_REFUND_ORDER_UNIT
     def refund_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Send a refund to a customer
@@ -93,13 +116,14 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _REFUND_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/send", method="PATCH")
+    @_SEND_ORDER_UNIT
     def send_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Mark an order unit as sent
@@ -113,7 +137,8 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _SEND_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
@@ -1,11 +1,17 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_ORDERS = Route("/orders", "GET", add_storefront=True)
+_GET_ORDER = Route("/orders/{}", "GET", add_storefront=False)
 
 
 class Orders(Client):
     """Orders Kaufland API Client."""
 
-    @kaufland_endpoint("/orders", method="GET")
+    @_GET_ORDERS
     def get_orders(self, **kwargs) -> ApiResponse:
         """
         Get a list of orders
@@ -20,9 +26,19 @@ class Orders(Client):
         limit: int | optional (query) Desired size of result set<br>max: 100, default: 30
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_ORDERS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_orders(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_orders, 100 per request."""
+        return paginate(self.get_orders, max_limit=100, **kwargs)
+
+    def iter_orders(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_orders, 100 per request."""
+        return iter_items(self.get_orders, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/orders/{}", method="GET")
+    @_GET_ORDER
     def get_order(self, id_order, **kwargs) -> ApiResponse:
         """
         Get an order by ID
@@ -34,7 +50,5 @@ class Orders(Client):
         embedded: list[OrderEmbeddable] | optional (query) Add 'order_invoices' to get order related invoices in the response.
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_order),
-            params=kwargs,
-            add_storefront=False,
+            _GET_ORDER.fill(id_order), method="GET", params=kwargs, add_storefront=False
         )
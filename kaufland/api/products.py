@@ -1,11 +1,18 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_PRODUCT_BY_EAN = Route("/products/ean/{}", "GET", add_storefront=True)
+_GET_PRODUCT_LIST = Route("/products/search", "GET", add_storefront=True)
+_GET_PRODUCT = Route("/products/{}", "GET", add_storefront=True)
 
 
 class Products(Client):
     """Products Kaufland API Client."""
 
-    @kaufland_endpoint("/products/ean/{}", method="GET")
+    @_GET_PRODUCT_BY_EAN
     def get_product_by_ean(self, ean, **kwargs) -> ApiResponse:
         """
         Get a product by EAN
@@ -18,12 +25,13 @@ class Products(Client):
         embedded: list[ProductEmbeddable] | optional (query) Include related entities in the result (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), ean),
+            _GET_PRODUCT_BY_EAN.fill(ean),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/products/search", method="GET")
+    @_GET_PRODUCT_LIST
     def get_product_list(self, **kwargs) -> ApiResponse:
         """
         Get a list of products by search term
@@ -37,9 +45,19 @@ class Products(Client):
         offset: int | optional (query) Offset applied to result set
         embedded: list[ProductEmbeddable] | optional (query) Include other entities in the results of the result list (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_PRODUCT_LIST.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_product_list(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_product_list, 100 per request."""
+        return paginate(self.get_product_list, max_limit=100, **kwargs)
+
+    def iter_product_list(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_product_list, 100 per request."""
+        return iter_items(self.get_product_list, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/products/{}", method="GET")
+    @_GET_PRODUCT
     def get_product(self, id_product, **kwargs) -> ApiResponse:
         """
         Get product by ID
@@ -52,7 +70,8 @@ class Products(Client):
         embedded: list[ProductEmbeddable] | optional (query) Include related entities in the result (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_product),
+            _GET_PRODUCT.fill(id_product),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
@@ -1,11 +1,21 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_RETURN_UNITS = Route("/return-units", "GET", add_storefront=True)
+_GET_RETURN_UNIT = Route("/return-units/{}", "GET", add_storefront=False)
+_ACCEPT_RETURN_UNIT = Route("/return-units/{}/accept", "PATCH", add_storefront=False)
+_CLARIFY_RETURN_UNIT = Route("/return-units/{}/clarify", "PATCH", add_storefront=False)
+_REJECT_RETURN_UNIT = Route("/return-units/{}/reject", "PATCH", add_storefront=False)
+_REPAIR_RETURN_UNIT = Route("/return-units/{}/repair", "PATCH", add_storefront=False)
 
 
 class ReturnUnits(Client):
     """ReturnUnits Kaufland API Client."""
 
-    @kaufland_endpoint("/return-units", method="GET")
+    @_GET_RETURN_UNITS
     def get_return_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of return units
@@ -21,9 +31,19 @@ class ReturnUnits(Client):
         limit: Integer | optional (query) Desired size of result set<br>max: 100, default: 30
         offset: Integer | optional (query) Offset applied to result set<br>default: 0
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_RETURN_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_return_units(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_return_units, 100 per request."""
+        return paginate(self.get_return_units, max_limit=100, **kwargs)
+
+    def iter_return_units(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_return_units, 100 per request."""
+        return iter_items(self.get_return_units, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/return-units/{}", method="GET")
+    @_GET_RETURN_UNIT
     def get_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Get a return unit by ID
@@ -35,12 +55,13 @@ class ReturnUnits(Client):
         embedded: list[ReturnUnitEmbeddable] | optional (query) Additional data to be returned
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _GET_RETURN_UNIT.fill(id_return_unit),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/accept", method="PATCH")
+    @_ACCEPT_RETURN_UNIT
     def accept_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Accept a return unit
@@ -51,12 +72,13 @@ class ReturnUnits(Client):
         id_return_unit: int | required (path) Return unit ID, unique across all return units
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _ACCEPT_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/clarify", method="PATCH")
+    @_CLARIFY_RETURN_UNIT
     def clarify_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Clarify a return unit
@@ -70,13 +92,14 @@ class ReturnUnits(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _CLARIFY_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/reject", method="PATCH")
+    @_REJECT_RETURN_UNIT
     def reject_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Reject a return unit
@@ -89,13 +112,14 @@ class ReturnUnits(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _REJECT_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/repair", method="PATCH")
+    @_REPAIR_RETURN_UNIT
     def repair_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Repair a return unit
@@ -106,7 +130,8 @@ class ReturnUnits(Client):
         id_return_unit: int | required (path) Return unit ID, unique across all return units
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _REPAIR_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
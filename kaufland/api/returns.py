@@ -1,11 +1,19 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_RETURNS = Route("/returns", "GET", add_storefront=True)
+_INITIATE_RETURN = Route("/returns", "POST", add_storefront=False)
+_GET_RETURN = Route("/returns/{}", "GET", add_storefront=False)
+_UPDATE_RETURN = Route("/returns/{}", "PUT", add_storefront=False)
 
 
 class Returns(Client):
     """Returns Kaufland API Client."""
 
-    @kaufland_endpoint("/returns", method="GET")
+    @_GET_RETURNS
     def get_returns(self, **kwargs) -> ApiResponse:
         """
         Get a list of returns
@@ -23,9 +31,19 @@ class Returns(Client):
         limit: int | optional (query) Desired size of result set<br>max: 100, default: 30
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_RETURNS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
+
+    def paginate_returns(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_returns, 100 per request."""
+        return paginate(self.get_returns, max_limit=100, **kwargs)
 
-    @kaufland_endpoint("/returns", method="POST")
+    def iter_returns(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_returns, 100 per request."""
+        return iter_items(self.get_returns, max_limit=100, **kwargs)
+
+    @_INITIATE_RETURN
     def initiate_return(self, **kwargs) -> ApiResponse:
         """
         Initialize a return
@@ -40,10 +58,14 @@ class Returns(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _INITIATE_RETURN.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/returns/{}", method="GET")
+    @_GET_RETURN
     def get_return(self, id_return, **kwargs) -> ApiResponse:
         """
         Get a return by ID
@@ -55,12 +77,13 @@ class Returns(Client):
         embedded: list[ReturnEmbeddable] | optional (query) Additional data to be returned
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return),
+            _GET_RETURN.fill(id_return),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/returns/{}", method="PUT")
+    @_UPDATE_RETURN
     def update_return(self, id_return, **kwargs) -> ApiResponse:
         """
         Add one or more order units to an already existing return
@@ -73,7 +96,8 @@ class Returns(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_return),
+            _UPDATE_RETURN.fill(id_return),
+            method="PUT",
             data=body,
             params=kwargs,
             add_storefront=False,
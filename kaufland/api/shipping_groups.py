@@ -1,11 +1,17 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_SHIPPING_GROUPS = Route("/shipping-groups", "GET", add_storefront=True)
+_GET_SHIPPING_GROUP = Route("/shipping-groups/{}", "GET", add_storefront=True)
 
 
 class ShippingGroups(Client):
     """ShippingGroups Kaufland API Client."""
 
-    @kaufland_endpoint("/shipping-groups", method="GET")
+    @_GET_SHIPPING_GROUPS
     def get_shipping_groups(self, **kwargs) -> ApiResponse:
         """
         Get the list of your predefined shipping groups
@@ -17,9 +23,22 @@ class ShippingGroups(Client):
         offset: int | optional (query) Offset applied to result set
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_SHIPPING_GROUPS.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
+        )
+
+    def paginate_shipping_groups(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_shipping_groups, 30 per request."""
+        return paginate(self.get_shipping_groups, max_limit=30, **kwargs)
+
+    def iter_shipping_groups(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_shipping_groups, 30 per request."""
+        return iter_items(self.get_shipping_groups, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/shipping-groups/{}", method="GET")
+    @_GET_SHIPPING_GROUP
     def get_shipping_group(self, id_shipping_group, **kwargs) -> ApiResponse:
         """
         Get a shipping group by ID
@@ -31,7 +50,8 @@ class ShippingGroups(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_shipping_group),
+            _GET_SHIPPING_GROUP.fill(id_shipping_group),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
@@ -1,11 +1,13 @@
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_CREATE_SHIPPING_LABEL = Route("/shipping-labels", "POST", add_storefront=False)
 
 
 class ShippingLabels(Client):
     """ShippingLabels Kaufland API Client."""
 
-    @kaufland_endpoint("/shipping-labels", method="POST")
+    @_CREATE_SHIPPING_LABEL
     def create_shipping_label(self, **kwargs) -> ApiResponse:
         """
         Request and create a shipping label.
@@ -36,5 +38,9 @@ class ShippingLabels(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_SHIPPING_LABEL.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
@@ -1,15 +1,19 @@
 from kaufland import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_PING = Route("/status/ping", "GET", add_storefront=False)
 
 
 class Status(Client):
     """Status Kaufland API Client."""
 
-    @kaufland_endpoint("/status/ping", method="GET")
+    @_PING
     def ping(self, **kwargs) -> ApiResponse:
         """
         Ping the Marketplace Seller API by Kaufland
 
         A simple method you can call that will return a constant value as long as everything is good.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _PING.fill(), method="GET", params=kwargs, add_storefront=False
+        )
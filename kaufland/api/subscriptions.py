@@ -1,11 +1,20 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_SUBSCRIPTIONS = Route("/subscriptions", "GET", add_storefront=True)
+_ADD_SUBSCRIPTION = Route("/subscriptions", "POST", add_storefront=True)
+_DELETE_SUBSCRIPTION = Route("/subscriptions/{}", "DELETE", add_storefront=False)
+_GET_SUBSCRIPTION = Route("/subscriptions/{}", "GET", add_storefront=False)
+_UPDATE_SUBSCRIPTION = Route("/subscriptions/{}", "PATCH", add_storefront=False)
 
 
 class Subscriptions(Client):
     """Subscriptions Kaufland API Client."""
 
-    @kaufland_endpoint("/subscriptions", method="GET")
+    @_GET_SUBSCRIPTIONS
     def get_subscriptions(self, **kwargs) -> ApiResponse:
         """
         Get a list of your push notification subscriptions
@@ -18,9 +27,19 @@ class Subscriptions(Client):
         limit: int | optional (query) Desired size of result set
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_SUBSCRIPTIONS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
 
-    @kaufland_endpoint("/subscriptions", method="POST")
+    def paginate_subscriptions(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_subscriptions, 30 per request."""
+        return paginate(self.get_subscriptions, max_limit=30, **kwargs)
+
+    def iter_subscriptions(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_subscriptions, 30 per request."""
+        return iter_items(self.get_subscriptions, max_limit=30, **kwargs)
+
+    @_ADD_SUBSCRIPTION
     def add_subscription(self, **kwargs) -> ApiResponse:
         """
         Subscribe for event
@@ -33,10 +52,14 @@ class Subscriptions(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _ADD_SUBSCRIPTION.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="DELETE")
+    @_DELETE_SUBSCRIPTION
     def delete_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Unsubscribe from event
@@ -47,12 +70,13 @@ class Subscriptions(Client):
         id_subscription: LongInteger | required (path)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _DELETE_SUBSCRIPTION.fill(id_subscription),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="GET")
+    @_GET_SUBSCRIPTION
     def get_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Get a push notification subscription by ID
@@ -63,12 +87,13 @@ class Subscriptions(Client):
         id_subscription: LongInteger | required (path)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _GET_SUBSCRIPTION.fill(id_subscription),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="PATCH")
+    @_UPDATE_SUBSCRIPTION
     def update_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Update subscription
@@ -81,7 +106,8 @@ class Subscriptions(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _UPDATE_SUBSCRIPTION.fill(id_subscription),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
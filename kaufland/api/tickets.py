@@ -1,11 +1,21 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_TICKETS = Route("/tickets", "GET", add_storefront=True)
+_OPEN_TICKET = Route("/tickets", "POST", add_storefront=False)
+_GET_TICKET_MESSAGES = Route("/tickets/messages", "GET", add_storefront=False)
+_GET_TICKET = Route("/tickets/{}", "GET", add_storefront=False)
+_CLOSE_TICKET = Route("/tickets/{}/close", "PATCH", add_storefront=False)
+_CREATE_TICKET_MESSAGE = Route("/tickets/{}/messages", "POST", add_storefront=False)
 
 
 class Tickets(Client):
     """Tickets Kaufland API Client."""
 
-    @kaufland_endpoint("/tickets", method="GET")
+    @_GET_TICKETS
     def get_tickets(self, **kwargs) -> ApiResponse:
         """
         Get a list of tickets
@@ -25,9 +35,19 @@ class Tickets(Client):
         storefront: list[Storefront] | optional (query) Identifier for the storefront the tickets should belong to
         fulfillment_type: list[FulfillmentType] | optional (query) Filter tickets by their fulfillment type. <br/> The value `fulfilled_by_kaufland` is **DEPRECATED**.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_TICKETS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
 
-    @kaufland_endpoint("/tickets", method="POST")
+    def paginate_tickets(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_tickets, 30 per request."""
+        return paginate(self.get_tickets, max_limit=30, **kwargs)
+
+    def iter_tickets(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_tickets, 30 per request."""
+        return iter_items(self.get_tickets, max_limit=30, **kwargs)
+
+    @_OPEN_TICKET
     def open_ticket(self, **kwargs) -> ApiResponse:
         """
         Open a ticket
@@ -39,10 +59,14 @@ class Tickets(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _OPEN_TICKET.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/tickets/messages", method="GET")
+    @_GET_TICKET_MESSAGES
     def get_ticket_messages(self, **kwargs) -> ApiResponse:
         """
         Get a list of ticket messages
@@ -58,9 +82,22 @@ class Tickets(Client):
         ts_created_from_iso: str | optional (query) Filter ticket messages by their creation timestamp in iso 8601
         fulfillment_type: list[FulfillmentType] | optional (query) Filter tickets by their fulfillment type. <br/> The value `fulfilled_by_kaufland` is **DEPRECATED**.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_TICKET_MESSAGES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
+        )
+
+    def paginate_ticket_messages(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_ticket_messages, 30 per request."""
+        return paginate(self.get_ticket_messages, max_limit=30, **kwargs)
+
+    def iter_ticket_messages(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_ticket_messages, 30 per request."""
+        return iter_items(self.get_ticket_messages, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/tickets/{}", method="GET")
+    @_GET_TICKET
     def get_ticket(self, id_ticket, **kwargs) -> ApiResponse:
         """
         Get a ticket by ID
@@ -72,12 +109,13 @@ class Tickets(Client):
         embedded: list[TicketEmbeddable] | optional (query) A string of comma-separated values. Possible values: buyer, product, messages, order_units, files
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_ticket),
+            _GET_TICKET.fill(id_ticket),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/tickets/{}/close", method="PATCH")
+    @_CLOSE_TICKET
     def close_ticket(self, id_ticket, **kwargs) -> ApiResponse:
         """
         Close a ticket by ID
@@ -88,12 +126,13 @@ class Tickets(Client):
         id_ticket: TicketID | required (path) The unique ID of a ticket
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_ticket),
+            _CLOSE_TICKET.fill(id_ticket),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/tickets/{}/messages", method="POST")
+    @_CREATE_TICKET_MESSAGE
     def create_ticket_message(self, id_ticket, **kwargs) -> ApiResponse:
         """
         Create a new message for the ticket
@@ -106,7 +145,8 @@ class Tickets(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_ticket),
+            _CREATE_TICKET_MESSAGE.fill(id_ticket),
+            method="POST",
             data=body,
             params=kwargs,
             add_storefront=False,
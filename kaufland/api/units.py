@@ -1,11 +1,21 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_UNITS = Route("/units", "GET", add_storefront=True)
+_CREATE_UNIT = Route("/units", "POST", add_storefront=True)
+_BULK_UPDATE_UNITS = Route("/units/bulk", "POST", add_storefront=True)
+_DELETE_UNIT = Route("/units/{}", "DELETE", add_storefront=True)
+_GET_UNIT = Route("/units/{}", "GET", add_storefront=True)
+_PATCH_UNIT = Route("/units/{}", "PATCH", add_storefront=True)
 
 
 class Units(Client):
     """Units Kaufland API Client."""
 
-    @kaufland_endpoint("/units", method="GET")
+    @_GET_UNITS
     def get_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of your units
@@ -23,9 +33,19 @@ class Units(Client):
         embedded: list[UnitAndProductEmbeddedEnum] | optional (query)
         fulfillment_type: list[FulfillmentType] | optional (query) Get only units which are fulfilled by the given type. <br/> The value `fulfilled_by_kaufland` is **DEPRECATED**.
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=True)
+        return self._request(
+            _GET_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
+        )
 
-    @kaufland_endpoint("/units", method="POST")
+    def paginate_units(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_units, 100 per request."""
+        return paginate(self.get_units, max_limit=100, **kwargs)
+
+    def iter_units(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_units, 100 per request."""
+        return iter_items(self.get_units, max_limit=100, **kwargs)
+
+    @_CREATE_UNIT
     def create_unit(self, **kwargs) -> ApiResponse:
         """
         Add a unit
@@ -41,10 +61,14 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_UNIT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/bulk", method="POST")
+    @_BULK_UPDATE_UNITS
     def bulk_update_units(self, **kwargs) -> ApiResponse:
         """
         Update some fields of a given set of units
@@ -65,10 +89,14 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _BULK_UPDATE_UNITS.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/{}", method="DELETE")
+    @_DELETE_UNIT
     def delete_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Delete a unit
@@ -80,12 +108,13 @@ class Units(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
+            _DELETE_UNIT.fill(id_unit),
+            method="DELETE",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/{}", method="GET")
+    @_GET_UNIT
     def get_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Get a unit by ID
@@ -98,12 +127,10 @@ class Units(Client):
         embedded: list[UnitAndProductEmbeddedEnum] | optional (query)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
-            params=kwargs,
-            add_storefront=True,
+            _GET_UNIT.fill(id_unit), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/units/{}", method="PATCH")
+    @_PATCH_UNIT
     def patch_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Update some of the fields of a unit
@@ -119,7 +146,8 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
+            _PATCH_UNIT.fill(id_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=True,
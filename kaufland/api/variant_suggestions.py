@@ -1,11 +1,24 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_VARIANT_SUGGESTIONS_FEED_LIST = Route(
+    "/variant-suggestions/feed", "GET", add_storefront=False
+)
+_UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL = Route(
+    "/variant-suggestions/feed/upload-by-url", "POST", add_storefront=False
+)
+_GET_VARIANT_SUGGESTIONS_FEED = Route(
+    "/variant-suggestions/feed/{}", "GET", add_storefront=False
+)
 
 
 class VariantSuggestions(Client):
     """VariantSuggestions Kaufland API Client."""
 
-    @kaufland_endpoint("/variant-suggestions/feed", method="GET")
+    @_GET_VARIANT_SUGGESTIONS_FEED_LIST
     def get_variant_suggestions_feed_list(self, **kwargs) -> ApiResponse:
         """
         Get import files
@@ -20,9 +33,24 @@ class VariantSuggestions(Client):
         limit: int | optional (query) Desired size of result set. Max: 100
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_VARIANT_SUGGESTIONS_FEED_LIST.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
+        )
 
-    @kaufland_endpoint("/variant-suggestions/feed/upload-by-url", method="POST")
+    def paginate_variant_suggestions_feed_list(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_variant_suggestions_feed_list, 100 per request."""
+        return paginate(self.get_variant_suggestions_feed_list, max_limit=100, **kwargs)
+
+    def iter_variant_suggestions_feed_list(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_variant_suggestions_feed_list, 100 per request."""
+        return iter_items(
+            self.get_variant_suggestions_feed_list, max_limit=100, **kwargs
+        )
+
+    @_UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL
     def upload_variant_suggestion_file_by_url(self, **kwargs) -> ApiResponse:
         """
         Add an import file URL
@@ -36,10 +64,14 @@ class VariantSuggestions(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/variant-suggestions/feed/{}", method="GET")
+    @_GET_VARIANT_SUGGESTIONS_FEED
     def get_variant_suggestions_feed(self, id_import_file, **kwargs) -> ApiResponse:
         """
         Get import file by ID
@@ -50,7 +82,8 @@ class VariantSuggestions(Client):
         id_import_file: int | required (path)
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_VARIANT_SUGGESTIONS_FEED.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
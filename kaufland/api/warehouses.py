@@ -1,11 +1,20 @@
+from collections.abc import Iterator
+
 from kaufland import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+from kaufland.base.pagination import iter_items, paginate
+
+_GET_WAREHOUSES = Route("/warehouses", "GET", add_storefront=False)
+_CREATE_WAREHOUSE = Route("/warehouses", "POST", add_storefront=False)
+_DELETE_WAREHOUSE = Route("/warehouses/{}", "DELETE", add_storefront=False)
+_GET_WAREHOUSE = Route("/warehouses/{}", "GET", add_storefront=False)
+_UPDATE_WAREHOUSE = Route("/warehouses/{}", "PUT", add_storefront=False)
 
 
 class Warehouses(Client):
     """Warehouses Kaufland API Client."""
 
-    @kaufland_endpoint("/warehouses", method="GET")
+    @_GET_WAREHOUSES
     def get_warehouses(self, **kwargs) -> ApiResponse:
         """
         Get a list of your Warehouses
@@ -16,9 +25,19 @@ class Warehouses(Client):
         limit: int | optional (query) Desired size of result set
         offset: int | optional (query) Offset applied to result set
         """
-        return self._request(kwargs.pop("path"), params=kwargs, add_storefront=False)
+        return self._request(
+            _GET_WAREHOUSES.fill(), method="GET", params=kwargs, add_storefront=False
+        )
+
+    def paginate_warehouses(self, **kwargs) -> Iterator[ApiResponse]:
+        """Yield every page of get_warehouses, 30 per request."""
+        return paginate(self.get_warehouses, max_limit=30, **kwargs)
 
-    @kaufland_endpoint("/warehouses", method="POST")
+    def iter_warehouses(self, **kwargs) -> Iterator[dict]:
+        """Yield every item of get_warehouses, 30 per request."""
+        return iter_items(self.get_warehouses, max_limit=30, **kwargs)
+
+    @_CREATE_WAREHOUSE
     def create_warehouse(self, **kwargs) -> ApiResponse:
         """
         Create a new Warehouse
@@ -30,10 +49,14 @@ class Warehouses(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_WAREHOUSE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="DELETE")
+    @_DELETE_WAREHOUSE
     def delete_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Delete a warehouse
@@ -44,12 +67,13 @@ class Warehouses(Client):
         id_warehouse: int | required (path) Internal ID of Warehouse, unique across all Warehouses
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _DELETE_WAREHOUSE.fill(id_warehouse),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="GET")
+    @_GET_WAREHOUSE
     def get_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Get a warehouse by its ID
@@ -60,12 +84,13 @@ class Warehouses(Client):
         id_warehouse: int | required (path) Internal ID of Warehouse, unique across all Warehouses
         """
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _GET_WAREHOUSE.fill(id_warehouse),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="PUT")
+    @_UPDATE_WAREHOUSE
     def update_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Update a Warehouse
@@ -78,7 +103,8 @@ class Warehouses(Client):
         """
         body = kwargs.pop("body", None)
         return self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _UPDATE_WAREHOUSE.fill(id_warehouse),
+            method="PUT",
             data=body,
             params=kwargs,
             add_storefront=False,
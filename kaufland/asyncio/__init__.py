@@ -1,3 +1,5 @@
+from ._transport_httpx import ASGITransport, HttpxAsyncTransport
 from .client import Client
+from .session import Session
 
-__all__ = ["Client"]
+__all__ = ["Client", "Session", "HttpxAsyncTransport", "ASGITransport"]
@@ -1,22 +1,62 @@
-import httpx
+from contextlib import asynccontextmanager
+
+from ..base._transport_httpx import build_client, client_kwargs
 
 
 class HttpxAsyncTransport:
-    def __init__(self, *, timeout=None, proxies=None, verify=True):
-        kwargs = {"timeout": timeout, "verify": verify}
-        if proxies is not None:
-            kwargs["proxies"] = proxies
-        try:
-            self._client = httpx.AsyncClient(**kwargs)
-        except TypeError as exc:
-            if "proxies" in kwargs:
-                kwargs["proxy"] = kwargs.pop("proxies")
-                self._client = httpx.AsyncClient(**kwargs)
-            else:
-                raise exc
+    """Transport backed by an ``httpx.AsyncClient``, created on the first
+    request."""
+
+    def __init__(
+        self,
+        *,
+        timeout=None,
+        proxies=None,
+        verify=True,
+        limits=None,
+        http2=False,
+        transport=None,
+    ):
+        self._options = {
+            "timeout": timeout,
+            "proxies": proxies,
+            "verify": verify,
+            "limits": limits,
+            "http2": http2,
+            "transport": transport,
+        }
+        self._httpx_client = None
+
+    @property
+    def _client(self):
+        # no await in between, so coroutines cannot race here
+        if self._httpx_client is None:
+            import httpx
+
+            self._httpx_client = build_client(
+                httpx.AsyncClient, client_kwargs(**self._options)
+            )
+        return self._httpx_client
 
     async def request(self, *, method, url, headers=None, content=None):
         return await self._client.request(method, url, headers=headers, content=content)
 
+    @asynccontextmanager
+    async def stream(self, *, method, url, headers=None):
+        """Send a request and yield the response before its body is read; iterate
+        it with ``aiter_bytes()``."""
+        async with self._client.stream(method, url, headers=headers) as response:
+            yield response
+
     async def close(self):
-        await self._client.aclose()
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+
+
+class ASGITransport(HttpxAsyncTransport):
+    """Routes requests in-process to an ASGI app, without sockets or network."""
+
+    def __init__(self, app, **kwargs):
+        import httpx
+
+        super().__init__(transport=httpx.ASGITransport(app=app), **kwargs)
@@ -1,11 +1,18 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_ASSORTMENT_INSIGHT = Route(
+    "/assortment-coverage/insights", "GET", add_storefront=False
+)
 
 
 class AssortmentCoverage(Client):
     """AssortmentCoverage Kaufland API Client."""
 
-    @kaufland_endpoint("/assortment-coverage/insights", method="GET")
+    @_GET_ASSORTMENT_INSIGHT
     async def get_assortment_insight(self, **kwargs) -> ApiResponse:
         """
         Args:
@@ -13,5 +20,22 @@ class AssortmentCoverage(Client):
         limit: int | optional (query) Desired size of result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_ASSORTMENT_INSIGHT.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
         )
+
+    def paginate_assortment_insight(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_assortment_insight, 5000 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_assortment_insight, max_limit=5000, **kwargs)
+
+    def iter_assortment_insight(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_assortment_insight, 5000 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_assortment_insight, max_limit=5000, **kwargs)
@@ -1,11 +1,25 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_ATTRIBUTE_LIST = Route("/attributes", "GET", add_storefront=True)
+_GET_ATTRIBUTE_BY_NAME = Route("/attributes/by-name/{}", "GET", add_storefront=True)
+_GET_ATTRIBUTE_LIST_BY_SEARCH = Route("/attributes/search", "GET", add_storefront=True)
+_GET_ATTRIBUTE = Route("/attributes/{}", "GET", add_storefront=True)
+_GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID = Route(
+    "/attributes/{}/shared-set", "GET", add_storefront=False
+)
+_GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID = Route(
+    "/attributes/{}/shared-set-values", "GET", add_storefront=False
+)
 
 
 class Attributes(Client):
     """Attributes Kaufland API Client."""
 
-    @kaufland_endpoint("/attributes", method="GET")
+    @_GET_ATTRIBUTE_LIST
     async def get_attribute_list(self, **kwargs) -> ApiResponse:
         """
         Get an attribute list
@@ -19,10 +33,24 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_ATTRIBUTE_LIST.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/attributes/by-name/{}", method="GET")
+    def paginate_attribute_list(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_attribute_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_attribute_list, max_limit=100, **kwargs)
+
+    def iter_attribute_list(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_attribute_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_attribute_list, max_limit=100, **kwargs)
+
+    @_GET_ATTRIBUTE_BY_NAME
     async def get_attribute_by_name(self, name, **kwargs) -> ApiResponse:
         """
         Get attribute by name
@@ -35,12 +63,13 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), name),
+            _GET_ATTRIBUTE_BY_NAME.fill(name),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/attributes/search", method="GET")
+    @_GET_ATTRIBUTE_LIST_BY_SEARCH
     async def get_attribute_list_by_search(self, **kwargs) -> ApiResponse:
         """
         Get attributes by search term
@@ -55,10 +84,27 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_ATTRIBUTE_LIST_BY_SEARCH.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/attributes/{}", method="GET")
+    def paginate_attribute_list_by_search(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_attribute_list_by_search, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_attribute_list_by_search, max_limit=100, **kwargs)
+
+    def iter_attribute_list_by_search(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_attribute_list_by_search, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_attribute_list_by_search, max_limit=100, **kwargs)
+
+    @_GET_ATTRIBUTE
     async def get_attribute(self, id_attribute, **kwargs) -> ApiResponse:
         """
         Get attribute by ID
@@ -71,12 +117,13 @@ class Attributes(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_ATTRIBUTE.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/attributes/{}/shared-set", method="GET")
+    @_GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID
     async def get_shared_set_list_by_search_and_attribute_id(
         self, id_attribute, **kwargs
     ) -> ApiResponse:
@@ -93,12 +140,43 @@ class Attributes(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_SHARED_SET_LIST_BY_SEARCH_AND_ATTRIBUTE_ID.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/attributes/{}/shared-set-values", method="GET")
+    def paginate_shared_set_list_by_search_and_attribute_id(
+        self, id_attribute, **kwargs
+    ) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_shared_set_list_by_search_and_attribute_id, 100 per
+        request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(
+            self.get_shared_set_list_by_search_and_attribute_id,
+            id_attribute,
+            max_limit=100,
+            **kwargs,
+        )
+
+    def iter_shared_set_list_by_search_and_attribute_id(
+        self, id_attribute, **kwargs
+    ) -> AsyncIterator[dict]:
+        """Yield every item of get_shared_set_list_by_search_and_attribute_id, 100 per
+        request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(
+            self.get_shared_set_list_by_search_and_attribute_id,
+            id_attribute,
+            max_limit=100,
+            **kwargs,
+        )
+
+    @_GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID
     async def get_shared_set_csv_file_by_attribute_id(
         self, id_attribute, **kwargs
     ) -> ApiResponse:
@@ -114,7 +192,8 @@ class Attributes(Client):
         locale: ProductDataLocale | required (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_attribute),
+            _GET_SHARED_SET_CSV_FILE_BY_ATTRIBUTE_ID.fill(id_attribute),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
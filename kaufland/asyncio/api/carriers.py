@@ -1,11 +1,13 @@
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_GET_CARRIERS = Route("/carriers", "GET", add_storefront=False)
 
 
 class Carriers(Client):
     """Carriers Kaufland API Client."""
 
-    @kaufland_endpoint("/carriers", method="GET")
+    @_GET_CARRIERS
     async def get_carriers(self, **kwargs) -> ApiResponse:
         """
         Get a list of available carriers
@@ -13,5 +15,5 @@ class Carriers(Client):
         Get a list of available carriers.
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_CARRIERS.fill(), method="GET", params=kwargs, add_storefront=False
         )
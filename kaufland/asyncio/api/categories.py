@@ -1,11 +1,19 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_CATEGORIES_LIST = Route("/categories", "GET", add_storefront=True)
+_DECIDE_CATEGORY = Route("/categories/decide", "POST", add_storefront=True)
+_GET_CATEGORY_TREE = Route("/categories/tree", "GET", add_storefront=True)
+_GET_CATEGORY = Route("/categories/{}", "GET", add_storefront=True)
 
 
 class Categories(Client):
     """Categories Kaufland API Client."""
 
-    @kaufland_endpoint("/categories", method="GET")
+    @_GET_CATEGORIES_LIST
     async def get_categories_list(self, **kwargs) -> ApiResponse:
         """
         Get category list by search term
@@ -21,10 +29,27 @@ class Categories(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_CATEGORIES_LIST.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/categories/decide", method="POST")
+    def paginate_categories_list(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_categories_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_categories_list, max_limit=100, **kwargs)
+
+    def iter_categories_list(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_categories_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_categories_list, max_limit=100, **kwargs)
+
+    @_DECIDE_CATEGORY
     async def decide_category(self, **kwargs) -> ApiResponse:
         """
         Guess categories
@@ -38,10 +63,14 @@ class Categories(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _DECIDE_CATEGORY.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/categories/tree", method="GET")
+    @_GET_CATEGORY_TREE
     async def get_category_tree(self, **kwargs) -> ApiResponse:
         """
         Get complete category tree
@@ -53,10 +82,10 @@ class Categories(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_CATEGORY_TREE.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/categories/{}", method="GET")
+    @_GET_CATEGORY
     async def get_category(self, id_category, **kwargs) -> ApiResponse:
         """
         Get category by ID
@@ -70,7 +99,8 @@ class Categories(Client):
         locale: ProductDataLocale | optional (query) Allows clients to consume the data in languages that are different from the storefront-default locale
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_category),
+            _GET_CATEGORY.fill(id_category),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
@@ -1,11 +1,42 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_INVENTORY_COMMAND_IMPORT_FILES = Route(
+    "/import-files/inventory-command", "GET", add_storefront=True
+)
+_CREATE_INVENTORY_COMMAND_IMPORT_FILE = Route(
+    "/import-files/inventory-command", "POST", add_storefront=True
+)
+_GET_INVENTORY_COMMAND_IMPORT_FILE = Route(
+    "/import-files/inventory-command/{}", "GET", add_storefront=True
+)
+_GET_INVENTORY_FEED_IMPORT_FILES = Route(
+    "/import-files/inventory-feed", "GET", add_storefront=True
+)
+_CREATE_INVENTORY_FEED_IMPORT_FILE = Route(
+    "/import-files/inventory-feed", "POST", add_storefront=True
+)
+_GET_INVENTORY_FEED_IMPORT_FILE = Route(
+    "/import-files/inventory-feed/{}", "GET", add_storefront=True
+)
+_GET_ORDER_COMMAND_IMPORT_FILES = Route(
+    "/import-files/order-command", "GET", add_storefront=False
+)
+_CREATE_ORDER_COMMAND_IMPORT_FILE = Route(
+    "/import-files/order-command", "POST", add_storefront=False
+)
+_GET_ORDER_COMMAND_IMPORT_FILE = Route(
+    "/import-files/order-command/{}", "GET", add_storefront=False
+)
 
 
 class ImportFiles(Client):
     """ImportFiles Kaufland API Client."""
 
-    @kaufland_endpoint("/import-files/inventory-command", method="GET")
+    @_GET_INVENTORY_COMMAND_IMPORT_FILES
     async def get_inventory_command_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your inventory command import files
@@ -22,10 +53,31 @@ class ImportFiles(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_INVENTORY_COMMAND_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-command", method="POST")
+    def paginate_inventory_command_import_files(
+        self, **kwargs
+    ) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_inventory_command_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_inventory_command_import_files, max_limit=30, **kwargs)
+
+    def iter_inventory_command_import_files(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_inventory_command_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(
+            self.get_inventory_command_import_files, max_limit=30, **kwargs
+        )
+
+    @_CREATE_INVENTORY_COMMAND_IMPORT_FILE
     async def create_inventory_command_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an INVENTORY_COMMAND file URL
@@ -38,10 +90,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_INVENTORY_COMMAND_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-command/{}", method="GET")
+    @_GET_INVENTORY_COMMAND_IMPORT_FILE
     async def get_inventory_command_import_file(
         self, id_import_file, **kwargs
     ) -> ApiResponse:
@@ -55,12 +111,13 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_INVENTORY_COMMAND_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-feed", method="GET")
+    @_GET_INVENTORY_FEED_IMPORT_FILES
     async def get_inventory_feed_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your inventory feed import files
@@ -77,10 +134,29 @@ class ImportFiles(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_INVENTORY_FEED_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-feed", method="POST")
+    def paginate_inventory_feed_import_files(
+        self, **kwargs
+    ) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_inventory_feed_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_inventory_feed_import_files, max_limit=30, **kwargs)
+
+    def iter_inventory_feed_import_files(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_inventory_feed_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_inventory_feed_import_files, max_limit=30, **kwargs)
+
+    @_CREATE_INVENTORY_FEED_IMPORT_FILE
     async def create_inventory_feed_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an INVENTORY_FEED file URL
@@ -93,10 +169,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_INVENTORY_FEED_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/inventory-feed/{}", method="GET")
+    @_GET_INVENTORY_FEED_IMPORT_FILE
     async def get_inventory_feed_import_file(
         self, id_import_file, **kwargs
     ) -> ApiResponse:
@@ -110,12 +190,13 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_INVENTORY_FEED_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/import-files/order-command", method="GET")
+    @_GET_ORDER_COMMAND_IMPORT_FILES
     async def get_order_command_import_files(self, **kwargs) -> ApiResponse:
         """
         Get a list of your order command import files
@@ -131,10 +212,29 @@ class ImportFiles(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_ORDER_COMMAND_IMPORT_FILES.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/import-files/order-command", method="POST")
+    def paginate_order_command_import_files(
+        self, **kwargs
+    ) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_order_command_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_order_command_import_files, max_limit=30, **kwargs)
+
+    def iter_order_command_import_files(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_order_command_import_files, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_order_command_import_files, max_limit=30, **kwargs)
+
+    @_CREATE_ORDER_COMMAND_IMPORT_FILE
     async def create_order_command_import_file(self, **kwargs) -> ApiResponse:
         """
         Add an ORDER_COMMAND file URL
@@ -146,10 +246,14 @@ class ImportFiles(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_ORDER_COMMAND_IMPORT_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/import-files/order-command/{}", method="GET")
+    @_GET_ORDER_COMMAND_IMPORT_FILE
     async def get_order_command_import_file(
         self, id_import_file, **kwargs
     ) -> ApiResponse:
@@ -162,7 +266,8 @@ class ImportFiles(Client):
         id_import_file: int | required (path) Internal ID of Import File
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_ORDER_COMMAND_IMPORT_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
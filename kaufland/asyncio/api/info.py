@@ -1,11 +1,15 @@
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_GET_ALL_LOCALES = Route("/info/locale", "GET", add_storefront=False)
+_GET_ALL_STOREFRONTS = Route("/info/storefront", "GET", add_storefront=False)
+_GET_VAT_INDICATORS = Route("/info/vat-indicators", "GET", add_storefront=True)
 
 
 class Info(Client):
     """Info Kaufland API Client."""
 
-    @kaufland_endpoint("/info/locale", method="GET")
+    @_GET_ALL_LOCALES
     async def get_all_locales(self, **kwargs) -> ApiResponse:
         """
         Get values for parameter 'locale'
@@ -13,10 +17,10 @@ class Info(Client):
         Get all available values for the parameter 'locale'. This parameter specifies the language of e.g. product data.
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_ALL_LOCALES.fill(), method="GET", params=kwargs, add_storefront=False
         )
 
-    @kaufland_endpoint("/info/storefront", method="GET")
+    @_GET_ALL_STOREFRONTS
     async def get_all_storefronts(self, **kwargs) -> ApiResponse:
         """
         Get values for parameter 'storefront'
@@ -25,10 +29,13 @@ class Info(Client):
         Returns a list of storefronts the seller has created in the sellerportal regardless of storefront status.
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_ALL_STOREFRONTS.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/info/vat-indicators", method="GET")
+    @_GET_VAT_INDICATORS
     async def get_vat_indicators(self, **kwargs) -> ApiResponse:
         """
         Get a list of Vat Indicators Mappings per Storefront
@@ -40,5 +47,5 @@ class Info(Client):
         storefront: Storefront | optional (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_VAT_INDICATORS.fill(), method="GET", params=kwargs, add_storefront=True
         )
@@ -1,11 +1,19 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_ORDER_INVOICES = Route("/order-invoices", "GET", add_storefront=True)
+_UPLOAD_ORDER_INVOICE = Route("/order-invoices/{}", "POST", add_storefront=False)
+_DELETE_ORDER_INVOICE = Route("/order-invoices/{}/{}", "DELETE", add_storefront=False)
+_GET_ORDER_INVOICE = Route("/order-invoices/{}/{}", "GET", add_storefront=False)
 
 
 class OrderInvoices(Client):
     """OrderInvoices Kaufland API Client."""
 
-    @kaufland_endpoint("/order-invoices", method="GET")
+    @_GET_ORDER_INVOICES
     async def get_order_invoices(self, **kwargs) -> ApiResponse:
         """
         Get a list of order invoices
@@ -20,10 +28,24 @@ class OrderInvoices(Client):
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_ORDER_INVOICES.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/order-invoices/{}", method="POST")
+    def paginate_order_invoices(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_order_invoices, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_order_invoices, max_limit=100, **kwargs)
+
+    def iter_order_invoices(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_order_invoices, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_order_invoices, max_limit=100, **kwargs)
+
+    @_UPLOAD_ORDER_INVOICE
     async def upload_order_invoice(self, id_order, **kwargs) -> ApiResponse:
         """
         Upload an order invoice to a given order
@@ -36,13 +58,14 @@ class OrderInvoices(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order),
+            _UPLOAD_ORDER_INVOICE.fill(id_order),
+            method="POST",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-invoices/{}/{}", method="DELETE")
+    @_DELETE_ORDER_INVOICE
     async def delete_order_invoice(self, id_order, id_invoice, **kwargs) -> ApiResponse:
         """
         Delete an order invoice by given order ID and invoice ID
@@ -54,12 +77,13 @@ class OrderInvoices(Client):
         id_invoice: LongInteger | required (path) Invoice ID, <b>not unique</b> across all invoices.
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order, id_invoice),
+            _DELETE_ORDER_INVOICE.fill(id_order, id_invoice),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-invoices/{}/{}", method="GET")
+    @_GET_ORDER_INVOICE
     async def get_order_invoice(self, id_order, id_invoice, **kwargs) -> ApiResponse:
         """
         Get an order invoice by order ID and invoice ID
@@ -76,7 +100,8 @@ class OrderInvoices(Client):
         id_invoice: int | required (path) Invoice ID, <b>not unique</b> across all invoices.
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order, id_invoice),
+            _GET_ORDER_INVOICE.fill(id_order, id_invoice),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
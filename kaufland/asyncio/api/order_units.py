@@ -1,11 +1,21 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_ORDER_UNITS = Route("/order-units", "GET", add_storefront=True)
+_GET_ORDER_UNIT = Route("/order-units/{}", "GET", add_storefront=False)
+_CANCEL_ORDER_UNIT = Route("/order-units/{}/cancel", "PATCH", add_storefront=False)
+_FULFIL_ORDER_UNIT = Route("/order-units/{}/fulfil", "PATCH", add_storefront=False)
+_REFUND_ORDER_UNIT = Route("/order-units/{}/refund", "PATCH", add_storefront=False)
+_SEND_ORDER_UNIT = Route("/order-units/{}/send", "PATCH", add_storefront=False)
 
 
 class OrderUnits(Client):
     """OrderUnits Kaufland API Client."""
 
-    @kaufland_endpoint("/order-units", method="GET")
+    @_GET_ORDER_UNITS
     async def get_order_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of order units
@@ -24,10 +34,24 @@ class OrderUnits(Client):
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_ORDER_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/order-units/{}", method="GET")
+    def paginate_order_units(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_order_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_order_units, max_limit=100, **kwargs)
+
+    def iter_order_units(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_order_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_order_units, max_limit=100, **kwargs)
+
+    @_GET_ORDER_UNIT
     async def get_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Get an order unit by ID
@@ -39,12 +63,13 @@ class OrderUnits(Client):
         embedded: list[OrderUnitEmbeddable] | optional (query) Additional data to be returned
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _GET_ORDER_UNIT.fill(id_order_unit),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/cancel", method="PATCH")
+    @_CANCEL_ORDER_UNIT
     async def cancel_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Cancel an order unit
@@ -58,13 +83,14 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _CANCEL_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/fulfil", method="PATCH")
+    @_FULFIL_ORDER_UNIT
     async def fulfil_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Mark an order unit to be in fulfillment
@@ -75,12 +101,13 @@ class OrderUnits(Client):
         id_order_unit: int | required (path) Order unit ID, unique across all order units
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _FULFIL_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/refund", method="PATCH")
+    @_REFUND_ORDER_UNIT
     async def refund_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Send a refund to a customer
@@ -95,13 +122,14 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _REFUND_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/order-units/{}/send", method="PATCH")
+    @_SEND_ORDER_UNIT
     async def send_order_unit(self, id_order_unit, **kwargs) -> ApiResponse:
         """
         Mark an order unit as sent
@@ -115,7 +143,8 @@ class OrderUnits(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order_unit),
+            _SEND_ORDER_UNIT.fill(id_order_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
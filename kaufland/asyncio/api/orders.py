@@ -1,11 +1,17 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_ORDERS = Route("/orders", "GET", add_storefront=True)
+_GET_ORDER = Route("/orders/{}", "GET", add_storefront=False)
 
 
 class Orders(Client):
     """Orders Kaufland API Client."""
 
-    @kaufland_endpoint("/orders", method="GET")
+    @_GET_ORDERS
     async def get_orders(self, **kwargs) -> ApiResponse:
         """
         Get a list of orders
@@ -21,10 +27,24 @@ class Orders(Client):
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_ORDERS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/orders/{}", method="GET")
+    def paginate_orders(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_orders, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_orders, max_limit=100, **kwargs)
+
+    def iter_orders(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_orders, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_orders, max_limit=100, **kwargs)
+
+    @_GET_ORDER
     async def get_order(self, id_order, **kwargs) -> ApiResponse:
         """
         Get an order by ID
@@ -36,7 +56,5 @@ class Orders(Client):
         embedded: list[OrderEmbeddable] | optional (query) Add 'order_invoices' to get order related invoices in the response.
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_order),
-            params=kwargs,
-            add_storefront=False,
+            _GET_ORDER.fill(id_order), method="GET", params=kwargs, add_storefront=False
         )
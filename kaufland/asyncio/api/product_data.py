@@ -1,11 +1,29 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_UPDATE_PRODUCT_DATA = Route("/product-data", "PATCH", add_storefront=False)
+_CREATE_PRODUCT_DATA = Route("/product-data", "PUT", add_storefront=False)
+_GET_PRODUCT_DATA_FILE_LIST = Route(
+    "/product-data/import-files", "GET", add_storefront=False
+)
+_CREATE_PRODUCT_DATA_FILE = Route(
+    "/product-data/import-files", "POST", add_storefront=False
+)
+_GET_PRODUCT_DATA_FILE = Route(
+    "/product-data/import-files/{}", "GET", add_storefront=False
+)
+_GET_PRODUCT_DATA_STATUS = Route("/product-data/status/{}", "GET", add_storefront=False)
+_DELETE_PRODUCT_DATA = Route("/product-data/{}", "DELETE", add_storefront=False)
+_GET_PRODUCT_DATA = Route("/product-data/{}", "GET", add_storefront=False)
 
 
 class ProductData(Client):
     """ProductData Kaufland API Client."""
 
-    @kaufland_endpoint("/product-data", method="PATCH")
+    @_UPDATE_PRODUCT_DATA
     async def update_product_data(self, **kwargs) -> ApiResponse:
         """
         Update existing product data for an EAN
@@ -21,10 +39,14 @@ class ProductData(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _UPDATE_PRODUCT_DATA.fill(),
+            method="PATCH",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data", method="PUT")
+    @_CREATE_PRODUCT_DATA
     async def create_product_data(self, **kwargs) -> ApiResponse:
         """
         Add new product data for an EAN or replace your existing one
@@ -40,10 +62,14 @@ class ProductData(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_PRODUCT_DATA.fill(),
+            method="PUT",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/import-files", method="GET")
+    @_GET_PRODUCT_DATA_FILE_LIST
     async def get_product_data_file_list(self, **kwargs) -> ApiResponse:
         """
         Get import files
@@ -59,10 +85,27 @@ class ProductData(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_PRODUCT_DATA_FILE_LIST.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/import-files", method="POST")
+    def paginate_product_data_file_list(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_product_data_file_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_product_data_file_list, max_limit=100, **kwargs)
+
+    def iter_product_data_file_list(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_product_data_file_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_product_data_file_list, max_limit=100, **kwargs)
+
+    @_CREATE_PRODUCT_DATA_FILE
     async def create_product_data_file(self, **kwargs) -> ApiResponse:
         """
         Add an import file URL
@@ -76,10 +119,14 @@ class ProductData(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_PRODUCT_DATA_FILE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/import-files/{}", method="GET")
+    @_GET_PRODUCT_DATA_FILE
     async def get_product_data_file(self, id_import_file, **kwargs) -> ApiResponse:
         """
         Get import file by ID
@@ -90,12 +137,13 @@ class ProductData(Client):
         id_import_file: int | required (path)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_PRODUCT_DATA_FILE.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/status/{}", method="GET")
+    @_GET_PRODUCT_DATA_STATUS
     async def get_product_data_status(self, ean, **kwargs) -> ApiResponse:
         """
         Get the process status for your product data
@@ -107,12 +155,13 @@ class ProductData(Client):
         locale: Locale | required (query) The language code of the product data (ISO 3166-2)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), ean),
+            _GET_PRODUCT_DATA_STATUS.fill(ean),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/{}", method="DELETE")
+    @_DELETE_PRODUCT_DATA
     async def delete_product_data(self, ean, **kwargs) -> ApiResponse:
         """
         Delete your product data for an EAN
@@ -124,12 +173,13 @@ class ProductData(Client):
         locale: Locale | required (query) The language code of the product data (ISO 3166-2)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), ean),
+            _DELETE_PRODUCT_DATA.fill(ean),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/product-data/{}", method="GET")
+    @_GET_PRODUCT_DATA
     async def get_product_data(self, ean, **kwargs) -> ApiResponse:
         """
         Get your product data for an EAN
@@ -141,7 +191,8 @@ class ProductData(Client):
         locale: Locale | required (query) The language code of the product data (ISO 3166-2)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), ean),
+            _GET_PRODUCT_DATA.fill(ean),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
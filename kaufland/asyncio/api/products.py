@@ -1,11 +1,18 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_PRODUCT_BY_EAN = Route("/products/ean/{}", "GET", add_storefront=True)
+_GET_PRODUCT_LIST = Route("/products/search", "GET", add_storefront=True)
+_GET_PRODUCT = Route("/products/{}", "GET", add_storefront=True)
 
 
 class Products(Client):
     """Products Kaufland API Client."""
 
-    @kaufland_endpoint("/products/ean/{}", method="GET")
+    @_GET_PRODUCT_BY_EAN
     async def get_product_by_ean(self, ean, **kwargs) -> ApiResponse:
         """
         Get a product by EAN
@@ -18,12 +25,13 @@ class Products(Client):
         embedded: list[ProductEmbeddable] | optional (query) Include related entities in the result (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), ean),
+            _GET_PRODUCT_BY_EAN.fill(ean),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/products/search", method="GET")
+    @_GET_PRODUCT_LIST
     async def get_product_list(self, **kwargs) -> ApiResponse:
         """
         Get a list of products by search term
@@ -38,10 +46,24 @@ class Products(Client):
         embedded: list[ProductEmbeddable] | optional (query) Include other entities in the results of the result list (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_PRODUCT_LIST.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/products/{}", method="GET")
+    def paginate_product_list(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_product_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_product_list, max_limit=100, **kwargs)
+
+    def iter_product_list(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_product_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_product_list, max_limit=100, **kwargs)
+
+    @_GET_PRODUCT
     async def get_product(self, id_product, **kwargs) -> ApiResponse:
         """
         Get product by ID
@@ -54,7 +76,8 @@ class Products(Client):
         embedded: list[ProductEmbeddable] | optional (query) Include related entities in the result (if both parameters "category" and "category_basics" are provided, only the parameter "category" is used)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_product),
+            _GET_PRODUCT.fill(id_product),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
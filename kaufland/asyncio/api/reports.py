@@ -1,11 +1,42 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_REPORTS = Route("/reports", "GET", add_storefront=True)
+_REQUEST_ACCOUNT_LISTING_REPORT = Route(
+    "/reports/account-listing", "POST", add_storefront=True
+)
+_REQUEST_NEW_BOOKINGS_REPORT = Route(
+    "/reports/bookings-new", "POST", add_storefront=True
+)
+_REQUEST_CANCELLATIONS_REPORT = Route(
+    "/reports/cancellations", "POST", add_storefront=True
+)
+_REQUEST_COMPETITORS_COMPARER_REPORT = Route(
+    "/reports/competitors-comparer", "POST", add_storefront=True
+)
+_REQUEST_EANS_NOT_FOUND_REPORT = Route(
+    "/reports/eans-not-found", "POST", add_storefront=True
+)
+_REQUEST_PRICE_COMPETITIVENESS_REPORT = Route(
+    "/reports/price-competitiveness", "POST", add_storefront=True
+)
+_REQUEST_PRODUCT_DATA_CHANGES_REPORT = Route(
+    "/reports/product-data-changes", "POST", add_storefront=True
+)
+_REQUEST_PRODUCT_DATA_IMPORT_FILE_ERRORS_REPORT = Route(
+    "/reports/product-data-import-file-errors", "POST", add_storefront=False
+)
+_REQUEST_NEW_SALES_REPORT = Route("/reports/sales-new", "POST", add_storefront=True)
+_GET_REPORT = Route("/reports/{}", "GET", add_storefront=False)
 
 
 class Reports(Client):
     """Reports Kaufland API Client."""
 
-    @kaufland_endpoint("/reports", method="GET")
+    @_GET_REPORTS
     async def get_reports(self, **kwargs) -> ApiResponse:
         """
         Get a list of your reports
@@ -19,10 +50,24 @@ class Reports(Client):
         sort: ReportsSorting | optional (query) Sorting of result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_REPORTS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/reports/account-listing", method="POST")
+    def paginate_reports(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_reports, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_reports, max_limit=30, **kwargs)
+
+    def iter_reports(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_reports, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_reports, max_limit=30, **kwargs)
+
+    @_REQUEST_ACCOUNT_LISTING_REPORT
     async def request_account_listing_report(self, **kwargs) -> ApiResponse:
         """
         Queue an inventory report
@@ -33,10 +78,13 @@ class Reports(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_ACCOUNT_LISTING_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/bookings-new", method="POST")
+    @_REQUEST_NEW_BOOKINGS_REPORT
     async def request_new_bookings_report(self, **kwargs) -> ApiResponse:
         """
         Queue a bookings report
@@ -50,10 +98,14 @@ class Reports(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _REQUEST_NEW_BOOKINGS_REPORT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/cancellations", method="POST")
+    @_REQUEST_CANCELLATIONS_REPORT
     async def request_cancellations_report(self, **kwargs) -> ApiResponse:
         """
         Queue a cancellations report.
@@ -73,10 +125,13 @@ class Reports(Client):
         cancellation_type: CancellationType | optional (query) Filter to select what cancellations are Considered (defaults to no filter applied)
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_CANCELLATIONS_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/competitors-comparer", method="POST")
+    @_REQUEST_COMPETITORS_COMPARER_REPORT
     async def request_competitors_comparer_report(self, **kwargs) -> ApiResponse:
         """
         Queue a competitors comparison report
@@ -99,10 +154,13 @@ class Reports(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_COMPETITORS_COMPARER_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/eans-not-found", method="POST")
+    @_REQUEST_EANS_NOT_FOUND_REPORT
     async def request_eans_not_found_report(self, **kwargs) -> ApiResponse:
         """
         Queue an EANs not found report
@@ -118,10 +176,13 @@ class Reports(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_EANS_NOT_FOUND_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/price-competitiveness", method="POST")
+    @_REQUEST_PRICE_COMPETITIVENESS_REPORT
     async def request_price_competitiveness_report(self, **kwargs) -> ApiResponse:
         """
         Queue a price competitiveness report
@@ -144,10 +205,13 @@ class Reports(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_PRICE_COMPETITIVENESS_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/product-data-changes", method="POST")
+    @_REQUEST_PRODUCT_DATA_CHANGES_REPORT
     async def request_product_data_changes_report(self, **kwargs) -> ApiResponse:
         """
         Queue a product data changes report
@@ -165,10 +229,13 @@ class Reports(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _REQUEST_PRODUCT_DATA_CHANGES_REPORT.fill(),
+            method="POST",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/product-data-import-file-errors", method="POST")
+    @_REQUEST_PRODUCT_DATA_IMPORT_FILE_ERRORS_REPORT
     async def request_product_data_import_file_errors_report(
         self, **kwargs
     ) -> ApiResponse:
@@ -189,10 +256,14 @@ class Reports(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _REQUEST_PRODUCT_DATA_IMPORT_FILE_ERRORS_REPORT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/reports/sales-new", method="POST")
+    @_REQUEST_NEW_SALES_REPORT
     async def request_new_sales_report(self, **kwargs) -> ApiResponse:
         """
         Queue a sales report
@@ -205,10 +276,14 @@ class Reports(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _REQUEST_NEW_SALES_REPORT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/reports/{}", method="GET")
+    @_GET_REPORT
     async def get_report(self, id_report, **kwargs) -> ApiResponse:
         """
         Get meta-data for a single report by ID
@@ -219,7 +294,8 @@ class Reports(Client):
         id_report: LongInteger | required (path)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_report),
+            _GET_REPORT.fill(id_report),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
@@ -1,11 +1,21 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_RETURN_UNITS = Route("/return-units", "GET", add_storefront=True)
+_GET_RETURN_UNIT = Route("/return-units/{}", "GET", add_storefront=False)
+_ACCEPT_RETURN_UNIT = Route("/return-units/{}/accept", "PATCH", add_storefront=False)
+_CLARIFY_RETURN_UNIT = Route("/return-units/{}/clarify", "PATCH", add_storefront=False)
+_REJECT_RETURN_UNIT = Route("/return-units/{}/reject", "PATCH", add_storefront=False)
+_REPAIR_RETURN_UNIT = Route("/return-units/{}/repair", "PATCH", add_storefront=False)
 
 
 class ReturnUnits(Client):
     """ReturnUnits Kaufland API Client."""
 
-    @kaufland_endpoint("/return-units", method="GET")
+    @_GET_RETURN_UNITS
     async def get_return_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of return units
@@ -22,10 +32,24 @@ class ReturnUnits(Client):
         offset: Integer | optional (query) Offset applied to result set<br>default: 0
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_RETURN_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/return-units/{}", method="GET")
+    def paginate_return_units(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_return_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_return_units, max_limit=100, **kwargs)
+
+    def iter_return_units(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_return_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_return_units, max_limit=100, **kwargs)
+
+    @_GET_RETURN_UNIT
     async def get_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Get a return unit by ID
@@ -37,12 +61,13 @@ class ReturnUnits(Client):
         embedded: list[ReturnUnitEmbeddable] | optional (query) Additional data to be returned
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _GET_RETURN_UNIT.fill(id_return_unit),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/accept", method="PATCH")
+    @_ACCEPT_RETURN_UNIT
     async def accept_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Accept a return unit
@@ -53,12 +78,13 @@ class ReturnUnits(Client):
         id_return_unit: int | required (path) Return unit ID, unique across all return units
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _ACCEPT_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/clarify", method="PATCH")
+    @_CLARIFY_RETURN_UNIT
     async def clarify_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Clarify a return unit
@@ -72,13 +98,14 @@ class ReturnUnits(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _CLARIFY_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/reject", method="PATCH")
+    @_REJECT_RETURN_UNIT
     async def reject_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Reject a return unit
@@ -91,13 +118,14 @@ class ReturnUnits(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _REJECT_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/return-units/{}/repair", method="PATCH")
+    @_REPAIR_RETURN_UNIT
     async def repair_return_unit(self, id_return_unit, **kwargs) -> ApiResponse:
         """
         Repair a return unit
@@ -108,7 +136,8 @@ class ReturnUnits(Client):
         id_return_unit: int | required (path) Return unit ID, unique across all return units
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return_unit),
+            _REPAIR_RETURN_UNIT.fill(id_return_unit),
+            method="PATCH",
             params=kwargs,
             add_storefront=False,
         )
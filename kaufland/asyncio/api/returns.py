@@ -1,11 +1,19 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_RETURNS = Route("/returns", "GET", add_storefront=True)
+_INITIATE_RETURN = Route("/returns", "POST", add_storefront=False)
+_GET_RETURN = Route("/returns/{}", "GET", add_storefront=False)
+_UPDATE_RETURN = Route("/returns/{}", "PUT", add_storefront=False)
 
 
 class Returns(Client):
     """Returns Kaufland API Client."""
 
-    @kaufland_endpoint("/returns", method="GET")
+    @_GET_RETURNS
     async def get_returns(self, **kwargs) -> ApiResponse:
         """
         Get a list of returns
@@ -24,10 +32,24 @@ class Returns(Client):
         offset: int | optional (query) Offset applied to result set<br>default: 0
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_RETURNS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/returns", method="POST")
+    def paginate_returns(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_returns, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_returns, max_limit=100, **kwargs)
+
+    def iter_returns(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_returns, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_returns, max_limit=100, **kwargs)
+
+    @_INITIATE_RETURN
     async def initiate_return(self, **kwargs) -> ApiResponse:
         """
         Initialize a return
@@ -42,10 +64,14 @@ class Returns(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _INITIATE_RETURN.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/returns/{}", method="GET")
+    @_GET_RETURN
     async def get_return(self, id_return, **kwargs) -> ApiResponse:
         """
         Get a return by ID
@@ -57,12 +83,13 @@ class Returns(Client):
         embedded: list[ReturnEmbeddable] | optional (query) Additional data to be returned
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return),
+            _GET_RETURN.fill(id_return),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/returns/{}", method="PUT")
+    @_UPDATE_RETURN
     async def update_return(self, id_return, **kwargs) -> ApiResponse:
         """
         Add one or more order units to an already existing return
@@ -75,7 +102,8 @@ class Returns(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_return),
+            _UPDATE_RETURN.fill(id_return),
+            method="PUT",
             data=body,
             params=kwargs,
             add_storefront=False,
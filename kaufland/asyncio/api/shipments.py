@@ -1,11 +1,13 @@
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_ADD_SHIPMENT = Route("/shipments", "POST", add_storefront=False)
 
 
 class Shipments(Client):
     """Shipments Kaufland API Client."""
 
-    @kaufland_endpoint("/shipments", method="POST")
+    @_ADD_SHIPMENT
     async def add_shipment(self, **kwargs) -> ApiResponse:
         """
         Add a shipment to an order unit which is already marked as sent.
@@ -19,5 +21,9 @@ class Shipments(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _ADD_SHIPMENT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
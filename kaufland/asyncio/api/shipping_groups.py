@@ -1,11 +1,17 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_SHIPPING_GROUPS = Route("/shipping-groups", "GET", add_storefront=True)
+_GET_SHIPPING_GROUP = Route("/shipping-groups/{}", "GET", add_storefront=True)
 
 
 class ShippingGroups(Client):
     """ShippingGroups Kaufland API Client."""
 
-    @kaufland_endpoint("/shipping-groups", method="GET")
+    @_GET_SHIPPING_GROUPS
     async def get_shipping_groups(self, **kwargs) -> ApiResponse:
         """
         Get the list of your predefined shipping groups
@@ -18,10 +24,27 @@ class ShippingGroups(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_SHIPPING_GROUPS.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/shipping-groups/{}", method="GET")
+    def paginate_shipping_groups(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_shipping_groups, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_shipping_groups, max_limit=30, **kwargs)
+
+    def iter_shipping_groups(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_shipping_groups, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_shipping_groups, max_limit=30, **kwargs)
+
+    @_GET_SHIPPING_GROUP
     async def get_shipping_group(self, id_shipping_group, **kwargs) -> ApiResponse:
         """
         Get a shipping group by ID
@@ -33,7 +56,8 @@ class ShippingGroups(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_shipping_group),
+            _GET_SHIPPING_GROUP.fill(id_shipping_group),
+            method="GET",
             params=kwargs,
             add_storefront=True,
         )
@@ -1,11 +1,13 @@
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, kaufland_endpoint
+from kaufland.base import ApiResponse, Route
+
+_PING = Route("/status/ping", "GET", add_storefront=False)
 
 
 class Status(Client):
     """Status Kaufland API Client."""
 
-    @kaufland_endpoint("/status/ping", method="GET")
+    @_PING
     async def ping(self, **kwargs) -> ApiResponse:
         """
         Ping the Marketplace Seller API by Kaufland
@@ -13,5 +15,5 @@ class Status(Client):
         A simple method you can call that will return a constant value as long as everything is good.
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _PING.fill(), method="GET", params=kwargs, add_storefront=False
         )
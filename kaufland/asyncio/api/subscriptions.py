@@ -1,11 +1,20 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_SUBSCRIPTIONS = Route("/subscriptions", "GET", add_storefront=True)
+_ADD_SUBSCRIPTION = Route("/subscriptions", "POST", add_storefront=True)
+_DELETE_SUBSCRIPTION = Route("/subscriptions/{}", "DELETE", add_storefront=False)
+_GET_SUBSCRIPTION = Route("/subscriptions/{}", "GET", add_storefront=False)
+_UPDATE_SUBSCRIPTION = Route("/subscriptions/{}", "PATCH", add_storefront=False)
 
 
 class Subscriptions(Client):
     """Subscriptions Kaufland API Client."""
 
-    @kaufland_endpoint("/subscriptions", method="GET")
+    @_GET_SUBSCRIPTIONS
     async def get_subscriptions(self, **kwargs) -> ApiResponse:
         """
         Get a list of your push notification subscriptions
@@ -19,10 +28,24 @@ class Subscriptions(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_SUBSCRIPTIONS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/subscriptions", method="POST")
+    def paginate_subscriptions(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_subscriptions, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_subscriptions, max_limit=30, **kwargs)
+
+    def iter_subscriptions(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_subscriptions, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_subscriptions, max_limit=30, **kwargs)
+
+    @_ADD_SUBSCRIPTION
     async def add_subscription(self, **kwargs) -> ApiResponse:
         """
         Subscribe for event
@@ -35,10 +58,14 @@ class Subscriptions(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _ADD_SUBSCRIPTION.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="DELETE")
+    @_DELETE_SUBSCRIPTION
     async def delete_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Unsubscribe from event
@@ -49,12 +76,13 @@ class Subscriptions(Client):
         id_subscription: LongInteger | required (path)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _DELETE_SUBSCRIPTION.fill(id_subscription),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="GET")
+    @_GET_SUBSCRIPTION
     async def get_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Get a push notification subscription by ID
@@ -65,12 +93,13 @@ class Subscriptions(Client):
         id_subscription: LongInteger | required (path)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _GET_SUBSCRIPTION.fill(id_subscription),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/subscriptions/{}", method="PATCH")
+    @_UPDATE_SUBSCRIPTION
     async def update_subscription(self, id_subscription, **kwargs) -> ApiResponse:
         """
         Update subscription
@@ -83,7 +112,8 @@ class Subscriptions(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_subscription),
+            _UPDATE_SUBSCRIPTION.fill(id_subscription),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=False,
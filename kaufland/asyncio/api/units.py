@@ -1,11 +1,21 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_UNITS = Route("/units", "GET", add_storefront=True)
+_CREATE_UNIT = Route("/units", "POST", add_storefront=True)
+_BULK_UPDATE_UNITS = Route("/units/bulk", "POST", add_storefront=True)
+_DELETE_UNIT = Route("/units/{}", "DELETE", add_storefront=True)
+_GET_UNIT = Route("/units/{}", "GET", add_storefront=True)
+_PATCH_UNIT = Route("/units/{}", "PATCH", add_storefront=True)
 
 
 class Units(Client):
     """Units Kaufland API Client."""
 
-    @kaufland_endpoint("/units", method="GET")
+    @_GET_UNITS
     async def get_units(self, **kwargs) -> ApiResponse:
         """
         Get a list of your units
@@ -24,10 +34,24 @@ class Units(Client):
         fulfillment_type: list[FulfillmentType] | optional (query) Get only units which are fulfilled by the given type. <br/> The value `fulfilled_by_kaufland` is **DEPRECATED**.
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=True
+            _GET_UNITS.fill(), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/units", method="POST")
+    def paginate_units(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_units, max_limit=100, **kwargs)
+
+    def iter_units(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_units, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_units, max_limit=100, **kwargs)
+
+    @_CREATE_UNIT
     async def create_unit(self, **kwargs) -> ApiResponse:
         """
         Add a unit
@@ -43,10 +67,14 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _CREATE_UNIT.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/bulk", method="POST")
+    @_BULK_UPDATE_UNITS
     async def bulk_update_units(self, **kwargs) -> ApiResponse:
         """
         Update some fields of a given set of units
@@ -67,10 +95,14 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=True
+            _BULK_UPDATE_UNITS.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/{}", method="DELETE")
+    @_DELETE_UNIT
     async def delete_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Delete a unit
@@ -82,12 +114,13 @@ class Units(Client):
         storefront: Storefront | required (query) Parameter to select the affected storefront
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
+            _DELETE_UNIT.fill(id_unit),
+            method="DELETE",
             params=kwargs,
             add_storefront=True,
         )
 
-    @kaufland_endpoint("/units/{}", method="GET")
+    @_GET_UNIT
     async def get_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Get a unit by ID
@@ -100,12 +133,10 @@ class Units(Client):
         embedded: list[UnitAndProductEmbeddedEnum] | optional (query)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
-            params=kwargs,
-            add_storefront=True,
+            _GET_UNIT.fill(id_unit), method="GET", params=kwargs, add_storefront=True
         )
 
-    @kaufland_endpoint("/units/{}", method="PATCH")
+    @_PATCH_UNIT
     async def patch_unit(self, id_unit, **kwargs) -> ApiResponse:
         """
         Update some of the fields of a unit
@@ -121,7 +152,8 @@ class Units(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_unit),
+            _PATCH_UNIT.fill(id_unit),
+            method="PATCH",
             data=body,
             params=kwargs,
             add_storefront=True,
@@ -1,11 +1,24 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_VARIANT_SUGGESTIONS_FEED_LIST = Route(
+    "/variant-suggestions/feed", "GET", add_storefront=False
+)
+_UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL = Route(
+    "/variant-suggestions/feed/upload-by-url", "POST", add_storefront=False
+)
+_GET_VARIANT_SUGGESTIONS_FEED = Route(
+    "/variant-suggestions/feed/{}", "GET", add_storefront=False
+)
 
 
 class VariantSuggestions(Client):
     """VariantSuggestions Kaufland API Client."""
 
-    @kaufland_endpoint("/variant-suggestions/feed", method="GET")
+    @_GET_VARIANT_SUGGESTIONS_FEED_LIST
     async def get_variant_suggestions_feed_list(self, **kwargs) -> ApiResponse:
         """
         Get import files
@@ -21,10 +34,31 @@ class VariantSuggestions(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_VARIANT_SUGGESTIONS_FEED_LIST.fill(),
+            method="GET",
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/variant-suggestions/feed/upload-by-url", method="POST")
+    def paginate_variant_suggestions_feed_list(
+        self, **kwargs
+    ) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_variant_suggestions_feed_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_variant_suggestions_feed_list, max_limit=100, **kwargs)
+
+    def iter_variant_suggestions_feed_list(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_variant_suggestions_feed_list, 100 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(
+            self.get_variant_suggestions_feed_list, max_limit=100, **kwargs
+        )
+
+    @_UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL
     async def upload_variant_suggestion_file_by_url(self, **kwargs) -> ApiResponse:
         """
         Add an import file URL
@@ -38,10 +72,14 @@ class VariantSuggestions(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _UPLOAD_VARIANT_SUGGESTION_FILE_BY_URL.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/variant-suggestions/feed/{}", method="GET")
+    @_GET_VARIANT_SUGGESTIONS_FEED
     async def get_variant_suggestions_feed(
         self, id_import_file, **kwargs
     ) -> ApiResponse:
@@ -54,7 +92,8 @@ class VariantSuggestions(Client):
         id_import_file: int | required (path)
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_import_file),
+            _GET_VARIANT_SUGGESTIONS_FEED.fill(id_import_file),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
@@ -1,11 +1,20 @@
+from collections.abc import AsyncIterator
+
 from kaufland.asyncio import Client
-from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint
+from kaufland.asyncio.pagination import iter_items, paginate
+from kaufland.base import ApiResponse, Route
+
+_GET_WAREHOUSES = Route("/warehouses", "GET", add_storefront=False)
+_CREATE_WAREHOUSE = Route("/warehouses", "POST", add_storefront=False)
+_DELETE_WAREHOUSE = Route("/warehouses/{}", "DELETE", add_storefront=False)
+_GET_WAREHOUSE = Route("/warehouses/{}", "GET", add_storefront=False)
+_UPDATE_WAREHOUSE = Route("/warehouses/{}", "PUT", add_storefront=False)
 
 
 class Warehouses(Client):
     """Warehouses Kaufland API Client."""
 
-    @kaufland_endpoint("/warehouses", method="GET")
+    @_GET_WAREHOUSES
     async def get_warehouses(self, **kwargs) -> ApiResponse:
         """
         Get a list of your Warehouses
@@ -17,10 +26,24 @@ class Warehouses(Client):
         offset: int | optional (query) Offset applied to result set
         """
         return await self._request(
-            kwargs.pop("path"), params=kwargs, add_storefront=False
+            _GET_WAREHOUSES.fill(), method="GET", params=kwargs, add_storefront=False
         )
 
-    @kaufland_endpoint("/warehouses", method="POST")
+    def paginate_warehouses(self, **kwargs) -> AsyncIterator[ApiResponse]:
+        """Yield every page of get_warehouses, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return paginate(self.get_warehouses, max_limit=30, **kwargs)
+
+    def iter_warehouses(self, **kwargs) -> AsyncIterator[dict]:
+        """Yield every item of get_warehouses, 30 per request.
+
+        Pass concurrency=N to fetch the remaining pages in parallel.
+        """
+        return iter_items(self.get_warehouses, max_limit=30, **kwargs)
+
+    @_CREATE_WAREHOUSE
     async def create_warehouse(self, **kwargs) -> ApiResponse:
         """
         Create a new Warehouse
@@ -32,10 +55,14 @@ class Warehouses(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            kwargs.pop("path"), data=body, params=kwargs, add_storefront=False
+            _CREATE_WAREHOUSE.fill(),
+            method="POST",
+            data=body,
+            params=kwargs,
+            add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="DELETE")
+    @_DELETE_WAREHOUSE
     async def delete_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Delete a warehouse
@@ -46,12 +73,13 @@ class Warehouses(Client):
         id_warehouse: int | required (path) Internal ID of Warehouse, unique across all Warehouses
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _DELETE_WAREHOUSE.fill(id_warehouse),
+            method="DELETE",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="GET")
+    @_GET_WAREHOUSE
     async def get_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Get a warehouse by its ID
@@ -62,12 +90,13 @@ class Warehouses(Client):
         id_warehouse: int | required (path) Internal ID of Warehouse, unique across all Warehouses
         """
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _GET_WAREHOUSE.fill(id_warehouse),
+            method="GET",
             params=kwargs,
             add_storefront=False,
         )
 
-    @kaufland_endpoint("/warehouses/{}", method="PUT")
+    @_UPDATE_WAREHOUSE
     async def update_warehouse(self, id_warehouse, **kwargs) -> ApiResponse:
         """
         Update a Warehouse
@@ -80,7 +109,8 @@ class Warehouses(Client):
         """
         body = kwargs.pop("body", None)
         return await self._request(
-            fill_query_params(kwargs.pop("path"), id_warehouse),
+            _UPDATE_WAREHOUSE.fill(id_warehouse),
+            method="PUT",
             data=body,
             params=kwargs,
             add_storefront=False,
@@ -0,0 +1,38 @@
+from ..base._core import raise_for_status
+from ..base.attribute_registry import (
+    STOREFRONT_LOCALES,
+    AttributeRegistry,
+    parse_shared_set_csv,
+)
+from .batch import map_concurrent
+
+
+async def fetch_attribute_registry(
+    attributes_client, *, storefront=None, locale=None, shared_sets=True, concurrency=8
+):
+    """Fetch all attributes and shared-set values through an async ``Attributes``
+    client, see ``AttributeRegistry.from_client``."""
+    storefront = storefront or attributes_client.storefront
+    locale = locale or STOREFRONT_LOCALES.get(storefront)
+    params = {"storefront": storefront}
+    if locale:
+        params["locale"] = locale
+    attributes = [a async for a in attributes_client.iter_attribute_list(**params)]
+    registry = AttributeRegistry(attributes, storefront=storefront, locale=locale)
+    if not shared_sets:
+        return registry
+
+    async def fetch(attribute):
+        response = await attributes_client.get_shared_set_csv_file_by_attribute_id(
+            attribute["id"], locale=locale
+        )
+        res = await attributes_client._transport.request(
+            method="GET", url=response.payload["data"]
+        )
+        return parse_shared_set_csv(raise_for_status(res).text)
+
+    # tuples, so map_concurrent passes each attribute as a positional argument
+    shared = [(a,) for a in attributes if a.get("is_sharedset")]
+    async for result in map_concurrent(fetch, shared, concurrency=concurrency):
+        registry.shared_sets[result.item[0]["name"]] = result.unwrap()
+    return registry
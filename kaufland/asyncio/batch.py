@@ -0,0 +1,66 @@
+import asyncio
+
+from ..base.batch import BatchResult, call_arguments
+
+
+async def _items(iterable):
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def map_concurrent(method, iterable, *, concurrency=8, ordered=True, **kwargs):
+    """Call the coroutine function ``method`` once per input, up to
+    ``concurrency`` calls at a time, and yield a ``BatchResult`` per call.
+
+    ``iterable`` may be sync or async and is consumed lazily, so at most
+    ``concurrency`` inputs are in flight or buffered at any time. Exceptions are
+    captured in the result instead of stopping the batch. With ``ordered=False``
+    results are yielded as they complete. ``kwargs`` are passed to every call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def call(index, item):
+        args, call_kwargs = call_arguments(item, kwargs)
+        try:
+            result = await method(*args, **call_kwargs)
+        except Exception as exc:
+            return BatchResult(index, item, error=exc)
+        return BatchResult(index, item, result=result)
+
+    items = _items(iterable)
+    pending = []
+    index = 0
+
+    async def fill():
+        nonlocal index
+        while len(pending) < concurrency:
+            try:
+                item = await anext(items)
+            except StopAsyncIteration:
+                return
+            pending.append(asyncio.ensure_future(call(index, item)))
+            index += 1
+
+    try:
+        await fill()
+        while pending:
+            if ordered:
+                result = await pending.pop(0)
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                pending.remove(task)
+                result = task.result()
+            await fill()
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        await items.aclose()
@@ -0,0 +1,39 @@
+import asyncio
+
+from ..base.bulk import (
+    BULK_UPDATE_LIMIT,
+    chunk_units,
+    dedupe_units,
+    merge_chunk_result,
+)
+
+
+async def bulk_update_units(
+    units_client, units, *, concurrency=4, chunk_size=BULK_UPDATE_LIMIT, **kwargs
+):
+    """Update any number of units through ``Units.bulk_update_units``.
+
+    ``units`` is an iterable of ``UnitsBulkUpdateRequest`` dicts. Duplicates are
+    dropped (last write wins), the rest is split into requests of at most 150 units
+    with up to ``concurrency`` of them in flight. Extra keyword arguments such as
+    ``storefront`` are passed to every request.
+
+    Returns a dict mapping each ``id_unit`` sent to its entry of the response
+    ``data``, to the exception raised by the request that carried it, or to a
+    ``NoResult`` if the response has no entry for it.
+    """
+    chunks = chunk_units(dedupe_units(units), chunk_size)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(chunk):
+        async with semaphore:
+            try:
+                response = await units_client.bulk_update_units(body=chunk, **kwargs)
+            except Exception as exc:
+                return chunk, None, exc
+        return chunk, response, None
+
+    results = {}
+    for chunk, response, error in await asyncio.gather(*map(send, chunks)):
+        merge_chunk_result(results, chunk, response, error)
+    return results
@@ -0,0 +1,14 @@
+from ..base.category_index import CategoryIndex
+
+
+async def fetch_category_index(categories_client, *, storefront=None, locale=None):
+    """Fetch the category tree through an async ``Categories`` client and index
+    it, see ``CategoryIndex``."""
+    storefront = storefront or categories_client.storefront
+    params = {"storefront": storefront}
+    if locale:
+        params["locale"] = locale
+    response = await categories_client.get_category_tree(**params)
+    return CategoryIndex.from_payload(
+        response.payload, storefront=storefront, locale=locale
+    )
@@ -0,0 +1,23 @@
+from ..base.changes import ChangeSync as _ChangeSync
+
+
+class ChangeSync(_ChangeSync):
+    """Async counterpart of ``kaufland.base.changes.ChangeSync``.
+
+    ``client`` is a ``kaufland.asyncio.Session`` or generated async client. The
+    checkpoint is read and written synchronously; the JSON and sqlite checkpoints
+    are local and small enough for that::
+
+        sync = ChangeSync(session, SqliteCheckpoint("changes.db"))
+        async for upsert in sync.changes("order_units", storefront="de"):
+            await db.upsert(upsert.key, upsert.item)
+    """
+
+    async def changes(self, resource, *, storefront=None, **filters):
+        """Yield an ``Upsert`` per item created or changed since the last run."""
+        method, run, params = self._begin(resource, storefront, filters)
+        async for item in method(**params):
+            upsert = run.accept(item)
+            if upsert is not None:
+                yield upsert
+        self._commit(run)
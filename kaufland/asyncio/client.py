@@ -1,9 +1,12 @@
+import asyncio
 import logging
 
-from ..base._core import parse_response, prepare_request, resolve_method
+from ..base._core import parse_response, resolve_method
 from ..base.ApiResponse import ApiResponse
 from ..base.base_client import BaseClient
+from ..base.batch import resolve_callable
 from ._transport_httpx import HttpxAsyncTransport
+from .batch import map_concurrent
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -29,6 +32,13 @@ class Client(BaseClient):
         timeout=None,
         version=None,
         credential_providers=None,
+        transport=None,
+        limits=None,
+        http2=False,
+        rate_limiter=None,
+        retry=None,
+        circuit_breaker=None,
+        cache=None,
     ):
         super().__init__(
             account=account,
@@ -45,12 +55,25 @@ class Client(BaseClient):
             verify=verify,
             timeout=timeout,
             version=version,
+            limits=limits,
+            http2=http2,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            cache=cache,
         )
 
         self.version = version
-        self._transport = HttpxAsyncTransport(
-            timeout=timeout, proxies=proxies, verify=verify
-        )
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = HttpxAsyncTransport(
+                timeout=timeout,
+                proxies=proxies,
+                verify=verify,
+                limits=limits,
+                http2=http2,
+            )
+        self._transport = transport
 
     async def _request(
         self,
@@ -68,34 +91,64 @@ class Client(BaseClient):
         method, params, data = resolve_method(params, data, method=method)
         self.method = method
 
-        log.debug("HTTP Method: %s", method)
-        log.debug("Request path: %s", path)
-        log.debug("Request Params: %s", params)
-        log.debug("Request Data: %s", data)
-        request_headers = headers or self.headers
-        log.debug("Request Headers: %s", request_headers)
-
-        prepared = prepare_request(
-            method=method,
-            endpoint=self.endpoint,
-            path=path,
-            params=params,
-            data=data,
-            headers=request_headers,
-            add_storefront=add_storefront,
-            storefront=self.storefront,
-            version=self.version,
-            client_key=self.client_key,
-            secret_key=self.secret_key,
-            user_agent=self.user_agent,
-            partner_client_key=self.partner_client_key,
-            partner_secret_key=self.partner_secret_key,
-            signature_encoding=self.signature_encoding,
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("HTTP Method: %s", method)
+            log.debug("Request path: %s", path)
+            log.debug("Request Params: %s", params)
+            log.debug("Request Data: %s", data)
+            log.debug("Request Headers: %s", headers or self.headers)
+        # RequestSigner.prepare adds the default headers
+        request_headers = headers
+
+        cache_entry = self._cache_entry(method, path, params, add_storefront)
+        if cache_entry is None:
+            try:
+                res = await self._send(
+                    method, path, params, data, request_headers, add_storefront
+                )
+            finally:
+                # a failed write may still have been applied
+                self._invalidate_cache(method, path)
+        else:
+            res = await self.cache.afetch(
+                *cache_entry,
+                lambda: self._send(
+                    method, path, params, data, request_headers, add_storefront
+                ),
+            )
+        return self._check_response(res, res_no_data, bulk, wrap_list, method=method)
+
+    async def _send(self, method, path, params, data, request_headers, add_storefront):
+        attempt = 0
+        while True:
+            attempt += 1
+            delay = self._admit(path)
+            if delay > 0:
+                log.debug("Rate limited, waiting %.3fs", delay)
+                await asyncio.sleep(delay)
+
+            # Signed per attempt, so every retry carries a fresh Shop-Timestamp.
+            prepared = self._prepare(
+                method, path, params, data, request_headers, add_storefront
+            )
+            log.debug("Making request to URL: %s", prepared["url"])
+            try:
+                res = await self._transport.request(**prepared)
+            except Exception as exc:
+                self._observe(path, error=exc)
+                delay = self._retry_delay(attempt, method, error=exc)
+                if delay is None:
+                    raise
+            else:
+                self._observe(path, response=res)
+                delay = None
+                if res.status_code >= 400:
+                    delay = self._retry_delay(attempt, method, response=res)
+                if delay is None:
+                    return res
 
-        log.debug("Making request to URL: %s", prepared["url"])
-        res = await self._transport.request(**prepared)
-        return self._check_response(res, res_no_data, bulk, wrap_list)
+            log.debug("Retrying %s %s in %.3fs", method, path, delay)
+            await asyncio.sleep(delay)
 
     def _check_response(
         self,
@@ -103,10 +156,12 @@ class Client(BaseClient):
         res_no_data: bool = False,
         bulk: bool = False,
         wrap_list: bool = False,
+        method: str | None = None,
     ) -> ApiResponse:
+        # self.method is shared by concurrent requests; prefer the explicit method
         response = parse_response(
             res,
-            method=self.method,
+            method=method or self.method,
             res_no_data=res_no_data,
             bulk=bulk,
             wrap_list=wrap_list,
@@ -114,8 +169,26 @@ class Client(BaseClient):
         log.debug("Response: %s", response)
         return response
 
+    def map(self, method, iterable, *, concurrency=8, ordered=True, **kwargs):
+        """Call ``method`` for every input with bounded concurrency.
+
+        ``method`` is a generated method or its name on this client. Returns an
+        async iterator of ``BatchResult``, see ``kaufland.asyncio.batch``::
+
+            async for result in client.map("get_order_unit", ids, concurrency=32):
+                ...
+        """
+        return map_concurrent(
+            resolve_callable(self, method),
+            iterable,
+            concurrency=concurrency,
+            ordered=ordered,
+            **kwargs,
+        )
+
     async def close(self):
-        await self._transport.close()
+        if self._owns_transport:
+            await self._transport.close()
 
     async def __aenter__(self):
         return self
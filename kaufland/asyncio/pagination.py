@@ -0,0 +1,100 @@
+import asyncio
+
+from ..base.pagination import next_offset, page_items, page_total
+
+
+async def paginate(
+    method, *args, max_limit=None, concurrency=None, ordered=True, **kwargs
+):
+    """Yield every page of a list endpoint as an ApiResponse.
+
+    ``limit`` defaults to ``max_limit``, the largest page size the endpoint allows;
+    ``offset`` sets the first item. Pages are fetched one after another unless
+    ``concurrency`` is set, see ``paginate_parallel``.
+    """
+    if concurrency:
+        async for page in paginate_parallel(
+            method,
+            *args,
+            max_limit=max_limit,
+            concurrency=concurrency,
+            ordered=ordered,
+            **kwargs,
+        ):
+            yield page
+        return
+
+    limit = kwargs.pop("limit", None) or max_limit
+    offset = kwargs.pop("offset", None) or 0
+    if limit:
+        kwargs["limit"] = limit
+    while offset is not None:
+        response = await method(*args, offset=offset, **kwargs)
+        yield response
+        offset = next_offset(response.payload, offset, limit)
+
+
+async def paginate_parallel(
+    method, *args, max_limit=None, concurrency=8, ordered=True, **kwargs
+):
+    """Yield every page of a list endpoint, fetching up to ``concurrency`` pages
+    at once.
+
+    The first page is fetched alone; its ``pagination.total`` and item count fix
+    every remaining offset, so a server capping pages below ``limit`` still has all
+    of its items fetched. With ``ordered=False`` pages are yielded as they complete.
+    At most ``concurrency`` pages are in flight or buffered at any time.
+    """
+    limit = kwargs.pop("limit", None) or max_limit
+    offset = kwargs.pop("offset", None) or 0
+    if limit:
+        kwargs["limit"] = limit
+
+    first = await method(*args, offset=offset, **kwargs)
+    yield first
+    count = len(page_items(first.payload))
+    total = page_total(first.payload)
+    if total is None or not count:
+        # Without a total the remaining offsets are unknown; walk them serially.
+        start = next_offset(first.payload, offset, limit)
+        if start is not None:
+            async for page in paginate(method, *args, offset=start, **kwargs):
+                yield page
+        return
+
+    # Step by what the server returned, it may cap pages below the requested limit.
+    offsets = iter(range(offset + count, total, count))
+
+    def fetch(page_offset):
+        return asyncio.ensure_future(method(*args, offset=page_offset, **kwargs))
+
+    pending = [fetch(o) for _, o in zip(range(concurrency), offsets)]
+    try:
+        while pending:
+            if ordered:
+                task = pending.pop(0)
+                page = await task
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                pending.remove(task)
+                page = task.result()
+            next_page = next(offsets, None)
+            if next_page is not None:
+                pending.append(fetch(next_page))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def iter_items(method, *args, max_limit=None, **kwargs):
+    """Yield every item of a list endpoint, fetching it page by page.
+
+    Accepts ``concurrency`` and ``ordered`` like ``paginate``.
+    """
+    async for page in paginate(method, *args, max_limit=max_limit, **kwargs):
+        for item in page_items(page.payload):
+            yield item
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+
+from ..base._core import raise_for_status
+from ..base.exceptions import ApiException, ReportException
+from ..base.reports import CsvStream, report_state, request_method
+from .batch import map_concurrent
+
+log = logging.getLogger(__name__)
+
+
+class ReportManager:
+    """Async counterpart of ``kaufland.base.reports.ReportManager``."""
+
+    def __init__(
+        self,
+        reports_client,
+        *,
+        poll_interval=2.0,
+        max_interval=60.0,
+        backoff=1.5,
+        timeout=3600.0,
+        chunk_size=65536,
+        concurrency=8,
+    ):
+        self.client = reports_client
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+
+    async def request(self, report, **kwargs):
+        response = await request_method(self.client, report)(**kwargs)
+        return response.payload["data"]["id_report"]
+
+    async def get(self, id_report, **kwargs):
+        return (await self.client.get_report(id_report, **kwargs)).payload["data"]
+
+    async def wait(self, id_report, **kwargs):
+        async for report in self.as_completed([id_report], **kwargs):
+            return report
+
+    async def as_completed(self, ids, **kwargs):
+        pending = {id_report: None for id_report in ids}
+        deadline = time.monotonic() + self.timeout
+        interval = self.poll_interval
+        while pending:
+            changed = False
+            async for result in map_concurrent(
+                self.get, list(pending), concurrency=self.concurrency, **kwargs
+            ):
+                report = result.unwrap()
+                id_report = result.item
+                state = report_state(report)
+                if state == "failed":
+                    raise ReportException(
+                        f"Report {id_report} failed with status {report['status']}",
+                        report,
+                    )
+                if state == "done":
+                    del pending[id_report]
+                    yield report
+                    continue
+                changed = changed or pending[id_report] != report.get("status")
+                pending[id_report] = report.get("status")
+            if not pending:
+                return
+            if time.monotonic() + interval > deadline:
+                raise ReportException(
+                    f"Reports {sorted(pending)} not done after {self.timeout}s"
+                )
+            interval = (
+                self.poll_interval
+                if changed
+                else min(interval * self.backoff, self.max_interval)
+            )
+            log.debug("Reports %s pending, polling again in %.1fs", pending, interval)
+            await asyncio.sleep(interval)
+
+    async def iter_bytes(self, report):
+        url = report if isinstance(report, str) else report["url"]
+        transport = self.client._transport
+        if not hasattr(transport, "stream"):
+            response = await transport.request(method="GET", url=url)
+            yield raise_for_status(response).content
+            return
+        async with transport.stream(method="GET", url=url) as response:
+            if response.status_code >= 400:
+                body = b"".join([chunk async for chunk in response.aiter_bytes()])
+                raise ApiException(
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    text=body.decode("utf-8", errors="replace"),
+                )
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                yield chunk
+
+    async def rows(self, report, *, delimiter=None, header=True):
+        parser = CsvStream(delimiter=delimiter, header=header)
+        async for chunk in self.iter_bytes(report):
+            for row in parser.feed(chunk):
+                yield row
+        for row in parser.close():
+            yield row
+
+    async def download(self, report, path):
+        with open(path, "wb") as f:
+            async for chunk in self.iter_bytes(report):
+                f.write(chunk)
+        return path
@@ -0,0 +1,12 @@
+from ..base.session import EndpointGroups
+from .client import Client
+
+
+class Session(EndpointGroups, Client):
+    """Async client that shares one connection pool across all endpoint groups.
+
+    Endpoint groups are exposed as attributes named after their module, e.g.
+    ``session.units`` or ``session.order_units``.
+    """
+
+    api_package = "kaufland.asyncio.api"
@@ -0,0 +1,339 @@
+import asyncio
+import hashlib
+import hmac
+import inspect
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from ..base import json_codec
+from ..base._core import sign_request, signing_key
+
+log = logging.getLogger(__name__)
+
+
+def default_event_id(event, body):
+    """Use the event's own id if it has one, else a digest of the body."""
+    if isinstance(event, dict):
+        for key in ("id_event", "event_id", "id"):
+            if event.get(key) is not None:
+                return str(event[key])
+    return hashlib.sha256(body).hexdigest()
+
+
+class WebhookReceiver:
+    """ASGI app receiving the callbacks registered with
+    ``Subscriptions.add_subscription``.
+
+    Every request must carry ``Shop-Timestamp`` and a ``Shop-Signature`` computed
+    like an API request signature (``sign_request`` over method, callback URL,
+    body and timestamp) with ``secret_key``. Timestamps older than ``max_age``
+    seconds are rejected. Redelivered events are acknowledged without being
+    queued again; ``event_id`` extracts the id used for that.
+
+    Accepted events go to a bounded queue. ``workers`` tasks hand them to
+    ``handler`` in lists of up to ``batch_size``, waiting at most ``batch_wait``
+    seconds to fill a batch; ``handler`` may be sync (run in a thread) or async.
+    When the queue stays full for ``enqueue_timeout`` seconds the request is
+    answered with 503 so the sender delivers it again later.
+
+    Delivery to ``handler`` is at most once: events are answered with 200 and
+    marked as seen when queued, so a batch whose handler raises is not delivered
+    again. It is passed to ``on_error(batch, exc)`` instead, sync or async like
+    ``handler``, e.g. to write it to a dead-letter store; without ``on_error``
+    the failure is only logged.
+
+    ``url`` is the public callback URL the sender signs; without it the URL is
+    rebuilt from the request, which is wrong behind proxies that rewrite it.
+    """
+
+    def __init__(
+        self,
+        handler,
+        *,
+        secret_key=None,
+        url=None,
+        signature_encoding="hex",
+        max_age=300,
+        event_id=default_event_id,
+        queue_size=10000,
+        batch_size=100,
+        batch_wait=0.5,
+        workers=1,
+        enqueue_timeout=1.0,
+        dedup_size=100000,
+        max_body=1024 * 1024,
+        on_error=None,
+    ):
+        secret_key = secret_key or os.environ.get("KAUFLAND_SECRET_KEY")
+        if not secret_key:
+            raise ValueError("secret_key is required to verify webhook signatures")
+        self.handler = handler
+        self.url = url
+        self.signature_encoding = signature_encoding
+        self.max_age = max_age
+        self.event_id = event_id
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.workers = workers
+        self.enqueue_timeout = enqueue_timeout
+        self.dedup_size = dedup_size
+        self.max_body = max_body
+        self.on_error = on_error
+        self.stats = {
+            "accepted": 0,
+            "duplicates": 0,
+            "rejected": 0,
+            "throttled": 0,
+            "handled": 0,
+            "failed": 0,
+        }
+        self._key = signing_key(secret_key)
+        self._seen = OrderedDict()
+        self._queue = None
+        self._tasks = []
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Hand every queued event to the handler, then stop the workers."""
+        if not self._tasks:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            status, body = await self._handle(scope, receive)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": [(b"content-type", b"application/json")],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _read(self, receive):
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    def _request_url(self, scope, headers):
+        if self.url:
+            return self.url
+        host = headers.get("host") or "{}:{}".format(*scope["server"])
+        url = f"{scope.get('scheme', 'http')}://{host}{scope['path']}"
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        return url
+
+    def verify(self, method, url, body, timestamp, signature):
+        """Return True if ``signature`` is valid and ``timestamp`` recent."""
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            return False
+        if not signature or abs(time.time() - timestamp) > self.max_age:
+            return False
+        try:
+            signature = signature.encode("latin-1")
+            body = body.decode("utf-8")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            # the sender signs UTF-8 text; anything else cannot match
+            return False
+        expected = sign_request(
+            method, url, body, timestamp, self._key, encoding=self.signature_encoding
+        )
+        return hmac.compare_digest(expected.encode("ascii"), signature)
+
+    def _reject(self, status, message):
+        self.stats["rejected"] += 1
+        return status, b'{"error": "%s"}' % message.encode()
+
+    async def _handle(self, scope, receive):
+        if scope["method"] != "POST":
+            return self._reject(405, "method not allowed")
+        headers = {
+            k.decode("latin-1").lower(): v.decode("latin-1")
+            for k, v in scope["headers"]
+        }
+        body = await self._read(receive)
+        if body is None:
+            return self._reject(413, "body too large")
+        if not self.verify(
+            "POST",
+            self._request_url(scope, headers),
+            body,
+            headers.get("shop-timestamp"),
+            headers.get("shop-signature"),
+        ):
+            return self._reject(401, "invalid signature")
+        try:
+            event = json_codec.codec.loads(body)
+        except ValueError:
+            return self._reject(400, "invalid json")
+
+        event_id = self.event_id(event, body)
+        if event_id in self._seen:
+            self.stats["duplicates"] += 1
+            return 200, b'{"status": "duplicate"}'
+        # claimed before waiting on the queue, so concurrent redeliveries are dropped
+        self._seen[event_id] = None
+        if len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
+        await self.start()
+        try:
+            await asyncio.wait_for(self._queue.put(event), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self._seen.pop(event_id, None)
+            self.stats["throttled"] += 1
+            return 503, b'{"error": "busy"}'
+        self.stats["accepted"] += 1
+        return 200, b'{"status": "accepted"}'
+
+    async def _next_batch(self):
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    @staticmethod
+    async def _call(func, *args):
+        if inspect.iscoroutinefunction(func):
+            await func(*args)
+        else:
+            await asyncio.to_thread(func, *args)
+
+    async def _work(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._call(self.handler, batch)
+                self.stats["handled"] += len(batch)
+            except Exception as exc:
+                self.stats["failed"] += len(batch)
+                await self._failed(batch, exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _failed(self, batch, exc):
+        if self.on_error is None:
+            log.error(
+                "Webhook handler failed for %d events, dropping them",
+                len(batch),
+                exc_info=exc,
+            )
+            return
+        try:
+            await self._call(self.on_error, batch, exc)
+        except Exception:
+            log.exception("on_error failed for %d events", len(batch))
+
+
+class WebhookReplayer:
+    """Local stand-in for the Kaufland side: signs events and posts them to a
+    receiver app in-process, for tests and load runs."""
+
+    def __init__(
+        self,
+        app,
+        *,
+        secret_key,
+        url="http://testserver/webhooks",
+        signature_encoding="hex",
+    ):
+        self.url = url
+        self.signature_encoding = signature_encoding
+        self._key = signing_key(secret_key)
+        # only the replayer needs httpx; receivers start without it
+        import httpx
+
+        self._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+
+    async def send(self, event, *, timestamp=None, signature=None):
+        body = event if isinstance(event, bytes) else json_codec.codec.dumps(event)
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        if signature is None:
+            signature = sign_request(
+                "POST",
+                self.url,
+                body.decode("utf-8"),
+                timestamp,
+                self._key,
+                encoding=self.signature_encoding,
+            )
+        return await self._client.post(
+            self.url,
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "Shop-Timestamp": str(timestamp),
+                "Shop-Signature": signature,
+            },
+        )
+
+    async def replay(self, events, *, concurrency=16):
+        """Post every event, up to ``concurrency`` at a time, and return the
+        responses in order."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post(event):
+            async with semaphore:
+                return await self.send(event)
+
+        return await asyncio.gather(*map(post, events))
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -1,9 +1,57 @@
+from . import json_codec
+
+_PENDING = object()
+
+
 class ApiResponse:
-    def __init__(self, payload=None, headers=None, status_code=None, raw=None):
-        self.payload = payload
+    __slots__ = ("_payload", "_raw", "_wrap", "content", "headers", "status_code")
+
+    def __init__(
+        self, payload=None, headers=None, status_code=None, raw=None, content=None
+    ):
+        self._payload = payload
+        self._raw = raw
+        self._wrap = None
+        self.content = content
         self.headers = headers or {}
         self.status_code = status_code
-        self.raw = raw
+
+    @classmethod
+    def from_content(cls, content, *, headers=None, status_code=None, wrap=None):
+        """Build a response whose payload is decoded from ``content`` on first
+        access. A list payload is wrapped as ``{wrap: payload}`` if ``wrap`` is
+        given."""
+        response = cls(headers=headers, status_code=status_code, content=content)
+        response._payload = _PENDING
+        response._wrap = wrap
+        return response
+
+    @property
+    def payload(self):
+        payload = self._payload
+        if payload is _PENDING:
+            try:
+                payload = json_codec.codec.loads(self.content)
+            except ValueError:
+                payload = self.content.decode("utf-8", errors="replace")
+            if self._wrap and isinstance(payload, list):
+                payload = {self._wrap: payload}
+            self._payload = payload
+        return payload
+
+    @payload.setter
+    def payload(self, value):
+        self._payload = value
+
+    @property
+    def raw(self):
+        if self._raw is None and self.content is not None:
+            return self.content.decode("utf-8", errors="replace")
+        return self._raw
+
+    @raw.setter
+    def raw(self, value):
+        self._raw = value
 
     @property
     def errors(self):
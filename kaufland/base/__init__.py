@@ -1,16 +1,41 @@
+from ._transport_httpx import HttpxTransport, WSGITransport
 from .ApiResponse import ApiResponse
 from .base_client import BaseClient
+from .cache import MemoryCache, ResponseCache, SqliteCache
+from .circuit_breaker import CircuitBreaker
 from .client import Client
-from .decorators import fill_query_params, kaufland_endpoint
-from .exceptions import ApiException, KauflandException, MissingCredentialsException
+from .decorators import Route, fill_query_params, kaufland_endpoint
+from .exceptions import (
+    ApiException,
+    CircuitOpenException,
+    KauflandException,
+    MissingCredentialsException,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .session import Session
+from .transport import AsyncTransport, Transport
 
 __all__ = [
     "ApiResponse",
     "BaseClient",
     "Client",
+    "Session",
+    "Transport",
+    "AsyncTransport",
+    "HttpxTransport",
+    "WSGITransport",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "ResponseCache",
+    "MemoryCache",
+    "SqliteCache",
+    "Route",
     "fill_query_params",
     "kaufland_endpoint",
     "ApiException",
+    "CircuitOpenException",
     "KauflandException",
     "MissingCredentialsException",
 ]
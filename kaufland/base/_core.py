@@ -1,47 +1,134 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import hmac
-import json
+import re
 import time
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode, urlsplit
 
+from . import json_codec
 from .ApiResponse import ApiResponse
 from .exceptions import ApiException
 
+# Characters ``quote``/``quote_plus`` never escape; such strings are used as is.
+is_safe = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
+
+
+def signing_key(secret_key: str) -> tuple:
+    """Return the HMAC-SHA256 inner and outer hash states keyed with ``secret_key``.
+
+    Keying derives the inner and outer pads once; ``sign_request`` copies the
+    keyed states instead of re-deriving them for every request.
+    """
+    key = secret_key.encode("utf-8")
+    if len(key) > 64:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(64, b"\0")
+    return (
+        hashlib.sha256(bytes(b ^ 0x36 for b in key)),
+        hashlib.sha256(bytes(b ^ 0x5C for b in key)),
+    )
+
+
+def _sign(key, message: bytes, encoding: str) -> str:
+    if isinstance(key, tuple):
+        inner, mac = key[0].copy(), key[1].copy()
+        inner.update(message)
+        mac.update(inner.digest())
+    else:
+        # a keyed hmac.HMAC
+        mac = key.copy()
+        mac.update(message)
+    if encoding == "base64":
+        return base64.b64encode(mac.digest()).decode("ascii")
+    return mac.hexdigest()
+
 
 def sign_request(
     method: str,
     uri: str,
     body: str,
     timestamp: int,
-    secret_key: str,
+    secret_key: str | tuple | hmac.HMAC,
     *,
     encoding: str = "hex",
 ) -> str:
-    string = "\n".join([method, uri, body or "", str(timestamp)])
-    digest = hmac.new(
-        secret_key.encode("utf-8"), string.encode("utf-8"), hashlib.sha256
-    ).digest()
-    if encoding == "base64":
-        return base64.b64encode(digest).decode("ascii")
-    return digest.hex()
+    if isinstance(secret_key, str):
+        secret_key = signing_key(secret_key)
+    message = f"{method}\n{uri}\n{body or ''}\n{timestamp}".encode()
+    return _sign(secret_key, message, encoding)
+
+
+def endpoint_group(path: str) -> str:
+    """Return the first segment of an API path, e.g. ``units`` for ``/units/1``."""
+    if "://" in path:
+        segments = urlsplit(path).path.strip("/").split("/")
+        if len(segments) > 1 and segments[0][:1] == "v" and segments[0][1:].isdigit():
+            segments = segments[1:]
+    else:
+        segments = path.split("?", 1)[0].strip("/").split("/")
+    return segments[0]
 
 
-def _build_url(endpoint: str, path: str, params: dict | None) -> str:
-    if path.startswith("http://") or path.startswith("https://"):
-        base = path
-    else:
-        base = endpoint.rstrip("/") + ("/" + path.lstrip("/"))
+# Exact types encoded by _query_pair; str and int subclasses may format differently.
+_PLAIN = frozenset({str, int, float})
+
+
+def _quote(value) -> str:
+    value = value if isinstance(value, str) else str(value)
+    return value if is_safe(value) else quote_plus(value)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _query_pair(key, value) -> str:
+    return f"{_quote(key)}={_quote(value)}"
+
 
-    if not params:
-        return base
+def encode_query(params: dict) -> str:
+    """Return ``urlencode(params, doseq=True)``.
 
-    query = urlencode(params, doseq=True)
-    if "?" in base:
-        return f"{base}&{query}"
-    return f"{base}?{query}"
+    Strings, numbers and lists or tuples of them are encoded directly and the
+    encoded pairs are cached, as the same storefronts, page sizes and filters recur
+    from request to request; anything else, including subclasses such as enums,
+    goes through ``urlencode``.
+    """
+    parts = []
+    for key, value in params.items():
+        if type(value) in _PLAIN:
+            parts.append(_query_pair(key, value))
+        elif type(value) in (list, tuple) and all(
+            type(item) in _PLAIN for item in value
+        ):
+            parts.extend([_query_pair(key, item) for item in value])
+        else:
+            query = urlencode({key: value}, doseq=True)
+            if query:
+                parts.append(query)
+    return "&".join(parts)
+
+
+def request_url(endpoint, path, params, add_storefront, storefront, version):
+    if version and "<version>" in path:
+        path = path.replace("<version>", version)
+
+    if path.startswith(("http://", "https://")):
+        url = path
+    else:
+        url = endpoint.rstrip("/") + "/" + path.lstrip("/")
+
+    query = encode_query(params) if params else ""
+    if add_storefront and storefront and not (params and "storefront" in params):
+        storefront = (
+            _query_pair("storefront", storefront)
+            if type(storefront) in _PLAIN
+            else encode_query({"storefront": storefront})
+        )
+        query = f"{query}&{storefront}" if query else storefront
+    if not query:
+        return url
+    return f"{url}&{query}" if "?" in url else f"{url}?{query}"
 
 
 def _encode_body(data):
@@ -54,13 +141,17 @@ def _encode_body(data):
     if isinstance(data, str):
         body_bytes = data.encode("utf-8")
         return data, body_bytes
-    body_str = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-    return body_str, body_str.encode("utf-8")
+    body_bytes = json_codec.codec.dumps(data)
+    return body_bytes.decode("utf-8"), body_bytes
 
 
 def _header_value(headers, name):
     if not headers:
         return None
+    # httpx.Headers and exact-case dict keys answer without a scan.
+    value = headers.get(name)
+    if value is not None or not isinstance(headers, dict):
+        return value
     name = name.lower()
     for key, value in headers.items():
         if key.lower() == name:
@@ -89,6 +180,79 @@ def resolve_method(params, data, method=None):
     return ("POST" if data is not None else "GET"), params, data
 
 
+class RequestSigner:
+    """Signs requests with one set of credentials.
+
+    The HMAC states are keyed once, so ``prepare`` only encodes the body, hashes
+    the request and builds the headers.
+    """
+
+    __slots__ = (
+        "client_key",
+        "user_agent",
+        "partner_client_key",
+        "encoding",
+        "_key",
+        "_partner_key",
+    )
+
+    def __init__(
+        self,
+        client_key: str,
+        secret_key: str | tuple | hmac.HMAC,
+        user_agent: str,
+        *,
+        partner_client_key: str | None = None,
+        partner_secret_key: str | tuple | hmac.HMAC | None = None,
+        encoding: str = "hex",
+    ):
+        if isinstance(secret_key, str):
+            secret_key = signing_key(secret_key)
+        if isinstance(partner_secret_key, str):
+            partner_secret_key = signing_key(partner_secret_key)
+        self.client_key = client_key
+        self.user_agent = user_agent
+        self.encoding = encoding
+        self._key = secret_key
+        if partner_client_key and partner_secret_key:
+            self.partner_client_key = partner_client_key
+            self._partner_key = partner_secret_key
+        else:
+            self.partner_client_key = self._partner_key = None
+
+    def prepare(self, method: str, url: str, data=None, headers: dict | None = None):
+        """Return the keyword arguments for ``Transport.request``."""
+        body_str, body_bytes = ("", None) if data is None else _encode_body(data)
+
+        header_timestamp = headers and _header_value(headers, "Shop-Timestamp")
+        timestamp = int(header_timestamp) if header_timestamp else int(time.time())
+        message = f"{method}\n{url}\n{body_str}\n{timestamp}".encode()
+
+        request_headers = {
+            "Accept": "application/json",
+            "Shop-Client-Key": self.client_key,
+            "Shop-Timestamp": str(timestamp),
+            "Shop-Signature": _sign(self._key, message, self.encoding),
+            "User-Agent": self.user_agent,
+        }
+        if self._partner_key is not None:
+            request_headers["Shop-Partner-Client-Key"] = self.partner_client_key
+            request_headers["Shop-Partner-Signature"] = _sign(
+                self._partner_key, message, self.encoding
+            )
+        if body_bytes is not None:
+            request_headers["Content-Type"] = "application/json"
+        if headers:
+            request_headers.update(headers)
+
+        return {
+            "method": method,
+            "url": url,
+            "headers": request_headers,
+            "content": body_bytes,
+        }
+
+
 def prepare_request(
     *,
     method: str,
@@ -101,58 +265,44 @@ def prepare_request(
     storefront: str | None,
     version: str | None,
     client_key: str,
-    secret_key: str,
+    secret_key: str | tuple | hmac.HMAC,
     user_agent: str,
     partner_client_key: str | None,
-    partner_secret_key: str | None,
+    partner_secret_key: str | tuple | hmac.HMAC | None,
     signature_encoding: str,
 ):
-    params = dict(params or {})
-    if add_storefront and storefront and "storefront" not in params:
-        params["storefront"] = storefront
-
-    if version and "<version>" in path:
-        path = path.replace("<version>", version)
+    signer = RequestSigner(
+        client_key,
+        secret_key,
+        user_agent,
+        partner_client_key=partner_client_key,
+        partner_secret_key=partner_secret_key,
+        encoding=signature_encoding,
+    )
+    url = request_url(endpoint, path, params, add_storefront, storefront, version)
+    return signer.prepare(method, url, data, headers)
 
-    url = _build_url(endpoint, path, params)
-    body_str, body_bytes = _encode_body(data)
 
-    header_timestamp = _header_value(headers, "Shop-Timestamp")
-    timestamp = int(header_timestamp) if header_timestamp else int(time.time())
+def _decode_payload(res, content):
+    if content is None:
+        try:
+            return res.json()
+        except ValueError:
+            return res.text or ""
+    try:
+        return json_codec.codec.loads(content)
+    except ValueError:
+        return res.text or ""
 
-    signature = sign_request(
-        method, url, body_str, timestamp, secret_key, encoding=signature_encoding
-    )
 
-    request_headers = {
-        "Accept": "application/json",
-        "Shop-Client-Key": client_key,
-        "Shop-Timestamp": str(timestamp),
-        "Shop-Signature": signature,
-        "User-Agent": user_agent,
-    }
-    if partner_client_key and partner_secret_key:
-        partner_signature = sign_request(
-            method,
-            url,
-            body_str,
-            timestamp,
-            partner_secret_key,
-            encoding=signature_encoding,
+def raise_for_status(res):
+    """Raise ``ApiException`` for an error response to a request outside the API,
+    such as a pre-signed file URL, and return ``res`` otherwise."""
+    if res.status_code >= 400:
+        raise ApiException(
+            status_code=res.status_code, headers=res.headers, text=res.text or ""
         )
-        request_headers["Shop-Partner-Client-Key"] = partner_client_key
-        request_headers["Shop-Partner-Signature"] = partner_signature
-    if body_bytes is not None:
-        request_headers["Content-Type"] = "application/json"
-    if headers:
-        request_headers.update(headers)
-
-    return {
-        "method": method,
-        "url": url,
-        "headers": request_headers,
-        "content": body_bytes,
-    }
+    return res
 
 
 def parse_response(
@@ -164,15 +314,19 @@ def parse_response(
     wrap_list: bool = False,
 ):
     status = res.status_code
-    headers = dict(res.headers)
-    text = res.text or ""
+    headers = res.headers
+    content = getattr(res, "content", None)
+    has_payload = not res_no_data and status != 204
+
+    if status < 400 and has_payload and content is not None:
+        wrap = "responses" if bulk else "payload" if wrap_list else None
+        return ApiResponse.from_content(
+            content, headers=headers, status_code=status, wrap=wrap
+        )
 
     payload = None
-    if not res_no_data and status != 204:
-        try:
-            payload = res.json()
-        except ValueError:
-            payload = text
+    if has_payload:
+        payload = _decode_payload(res, content)
 
     if bulk and isinstance(payload, list):
         payload = {"responses": payload}
@@ -185,7 +339,13 @@ def parse_response(
             status_code=status,
             payload=payload,
             headers=headers,
-            text=text,
+            text=res.text or "",
         )
 
-    return ApiResponse(payload=payload, headers=headers, status_code=status, raw=text)
+    return ApiResponse(
+        payload=payload,
+        headers=headers,
+        status_code=status,
+        raw=(res.text or "") if content is None else None,
+        content=content,
+    )
@@ -0,0 +1,126 @@
+"""Column types of swagger schemas, generated by tools/generate_clients.py."""
+
+SCHEMAS = {
+    "OrderUnit": {
+        "id_order_unit": "int64",
+        "id_order": "string",
+        "ts_created_iso": "timestamp",
+        "is_marketplace_deemed_supplier": "bool",
+        "ts_updated_iso": "timestamp",
+        "status": "string",
+        "price": "int32",
+        "id_offer": "string",
+        "revenue_gross": "int32",
+        "revenue_net": "int32",
+        "note": "string",
+        "unit_condition": "string",
+        "storefront": "string",
+        "currency": "string",
+        "delivery_time_min": "int32",
+        "delivery_time_max": "int32",
+        "delivery_time_expires_iso": "timestamp",
+        "order_received_timestamp_iso": "timestamp",
+        "shipping_rate": "int32",
+        "cancel_reason": "string",
+        "fulfillment_type": "string",
+        "buyer": {"struct": {"id_buyer": "int64", "email": "string"}},
+        "billing_address": {
+            "struct": {
+                "first_name": "string",
+                "last_name": "string",
+                "company_name": "string",
+                "street": "string",
+                "house_number": "string",
+                "postcode": "string",
+                "additional_field": "string",
+                "city": "string",
+                "phone": "string",
+                "country": "string",
+            }
+        },
+        "shipping_address": {
+            "struct": {
+                "first_name": "string",
+                "last_name": "string",
+                "company_name": "string",
+                "street": "string",
+                "house_number": "string",
+                "postcode": "string",
+                "additional_field": "string",
+                "city": "string",
+                "phone": "string",
+                "country": "string",
+            }
+        },
+        "product": {
+            "struct": {
+                "id_product": "int64",
+                "storefront": "string",
+                "title": "string",
+                "eans": {"list": "string"},
+                "id_category": "int64",
+                "main_picture": "string",
+                "manufacturer": "string",
+                "url": "string",
+                "age_rating": "float64",
+                "is_valid": "bool",
+                "dangerous_goods_li_shipping": "string",
+                "danger_label_9A": "string",
+            }
+        },
+        "vat": "float32",
+        "eco_fee": "int32",
+        "packaging_fee": "int32",
+    },
+    "Report": {
+        "id_report": "int64",
+        "status": "string",
+        "date_requested": "string",
+        "url": "string",
+        "report_name": "string",
+        "storefront": "string",
+        "parameters": {"list": {"struct": {"name": "string", "value": "json"}}},
+    },
+    "Unit": {
+        "status": "string",
+        "currency": "string",
+        "id_unit": "int64",
+        "note": "string",
+        "condition": "string",
+        "listing_price": "int32",
+        "minimum_price": "int32",
+        "price": "int32",
+        "id_offer": "string",
+        "id_product": "int64",
+        "id_shipping_group": "int32",
+        "id_warehouse": "int32",
+        "amount": "int32",
+        "date_inserted_iso": "timestamp",
+        "date_lastchange_iso": "timestamp",
+        "handling_time": "int32",
+        "shipping_rate": "int32",
+        "storefront": "string",
+        "transport_time_min": "int32",
+        "transport_time_max": "int32",
+        "product": {
+            "struct": {
+                "id_product": "int64",
+                "storefront": "string",
+                "title": "string",
+                "eans": {"list": "string"},
+                "id_category": "int64",
+                "main_picture": "string",
+                "manufacturer": "string",
+                "url": "string",
+                "age_rating": "float64",
+                "is_valid": "bool",
+                "dangerous_goods_li_shipping": "string",
+                "danger_label_9A": "string",
+            }
+        },
+        "fulfillment_type": "string",
+        "vat_indicator": "string",
+        "eco_participation": "int32",
+        "battery_participation": "int32",
+    },
+}
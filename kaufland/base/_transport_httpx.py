@@ -1,22 +1,110 @@
-import httpx
+import functools
+import threading
+from contextlib import contextmanager
+
+
+@functools.lru_cache(maxsize=None)
+def shared_ssl_context(verify=True, http2=False):
+    """Return one SSL context per ``verify`` setting for the whole process.
+
+    Loading the CA bundle is the expensive part of creating an httpx client.
+    httpcore sets the ALPN protocols on the context per connection, so HTTP/2
+    clients get a context of their own.
+    """
+    import httpx
+
+    return httpx.create_ssl_context(verify=verify)
+
+
+def client_kwargs(*, timeout, proxies, verify, limits, http2, transport):
+    # imported here so that importing kaufland does not pay for httpx
+    import httpx
+
+    if transport is None and isinstance(verify, (bool, str)):
+        verify = shared_ssl_context(verify, bool(http2))
+    kwargs = {"timeout": timeout, "verify": verify}
+    if proxies is not None:
+        kwargs["proxies"] = proxies
+    if limits is not None:
+        if isinstance(limits, dict):
+            limits = httpx.Limits(**limits)
+        kwargs["limits"] = limits
+    if http2:
+        kwargs["http2"] = True
+    if transport is not None:
+        kwargs["transport"] = transport
+    return kwargs
+
+
+def build_client(factory, kwargs):
+    try:
+        return factory(**kwargs)
+    except TypeError as exc:
+        if "proxies" in kwargs:
+            kwargs["proxy"] = kwargs.pop("proxies")
+            return factory(**kwargs)
+        raise exc
 
 
 class HttpxTransport:
-    def __init__(self, *, timeout=None, proxies=None, verify=True):
-        kwargs = {"timeout": timeout, "verify": verify}
-        if proxies is not None:
-            kwargs["proxies"] = proxies
-        try:
-            self._client = httpx.Client(**kwargs)
-        except TypeError as exc:
-            if "proxies" in kwargs:
-                kwargs["proxy"] = kwargs.pop("proxies")
-                self._client = httpx.Client(**kwargs)
-            else:
-                raise exc
+    """Transport backed by an ``httpx.Client``.
+
+    The client is created on the first request, so constructing API clients that
+    never send anything stays cheap.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout=None,
+        proxies=None,
+        verify=True,
+        limits=None,
+        http2=False,
+        transport=None,
+    ):
+        self._options = {
+            "timeout": timeout,
+            "proxies": proxies,
+            "verify": verify,
+            "limits": limits,
+            "http2": http2,
+            "transport": transport,
+        }
+        self._httpx_client = None
+        self._lock = threading.Lock()
+
+    @property
+    def _client(self):
+        if self._httpx_client is None:
+            with self._lock:
+                if self._httpx_client is None:
+                    import httpx
+
+                    self._httpx_client = build_client(
+                        httpx.Client, client_kwargs(**self._options)
+                    )
+        return self._httpx_client
 
     def request(self, *, method, url, headers=None, content=None):
         return self._client.request(method, url, headers=headers, content=content)
 
+    @contextmanager
+    def stream(self, *, method, url, headers=None):
+        """Send a request and yield the response before its body is read; iterate
+        it with ``iter_bytes()``."""
+        with self._client.stream(method, url, headers=headers) as response:
+            yield response
+
     def close(self):
-        self._client.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+
+
+class WSGITransport(HttpxTransport):
+    """Routes requests in-process to a WSGI app, without sockets or network."""
+
+    def __init__(self, app, **kwargs):
+        import httpx
+
+        super().__init__(transport=httpx.WSGITransport(app=app), **kwargs)
@@ -0,0 +1,243 @@
+import csv
+import io
+import json
+import re
+from collections import defaultdict
+
+from ._core import raise_for_status
+from .batch import map_threaded
+
+# Locale of the shared-set files when none is given.
+STOREFRONT_LOCALES = {
+    "de": "de-DE",
+    "cz": "cs-CZ",
+    "sk": "sk-SK",
+    "pl": "pl-PL",
+    "at": "de-AT",
+    "fr": "fr-FR",
+    "it": "it-IT",
+}
+
+# Attribute types with a checkable value format, keyed by lower-cased type name.
+TYPE_PATTERNS = {
+    "int": re.compile(r"-?\d+"),
+    "integer": re.compile(r"-?\d+"),
+    "float": re.compile(r"-?\d+(?:[.,]\d+)?"),
+    "decimal": re.compile(r"-?\d+(?:[.,]\d+)?"),
+    "number": re.compile(r"-?\d+(?:[.,]\d+)?"),
+    "boolean": re.compile(r"(?i)true|false|yes|no|0|1"),
+}
+
+
+def valid_ean(ean) -> bool:
+    """Return True for a GTIN-8/12/13/14 with a correct check digit."""
+    ean = str(ean)
+    if len(ean) not in (8, 12, 13, 14) or not ean.isdigit():
+        return False
+    digits = [int(d) for d in reversed(ean[:-1])]
+    total = sum(d * (3 if i % 2 == 0 else 1) for i, d in enumerate(digits))
+    return (10 - total % 10) % 10 == int(ean[-1])
+
+
+def parse_shared_set_csv(text):
+    """Return the values of a shared-set CSV file."""
+    rows = csv.reader(io.StringIO(text))
+    header = next(rows, None)
+    if not header:
+        return set()
+    names = [name.strip().lower() for name in header]
+    if "value" in names:
+        column = names.index("value")
+    else:
+        # no header row, the first column holds the values
+        column = 0
+        rows = csv.reader(io.StringIO(text))
+    return {row[column] for row in rows if len(row) > column and row[column]}
+
+
+class ValidationIssue:
+    """A problem found in ``products[index]``; ``field`` is ``ean`` or the
+    attribute name."""
+
+    __slots__ = ("field", "index", "message", "value")
+
+    def __init__(self, index, field, message, value=None):
+        self.index = index
+        self.field = field
+        self.message = message
+        self.value = value
+
+    def __repr__(self):
+        return (
+            f"ValidationIssue(index={self.index}, field={self.field!r}, "
+            f"message={self.message!r}, value={self.value!r})"
+        )
+
+
+class AttributeRegistry:
+    """Local copy of the attribute definitions and shared-set values of one
+    storefront and locale.
+
+    Build it once with ``from_client`` (a paginated attribute listing plus one
+    shared-set file per shared-set attribute), keep it on disk with ``save`` and
+    ``load``, and ``validate`` product data before sending it.
+    """
+
+    def __init__(
+        self, attributes=(), shared_sets=None, *, storefront=None, locale=None
+    ):
+        self.storefront = storefront
+        self.locale = locale
+        self.attributes = {a["name"]: a for a in attributes}
+        self.shared_sets = {
+            name: set(values) for name, values in (shared_sets or {}).items()
+        }
+
+    def __len__(self):
+        return len(self.attributes)
+
+    def __contains__(self, name):
+        return name in self.attributes
+
+    def __getitem__(self, name):
+        return self.attributes[name]
+
+    @classmethod
+    def from_client(
+        cls,
+        attributes_client,
+        *,
+        storefront=None,
+        locale=None,
+        shared_sets=True,
+        max_workers=8,
+    ):
+        """Fetch all attributes and, if ``shared_sets``, the shared-set values of
+        every shared-set attribute through a sync ``Attributes`` client.
+
+        Raises ``ApiException`` if a shared-set file cannot be downloaded.
+        """
+        storefront = storefront or attributes_client.storefront
+        locale = locale or STOREFRONT_LOCALES.get(storefront)
+        params = {"storefront": storefront}
+        if locale:
+            params["locale"] = locale
+        attributes = list(attributes_client.iter_attribute_list(**params))
+        registry = cls(attributes, storefront=storefront, locale=locale)
+        if shared_sets:
+            shared = [
+                (attributes_client, a) for a in attributes if a.get("is_sharedset")
+            ]
+            for result in map_threaded(
+                registry._fetch_shared_set, shared, max_workers=max_workers
+            ):
+                registry.shared_sets[result.item[1]["name"]] = result.unwrap()
+        return registry
+
+    def _fetch_shared_set(self, attributes_client, attribute):
+        response = attributes_client.get_shared_set_csv_file_by_attribute_id(
+            attribute["id"], locale=self.locale
+        )
+        # a pre-signed URL outside the API, fetched over the client's pool; an
+        # expired URL answers with an XML error that must not become the value set
+        res = attributes_client._transport.request(
+            method="GET", url=response.payload["data"]
+        )
+        return parse_shared_set_csv(raise_for_status(res).text)
+
+    def validate(self, products, *, allow_unknown=False):
+        """Check ``ProductDataObject`` dicts and return a list of
+        ``ValidationIssue``.
+
+        Values are gathered per attribute across all products first, so every
+        distinct value is checked once however often it occurs. Checked are the
+        EANs, unknown attribute names (unless ``allow_unknown``), multiple values
+        for single-value attributes, shared-set membership and the value format of
+        the types in ``TYPE_PATTERNS``.
+        """
+        issues = []
+        columns = defaultdict(list)
+        for index, product in enumerate(products):
+            eans = product.get("ean") or []
+            if isinstance(eans, str):
+                eans = [eans]
+            if not eans:
+                issues.append(ValidationIssue(index, "ean", "missing EAN"))
+            for ean in eans:
+                if not valid_ean(ean):
+                    issues.append(ValidationIssue(index, "ean", "invalid EAN", ean))
+            for name, values in (product.get("attributes") or {}).items():
+                columns[name].append((index, values))
+
+        for name, column in columns.items():
+            attribute = self.attributes.get(name)
+            if attribute is None:
+                if not allow_unknown:
+                    issues.extend(
+                        ValidationIssue(index, name, "unknown attribute")
+                        for index, _ in column
+                    )
+                continue
+            issues.extend(self._check_column(name, attribute, column))
+        issues.sort(key=lambda issue: issue.index)
+        return issues
+
+    def _check_column(self, name, attribute, column):
+        allowed = self.shared_sets.get(name)
+        pattern = TYPE_PATTERNS.get(str(attribute.get("type", "")).lower())
+        single = not attribute.get("is_multiple", True)
+        invalid = {}
+
+        def check(value):
+            if allowed is not None and value not in allowed:
+                return "value not in shared set"
+            if pattern is not None and not pattern.fullmatch(value):
+                return f"not a valid {attribute['type']}"
+            return None
+
+        for index, values in column:
+            if not isinstance(values, list):
+                values = [values]
+            if single and len(values) > 1:
+                yield ValidationIssue(index, name, "attribute takes a single value")
+            for value in values:
+                if not isinstance(value, str):
+                    # objects such as product_safety_contact are passed through
+                    continue
+                if value not in invalid:
+                    invalid[value] = check(value)
+                if invalid[value] is not None:
+                    yield ValidationIssue(index, name, invalid[value], value)
+
+    def filter_valid(self, products, **kwargs):
+        """Return ``(valid_products, issues)``."""
+        products = list(products)
+        issues = self.validate(products, **kwargs)
+        invalid = {issue.index for issue in issues}
+        valid = [p for i, p in enumerate(products) if i not in invalid]
+        return valid, issues
+
+    def to_dict(self):
+        return {
+            "storefront": self.storefront,
+            "locale": self.locale,
+            "attributes": list(self.attributes.values()),
+            "shared_sets": {
+                name: sorted(values) for name, values in self.shared_sets.items()
+            },
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            data["attributes"],
+            data.get("shared_sets"),
+            storefront=data.get("storefront"),
+            locale=data.get("locale"),
+        )
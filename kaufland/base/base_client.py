@@ -1,5 +1,6 @@
 import os
 
+from ._core import RequestSigner, request_url, signing_key
 from .credential_provider import CredentialProvider
 
 
@@ -24,6 +25,12 @@ class BaseClient:
         verify=True,
         timeout=None,
         version=None,
+        limits=None,
+        http2=False,
+        rate_limiter=None,
+        retry=None,
+        circuit_breaker=None,
+        cache=None,
     ):
         if credentials is None:
             credentials = {}
@@ -62,12 +69,100 @@ class BaseClient:
         self.verify = verify
         self.timeout = timeout
         self.version = version
+        self.limits = limits
+        self.http2 = http2
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        self._signing_keys = {}
+        self._signer = self._signer_for = None
 
     def _check_version(self, path: str) -> str:
         if "<version>" not in path or not self.version:
             return path
         return path.replace("<version>", self.version)
 
+    def _signing_key(self, secret_key):
+        if not secret_key:
+            return None
+        key = self._signing_keys.get(secret_key)
+        if key is None:
+            key = self._signing_keys[secret_key] = signing_key(secret_key)
+        return key
+
+    def _request_signer(self) -> RequestSigner:
+        # Rebuilt only when the credentials on the client change.
+        credentials = (
+            self.client_key,
+            self.secret_key,
+            self.partner_client_key,
+            self.partner_secret_key,
+            self.signature_encoding,
+            self.user_agent,
+        )
+        if credentials != self._signer_for:
+            self._signer = RequestSigner(
+                self.client_key,
+                self._signing_key(self.secret_key),
+                self.user_agent,
+                partner_client_key=self.partner_client_key,
+                partner_secret_key=self._signing_key(self.partner_secret_key),
+                encoding=self.signature_encoding,
+            )
+            self._signer_for = credentials
+        return self._signer
+
+    def _prepare(self, method, path, params, data, headers, add_storefront):
+        url = request_url(
+            self.endpoint, path, params, add_storefront, self.storefront, self.version
+        )
+        return self._request_signer().prepare(method, url, data, headers)
+
+    def _cache_entry(self, method, path, params, add_storefront):
+        """Return ``(key, ttl)`` if the response may be served from the cache."""
+        if self.cache is None or method != "GET":
+            return None
+        ttl = self.cache.ttl(path)
+        if not ttl:
+            return None
+        url = request_url(
+            self.endpoint, path, params, add_storefront, self.storefront, self.version
+        )
+        return self.cache.key(self.client_key, method, url), ttl
+
+    def _invalidate_cache(self, method, path):
+        """Drop cached reads under ``path``'s prefix after a write to it."""
+        if self.cache is None or method == "GET":
+            return
+        prefix = self.cache.prefix(path)
+        if prefix is None:
+            return
+        url = request_url(self.endpoint, prefix, None, False, None, self.version)
+        self.cache.invalidate(self.client_key, url)
+
+    def _admit(self, path) -> float:
+        """Run the client-side checks for ``path`` and return the seconds to wait
+        before sending."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before(path)
+        if self.rate_limiter is not None:
+            return self.rate_limiter.reserve(self.client_key, path)
+        return 0.0
+
+    def _observe(self, path, *, response=None, error=None):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(path, response=response, error=error)
+        if response is not None and self.rate_limiter is not None:
+            self.rate_limiter.update(
+                self.client_key, path, response.status_code, response.headers
+            )
+
+    def _retry_delay(self, attempt, method, *, response=None, error=None):
+        if self.retry is None:
+            return None
+        return self.retry.next_delay(attempt, method, response=response, error=error)
+
     @property
     def headers(self):
         return {
@@ -0,0 +1,98 @@
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class BatchResult:
+    """Outcome of one call made by a batch ``map``.
+
+    ``item`` is the input the call was made with and ``index`` its position in the
+    input. Exactly one of ``result`` and ``error`` is set.
+    """
+
+    __slots__ = ("error", "index", "item", "result")
+
+    def __init__(self, index, item, result=None, error=None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self):
+        """Return the result, raising the captured exception if the call failed."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def __repr__(self):
+        outcome = f"error={self.error!r}" if self.error else f"result={self.result!r}"
+        return f"BatchResult(index={self.index}, item={self.item!r}, {outcome})"
+
+
+def call_arguments(item, kwargs):
+    """Turn a batch input into call arguments.
+
+    Tuples are passed as positional arguments, mappings as keyword arguments and
+    anything else as the single positional argument. ``kwargs`` are shared by every
+    call.
+    """
+    if isinstance(item, tuple):
+        return item, kwargs
+    if isinstance(item, Mapping):
+        return (), {**kwargs, **item}
+    return (item,), kwargs
+
+
+def resolve_callable(client, method):
+    if isinstance(method, str):
+        return getattr(client, method)
+    return method
+
+
+def map_threaded(method, iterable, *, max_workers=8, ordered=True, **kwargs):
+    """Call ``method`` once per input on a thread pool and yield a ``BatchResult``
+    per call.
+
+    ``iterable`` is consumed lazily; at most ``max_workers`` calls are in flight or
+    buffered at any time. Exceptions are captured in the result instead of stopping
+    the batch. With ``ordered=False`` results are yielded as they complete.
+    ``kwargs`` are passed to every call.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def call(index, item):
+        args, call_kwargs = call_arguments(item, kwargs)
+        try:
+            return BatchResult(index, item, result=method(*args, **call_kwargs))
+        except Exception as exc:
+            return BatchResult(index, item, error=exc)
+
+    items = enumerate(iterable)
+    pending = deque()
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def fill():
+        for index, item in items:
+            pending.append(pool.submit(call, index, item))
+            if len(pending) >= max_workers:
+                return
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            result = future.result()
+            fill()
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+
+BULK_UPDATE_LIMIT = 150
+
+
+def dedupe_units(units) -> list:
+    """Drop duplicate ``id_unit`` entries; the last entry for a unit wins."""
+    merged = {}
+    for unit in units:
+        merged[unit["id_unit"]] = unit
+    return list(merged.values())
+
+
+def chunk_units(units, chunk_size=BULK_UPDATE_LIMIT):
+    if not 0 < chunk_size <= BULK_UPDATE_LIMIT:
+        raise ValueError(f"chunk_size must be between 1 and {BULK_UPDATE_LIMIT}")
+    return [units[i : i + chunk_size] for i in range(0, len(units), chunk_size)]
+
+
+class NoResult:
+    """Outcome of a unit that was sent but has no entry with its ``id_unit`` in
+    the response ``data``.
+
+    ``entries`` are the entries of that response without an ``id_unit``, such as
+    internal errors, one of which may concern the unit.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+
+    def __repr__(self):
+        return f"NoResult(entries={self.entries!r})"
+
+
+def merge_chunk_result(results, chunk, response=None, error=None):
+    """Record the per-unit outcome of one bulk request in ``results``.
+
+    Every unit of ``chunk`` gets an outcome: its response entry, the exception if
+    the request failed as a whole, or ``NoResult`` if the response left it out.
+    """
+    if error is not None:
+        for unit in chunk:
+            results[unit["id_unit"]] = error
+        return results
+    payload = response.payload
+    if isinstance(payload, dict):
+        payload = payload.get("data") or payload.get("responses") or []
+    found = {}
+    unmatched = []
+    for item in payload or []:
+        if isinstance(item, dict) and "id_unit" in item:
+            found[item["id_unit"]] = item
+        else:
+            unmatched.append(item)
+    missing = None
+    for unit in chunk:
+        id_unit = unit["id_unit"]
+        if id_unit in found:
+            results[id_unit] = found[id_unit]
+        else:
+            missing = missing or NoResult(unmatched)
+            results[id_unit] = missing
+    return results
+
+
+def bulk_update_units(
+    units_client, units, *, max_workers=4, chunk_size=BULK_UPDATE_LIMIT, **kwargs
+):
+    """Update any number of units through ``Units.bulk_update_units``.
+
+    ``units`` is an iterable of ``UnitsBulkUpdateRequest`` dicts. Duplicates are
+    dropped (last write wins), the rest is split into requests of at most 150 units
+    which run on a thread pool sharing the client's connection pool. Extra keyword
+    arguments such as ``storefront`` are passed to every request.
+
+    Returns a dict mapping each ``id_unit`` sent to its entry of the response
+    ``data``, to the exception raised by the request that carried it, or to a
+    ``NoResult`` if the response has no entry for it.
+    """
+    chunks = chunk_units(dedupe_units(units), chunk_size)
+
+    def send(chunk):
+        try:
+            return chunk, units_client.bulk_update_units(body=chunk, **kwargs), None
+        except Exception as exc:
+            return chunk, None, exc
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk, response, error in executor.map(send, chunks):
+            merge_chunk_result(results, chunk, response, error)
+    return results
@@ -0,0 +1,252 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# Path prefixes of near-static reference data and how long to keep them, in seconds.
+DEFAULT_TTLS = {
+    "/categories": 24 * 3600,
+    "/attributes": 24 * 3600,
+    "/info": 24 * 3600,
+    "/carriers": 24 * 3600,
+    "/shipping-groups": 3600,
+}
+
+
+class CachedResponse:
+    """Response replayed from a cache backend; parsed like an httpx response."""
+
+    __slots__ = ("content", "headers", "status_code")
+
+    def __init__(self, status_code, headers, content):
+        import httpx
+
+        self.status_code = status_code
+        self.headers = httpx.Headers(headers)
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU backend holding up to ``maxsize`` responses."""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response, ttl):
+        entry = (
+            time.time() + ttl,
+            CachedResponse(
+                response.status_code, list(response.headers.items()), response.content
+            ),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCache:
+    """On-disk LRU backend in a sqlite database, shareable between processes.
+
+    Lookups are synchronous; they are local and fast enough to run on the event
+    loop of the async clients.
+    """
+
+    def __init__(self, path, maxsize=10000):
+        import sqlite3
+
+        self.path = str(path)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires REAL, accessed REAL, "
+            "status INTEGER, headers TEXT, content BLOB)"
+        )
+        self._db.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires, status, headers, content FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+        return CachedResponse(row[1], json.loads(row[2]), row[3])
+
+    def set(self, key, response, ttl):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    now + ttl,
+                    now,
+                    response.status_code,
+                    json.dumps(list(response.headers.items())),
+                    bytes(response.content),
+                ),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            self._db.commit()
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """Opt-in cache for GET responses of slow-changing endpoints.
+
+    ``ttls`` maps path prefixes to seconds (``DEFAULT_TTLS`` by default); the
+    longest matching prefix wins and paths without a match are not cached.
+    Responses are keyed by client key, method and URL, so neither the timestamp nor
+    the signature headers take part. Only successful responses are stored.
+    Concurrent misses for the same key are coalesced into one request.
+
+    A POST, PATCH, PUT or DELETE under a cached prefix, such as an update of a
+    shipping group, drops every cached GET response of that client under the
+    prefix, so the next read sees the change. Backends offer ``get``, ``set``,
+    ``delete_prefix`` and ``clear``.
+    """
+
+    def __init__(self, backend=None, *, ttls=None):
+        self.backend = MemoryCache() if backend is None else backend
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def prefix(self, path):
+        """Return the longest prefix of ``ttls`` matching ``path``, or None."""
+        path = path.split("?", 1)[0]
+        for prefix in self._prefixes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return prefix
+        return None
+
+    def ttl(self, path):
+        prefix = self.prefix(path)
+        return None if prefix is None else self.ttls[prefix]
+
+    @staticmethod
+    def key(client_key, method, url):
+        return f"{client_key} {method} {url}"
+
+    def invalidate(self, client_key, url):
+        """Drop the cached GET responses of ``client_key`` for ``url`` and every
+        URL below it."""
+        self.backend.delete_prefix(self.key(client_key, "GET", url))
+
+    def _store(self, key, response, ttl):
+        if 200 <= response.status_code < 300:
+            self.backend.set(key, response, ttl)
+        return response
+
+    def _claim(self, key, factory):
+        # threads and coroutines wait on different primitives
+        key = (key, factory)
+        with self._lock:
+            waiter = self._inflight.get(key)
+            if waiter is not None:
+                return waiter, False
+            waiter = self._inflight[key] = factory()
+            return waiter, True
+
+    def _release(self, key, waiter):
+        key = (key, type(waiter))
+        with self._lock:
+            if self._inflight.get(key) is waiter:
+                del self._inflight[key]
+        waiter.set()
+
+    def fetch(self, key, ttl, send):
+        """Return the cached response for ``key`` or store the result of
+        ``send()``."""
+        cached = self.backend.get(key)
+        if cached is not None:
+            return cached
+        waiter, leader = self._claim(key, threading.Event)
+        if not leader:
+            waiter.wait()
+            # None if the leader failed or got an uncacheable response
+            cached = self.backend.get(key)
+            return send() if cached is None else cached
+        try:
+            return self._store(key, send(), ttl)
+        finally:
+            self._release(key, waiter)
+
+    async def afetch(self, key, ttl, send):
+        """Coroutine version of ``fetch``; ``send`` is a coroutine function."""
+        import asyncio
+
+        cached = self.backend.get(key)
+        if cached is not None:
+            return cached
+        waiter, leader = self._claim(key, asyncio.Event)
+        if not leader:
+            await waiter.wait()
+            cached = self.backend.get(key)
+            return await send() if cached is None else cached
+        try:
+            return self._store(key, await send(), ttl)
+        finally:
+            self._release(key, waiter)
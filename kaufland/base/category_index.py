@@ -0,0 +1,170 @@
+import json
+from collections import defaultdict
+
+
+def _flatten(tree):
+    stack = list(reversed(tree)) if isinstance(tree, list) else [tree]
+    while stack:
+        node = stack.pop()
+        children = node.get("children") or []
+        yield {key: value for key, value in node.items() if key != "children"}
+        stack.extend(reversed(children))
+
+
+class CategoryIndex:
+    """In-memory index of the category tree of one storefront and locale.
+
+    Build it from ``Categories.get_category_tree`` once, then look categories up by
+    id and walk their ancestry without further requests. ``save`` and ``load``
+    keep a copy on disk so workers can start without a network call::
+
+        index = CategoryIndex.from_client(session.categories, storefront="de")
+        index.save("categories-de.json")
+        index = CategoryIndex.load("categories-de.json", storefront="de")
+        [c["name"] for c in index.path(id_category)]
+    """
+
+    def __init__(self, categories, *, storefront=None, locale=None):
+        self.storefront = storefront
+        self.locale = locale
+        self._categories = {}
+        self._children = defaultdict(list)
+        self._names = defaultdict(list)
+        for category in categories:
+            self._categories[category["id_category"]] = category
+        for id_category, category in self._categories.items():
+            parent = self._parent_id(category)
+            if parent is not None:
+                self._children[parent].append(id_category)
+            self._names[category["name"].casefold()].append(id_category)
+
+    def _parent_id(self, category):
+        parent = category.get("id_parent_category")
+        if parent == category["id_category"] or parent not in self._categories:
+            return None
+        return parent
+
+    @classmethod
+    def from_payload(cls, payload, *, storefront=None, locale=None):
+        """Build the index from a ``get_category_tree`` payload, a tree node or a
+        list of nodes."""
+        if isinstance(payload, dict) and "data" in payload:
+            payload = payload["data"]
+        return cls(_flatten(payload), storefront=storefront, locale=locale)
+
+    @classmethod
+    def from_client(cls, categories_client, *, storefront=None, locale=None):
+        """Fetch the category tree through a sync ``Categories`` client."""
+        storefront = storefront or categories_client.storefront
+        params = {"storefront": storefront}
+        if locale:
+            params["locale"] = locale
+        response = categories_client.get_category_tree(**params)
+        return cls.from_payload(response.payload, storefront=storefront, locale=locale)
+
+    def __len__(self):
+        return len(self._categories)
+
+    def __iter__(self):
+        return iter(self._categories.values())
+
+    def __contains__(self, id_category):
+        return id_category in self._categories
+
+    def __getitem__(self, id_category):
+        return self._categories[id_category]
+
+    def get(self, id_category, default=None):
+        return self._categories.get(id_category, default)
+
+    def parent(self, id_category):
+        parent = self._parent_id(self._categories[id_category])
+        return None if parent is None else self._categories[parent]
+
+    def ancestors(self, id_category):
+        """Return the ancestors of a category, nearest first."""
+        ancestors = []
+        seen = {id_category}
+        parent = self._parent_id(self._categories[id_category])
+        while parent is not None and parent not in seen:
+            seen.add(parent)
+            category = self._categories[parent]
+            ancestors.append(category)
+            parent = self._parent_id(category)
+        return ancestors
+
+    def path(self, id_category):
+        """Return the categories from the root down to ``id_category``."""
+        return self.ancestors(id_category)[::-1] + [self._categories[id_category]]
+
+    def children(self, id_category):
+        return [self._categories[child] for child in self._children[id_category]]
+
+    def descendants(self, id_category):
+        """Yield all categories below ``id_category``, depth first."""
+        stack = list(reversed(self._children[id_category]))
+        seen = {id_category}
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            yield self._categories[child]
+            stack.extend(reversed(self._children[child]))
+
+    def is_leaf(self, id_category):
+        return id_category in self._categories and not self._children[id_category]
+
+    def is_descendant(self, id_category, id_ancestor):
+        return any(a["id_category"] == id_ancestor for a in self.ancestors(id_category))
+
+    def by_name(self, name):
+        """Return the categories named exactly ``name``, ignoring case."""
+        return [self._categories[i] for i in self._names.get(name.casefold(), ())]
+
+    def search(self, text, *, leaves_only=False, limit=None):
+        """Return categories whose name or titles contain ``text``, ignoring
+        case."""
+        text = text.casefold()
+        fields = ("name", "title_singular", "title_plural")
+        results = []
+        for id_category, category in self._categories.items():
+            if leaves_only and self._children[id_category]:
+                continue
+            if any(text in (category.get(f) or "").casefold() for f in fields):
+                results.append(category)
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def to_dict(self):
+        return {
+            "storefront": self.storefront,
+            "locale": self.locale,
+            "categories": list(self._categories.values()),
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path, *, storefront=None, locale=None):
+        """Load an index written by ``save``.
+
+        Raises ``ValueError`` if ``storefront`` or ``locale`` is given and does not
+        match the saved index.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for name, expected in (("storefront", storefront), ("locale", locale)):
+            if expected is not None and data.get(name) != expected:
+                raise ValueError(
+                    f"Category index {path} is for {name} {data.get(name)!r}, "
+                    f"not {expected!r}"
+                )
+        return cls(
+            data["categories"],
+            storefront=data.get("storefront"),
+            locale=data.get("locale"),
+        )
@@ -0,0 +1,393 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+
+class ChangeResource:
+    """How to page through the changes of one list endpoint.
+
+    ``group`` and ``method`` name the generated client and its ``iter_*`` method,
+    ``since`` the query parameter taking the lower bound, ``field`` the item field
+    it compares against and ``key`` the item's id. ``sort`` is sent if the endpoint
+    can list the most recent changes first.
+    """
+
+    __slots__ = ("name", "group", "method", "since", "field", "key", "sort")
+
+    def __init__(self, name, group, method, since, field, key, sort=None):
+        self.name = name
+        self.group = group
+        self.method = method
+        self.since = since
+        self.field = field
+        self.key = key
+        self.sort = sort
+
+    def __repr__(self):
+        return f"ChangeResource({self.name!r}, {self.since}={self.field})"
+
+
+RESOURCES = {
+    resource.name: resource
+    for resource in (
+        ChangeResource(
+            "orders",
+            "orders",
+            "iter_orders",
+            "ts_units_updated_from_iso",
+            "ts_units_updated_iso",
+            "id_order",
+        ),
+        ChangeResource(
+            "order_units",
+            "order_units",
+            "iter_order_units",
+            "ts_updated_from_iso",
+            "ts_updated_iso",
+            "id_order_unit",
+            "ts_updated:desc",
+        ),
+        ChangeResource(
+            "order_invoices",
+            "order_invoices",
+            "iter_order_invoices",
+            "ts_created_from_iso",
+            "ts_created_iso",
+            "id_invoice",
+        ),
+        ChangeResource(
+            "returns",
+            "returns",
+            "iter_returns",
+            "ts_updated_from_iso",
+            "ts_updated_iso",
+            "id_return",
+            "ts_updated:desc",
+        ),
+        ChangeResource(
+            "return_units",
+            "return_units",
+            "iter_return_units",
+            "ts_created_from_iso",
+            "ts_created_iso",
+            "id_return_unit",
+        ),
+        ChangeResource(
+            "tickets",
+            "tickets",
+            "iter_tickets",
+            "ts_updated_from_iso",
+            "ts_updated_iso",
+            "id_ticket",
+            "ts_updated_iso:desc",
+        ),
+        *(
+            ChangeResource(
+                f"{kind}_import_files",
+                "import_files",
+                f"iter_{kind}_import_files",
+                "ts_updated_iso",
+                "ts_updated_iso",
+                "id_import_file",
+            )
+            for kind in ("inventory_feed", "inventory_command", "order_command")
+        ),
+    )
+}
+
+
+def parse_timestamp(value):
+    """Parse an API timestamp such as ``2024-05-01T12:00:00Z``, or return None."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        value = str(value)
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def format_timestamp(value) -> str:
+    """Format a datetime the way the ``*_from_iso`` filters expect it."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Upsert:
+    """A created or changed item emitted by ``ChangeSync``.
+
+    ``key`` is the item's id and ``version`` the timestamp it was changed at, as
+    sent by the API.
+    """
+
+    __slots__ = ("resource", "storefront", "key", "version", "item")
+
+    def __init__(self, resource, storefront, key, version, item):
+        self.resource = resource
+        self.storefront = storefront
+        self.key = key
+        self.version = version
+        self.item = item
+
+    def __repr__(self):
+        return (
+            f"Upsert({self.resource!r}, storefront={self.storefront!r}, "
+            f"key={self.key!r}, version={self.version!r})"
+        )
+
+
+class MemoryCheckpoint:
+    """Keeps high-water marks in process memory, e.g. for tests."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, resource, storefront):
+        with self._lock:
+            return self._states.get((resource, storefront))
+
+    def set(self, resource, storefront, state):
+        with self._lock:
+            self._states[(resource, storefront)] = state
+
+    def delete(self, resource, storefront):
+        with self._lock:
+            self._states.pop((resource, storefront), None)
+
+
+class JsonCheckpoint:
+    """Keeps high-water marks in a JSON file, replaced atomically on every save."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, states):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(states, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def get(self, resource, storefront):
+        with self._lock:
+            return self._read().get(resource, {}).get(storefront)
+
+    def set(self, resource, storefront, state):
+        with self._lock:
+            states = self._read()
+            states.setdefault(resource, {})[storefront] = state
+            self._write(states)
+
+    def delete(self, resource, storefront):
+        with self._lock:
+            states = self._read()
+            if states.get(resource, {}).pop(storefront, None) is not None:
+                self._write(states)
+
+
+class SqliteCheckpoint:
+    """Keeps high-water marks in a sqlite database, shareable between processes."""
+
+    def __init__(self, path):
+        import sqlite3
+
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "resource TEXT, storefront TEXT, state TEXT, "
+            "PRIMARY KEY (resource, storefront))"
+        )
+        self._db.commit()
+
+    def get(self, resource, storefront):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT state FROM checkpoints WHERE resource = ? AND storefront = ?",
+                (resource, storefront),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, resource, storefront, state):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (resource, storefront, json.dumps(state)),
+            )
+            self._db.commit()
+
+    def delete(self, resource, storefront):
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM checkpoints WHERE resource = ? AND storefront = ?",
+                (resource, storefront),
+            )
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ChangeRun:
+    """Bookkeeping for one pass over a resource.
+
+    Items are requested from ``mark - lookback``, so changes the API commits late
+    or within the same second as the mark are not lost. Items already emitted at
+    the same version inside that window are skipped; the rest become ``Upsert``s.
+    """
+
+    def __init__(self, resource, storefront, state, *, lookback, start=None):
+        self.resource = resource
+        self.storefront = storefront
+        self.lookback = timedelta(seconds=lookback)
+        state = state or {}
+        self.mark = parse_timestamp(state.get("mark"))
+        self.start = parse_timestamp(start)
+        self.seen = dict(state.get("seen") or {})
+        self.emitted = {}
+
+    def params(self, filters):
+        params = dict(filters)
+        if self.resource.sort:
+            params.setdefault("sort", self.resource.sort)
+        if self.mark is not None:
+            params[self.resource.since] = format_timestamp(self.mark - self.lookback)
+        elif self.start is not None:
+            params[self.resource.since] = format_timestamp(self.start)
+        return params
+
+    def accept(self, item):
+        """Return the ``Upsert`` for ``item`` or None if it was already emitted."""
+        key = item.get(self.resource.key)
+        version = item.get(self.resource.field)
+        if key is not None and version is not None:
+            # ids are strings once the state went through JSON
+            seen = str(key)
+            if self.seen.get(seen) == version or self.emitted.get(seen) == version:
+                return None
+            self.emitted[seen] = version
+        return Upsert(self.resource.name, self.storefront, key, version, item)
+
+    def state(self):
+        """Return the checkpoint state after every accepted item was handled."""
+        versions = {**self.seen, **self.emitted}
+        parsed = {key: parse_timestamp(version) for key, version in versions.items()}
+        marks = [ts for ts in parsed.values() if ts is not None]
+        if self.mark is not None:
+            marks.append(self.mark)
+        if not marks:
+            return {"mark": None, "seen": {}}
+        mark = max(marks)
+        horizon = mark - self.lookback
+        return {
+            "mark": format_timestamp(mark),
+            "seen": {
+                key: versions[key]
+                for key, ts in parsed.items()
+                if ts is not None and ts >= horizon
+            },
+        }
+
+
+class ChangeSync:
+    """Fetches only what changed since the previous run of each resource.
+
+    A high-water mark, the latest change timestamp seen, is kept per resource and
+    storefront in ``checkpoint`` (``JsonCheckpoint``, ``SqliteCheckpoint`` or
+    ``MemoryCheckpoint``). ``client`` is a ``Session`` or the generated client of
+    the resource::
+
+        sync = ChangeSync(session, JsonCheckpoint("changes.json"))
+        for upsert in sync.changes("order_units", storefront="de"):
+            db.upsert(upsert.key, upsert.item)
+
+    The mark is saved once the iterator is exhausted; if the loop stops early the
+    next run emits the same changes again, so handlers should be idempotent.
+    Without a mark, ``start`` (a datetime or ISO timestamp) bounds the first run;
+    if it is None the first run reads everything.
+    """
+
+    def __init__(self, client, checkpoint, *, lookback=120.0, start=None):
+        self.client = client
+        self.checkpoint = checkpoint
+        self.lookback = lookback
+        self.start = start
+
+    @staticmethod
+    def resource(name) -> ChangeResource:
+        try:
+            return RESOURCES[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown resource {name!r}, expected one of {sorted(RESOURCES)}"
+            ) from None
+
+    def _source(self, resource):
+        if hasattr(self.client, resource.method):
+            return self.client
+        return getattr(self.client, resource.group)
+
+    def _storefront(self, source, storefront):
+        # The generated methods add the client's storefront to the query themselves.
+        return storefront or getattr(source, "storefront", None) or ""
+
+    def _begin(self, name, storefront, filters):
+        resource = self.resource(name)
+        source = self._source(resource)
+        if storefront:
+            filters["storefront"] = storefront
+        storefront = self._storefront(source, storefront)
+        run = ChangeRun(
+            resource,
+            storefront,
+            self.checkpoint.get(resource.name, storefront),
+            lookback=self.lookback,
+            start=self.start,
+        )
+        return getattr(source, resource.method), run, run.params(filters)
+
+    def _commit(self, run):
+        self.checkpoint.set(run.resource.name, run.storefront, run.state())
+
+    def changes(self, resource, *, storefront=None, **filters):
+        """Yield an ``Upsert`` per item created or changed since the last run.
+
+        ``filters`` are passed on to the ``iter_*`` method, e.g. ``status=...``.
+        """
+        method, run, params = self._begin(resource, storefront, filters)
+        for item in method(**params):
+            upsert = run.accept(item)
+            if upsert is not None:
+                yield upsert
+        self._commit(run)
+
+    def mark(self, resource, *, storefront=None):
+        """Return the high-water mark of ``resource`` as a datetime, or None."""
+        resource = self.resource(resource)
+        storefront = self._storefront(self._source(resource), storefront)
+        state = self.checkpoint.get(resource.name, storefront)
+        return parse_timestamp((state or {}).get("mark"))
+
+    def reset(self, resource, *, storefront=None):
+        """Forget the mark, so the next run starts from ``start`` again."""
+        resource = self.resource(resource)
+        storefront = self._storefront(self._source(resource), storefront)
+        self.checkpoint.delete(resource.name, storefront)
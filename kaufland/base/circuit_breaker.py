@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from collections import Counter, deque
+
+from ._core import endpoint_group
+from .exceptions import CircuitOpenException
+
+log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.outcomes = deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_started = 0.0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Fails fast for endpoint groups that keep failing upstream.
+
+    Outcomes are tracked per endpoint group, the first segment of the endpoint path
+    (``reports`` for ``/reports/{}``). A group's circuit opens once at least
+    ``minimum_calls`` requests in the last ``window`` seconds were made and
+    ``failure_rate`` of them failed; requests then raise ``CircuitOpenException``
+    without touching the network. After ``reset_timeout`` seconds up to
+    ``half_open_probes`` requests are let through: a success closes the circuit, a
+    failure opens it again.
+
+    Transport errors and ``failure_statuses`` (5xx by default) count as failures.
+    ``on_state_change(group, old_state, new_state)`` is called on every transition
+    and ``metrics()`` returns counters for monitoring.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate=0.5,
+        minimum_calls=10,
+        window=60.0,
+        reset_timeout=30.0,
+        half_open_probes=1,
+        failure_statuses=range(500, 600),
+        on_state_change=None,
+    ):
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.failure_statuses = frozenset(failure_statuses)
+        self.on_state_change = on_state_change
+        self.transitions = Counter()
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, group):
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit()
+        return circuit
+
+    def _transition(self, group, circuit, state, now):
+        old, circuit.state = circuit.state, state
+        circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = now
+        if state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+        self.transitions[(group, old, state)] += 1
+        log.info("Circuit for %r: %s -> %s", group, old, state)
+        return old, state
+
+    def _notify(self, group, change):
+        if change and self.on_state_change is not None:
+            self.on_state_change(group, *change)
+
+    def state(self, path) -> str:
+        with self._lock:
+            return self._circuit(endpoint_group(path)).state
+
+    def before(self, path):
+        """Raise ``CircuitOpenException`` if a request to ``path`` must not be sent."""
+        group = endpoint_group(path)
+        change = None
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - now
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenException(group, retry_in)
+                change = self._transition(group, circuit, HALF_OPEN, now)
+            elif (
+                circuit.probes >= self.half_open_probes
+                and now - circuit.probe_started < self.reset_timeout
+            ):
+                circuit.rejected += 1
+                raise CircuitOpenException(group)
+            else:
+                # a probe that never reported back must not block the group forever
+                circuit.probes = min(circuit.probes, self.half_open_probes - 1)
+            circuit.probes += 1
+            circuit.probe_started = now
+        self._notify(group, change)
+
+    def is_failure(self, response=None, error=None) -> bool:
+        if error is not None:
+            return True
+        return response is not None and response.status_code in self.failure_statuses
+
+    def record(self, path, *, response=None, error=None):
+        """Record the outcome of a request sent to ``path``."""
+        failed = self.is_failure(response, error)
+        group = endpoint_group(path)
+        change = None
+        with self._lock:
+            circuit = self._circuit(group)
+            now = time.monotonic()
+            if circuit.state == HALF_OPEN:
+                change = self._transition(
+                    group, circuit, OPEN if failed else CLOSED, now
+                )
+            elif circuit.state == CLOSED:
+                outcomes = circuit.outcomes
+                outcomes.append((now, failed))
+                circuit.failures += failed
+                while outcomes and outcomes[0][0] < now - self.window:
+                    circuit.failures -= outcomes.popleft()[1]
+                calls = len(outcomes)
+                if (
+                    calls >= self.minimum_calls
+                    and circuit.failures / calls >= self.failure_rate
+                ):
+                    change = self._transition(group, circuit, OPEN, now)
+        self._notify(group, change)
+
+    def metrics(self) -> dict:
+        """Snapshot of state, window counters and rejections per group, plus
+        transition counts keyed by ``(group, old_state, new_state)``."""
+        with self._lock:
+            return {
+                "groups": {
+                    group: {
+                        "state": circuit.state,
+                        "calls": len(circuit.outcomes),
+                        "failures": circuit.failures,
+                        "rejected": circuit.rejected,
+                    }
+                    for group, circuit in self._circuits.items()
+                },
+                "transitions": dict(self.transitions),
+            }
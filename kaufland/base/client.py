@@ -1,9 +1,11 @@
 import logging
+import time
 
-from ._core import parse_response, prepare_request, resolve_method
+from ._core import parse_response, resolve_method
 from ._transport_httpx import HttpxTransport
 from .ApiResponse import ApiResponse
 from .base_client import BaseClient
+from .batch import map_threaded, resolve_callable
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -29,6 +31,13 @@ class Client(BaseClient):
         timeout=None,
         version=None,
         credential_providers=None,
+        transport=None,
+        limits=None,
+        http2=False,
+        rate_limiter=None,
+        retry=None,
+        circuit_breaker=None,
+        cache=None,
     ):
         super().__init__(
             account=account,
@@ -45,12 +54,25 @@ class Client(BaseClient):
             verify=verify,
             timeout=timeout,
             version=version,
+            limits=limits,
+            http2=http2,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            cache=cache,
         )
 
         self.version = version
-        self._transport = HttpxTransport(
-            timeout=timeout, proxies=proxies, verify=verify
-        )
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = HttpxTransport(
+                timeout=timeout,
+                proxies=proxies,
+                verify=verify,
+                limits=limits,
+                http2=http2,
+            )
+        self._transport = transport
 
     def _request(
         self,
@@ -68,34 +90,64 @@ class Client(BaseClient):
         method, params, data = resolve_method(params, data, method=method)
         self.method = method
 
-        log.debug("HTTP Method: %s", method)
-        log.debug("Request path: %s", path)
-        log.debug("Request Params: %s", params)
-        log.debug("Request Data: %s", data)
-        request_headers = headers or self.headers
-        log.debug("Request Headers: %s", request_headers)
-
-        prepared = prepare_request(
-            method=method,
-            endpoint=self.endpoint,
-            path=path,
-            params=params,
-            data=data,
-            headers=request_headers,
-            add_storefront=add_storefront,
-            storefront=self.storefront,
-            version=self.version,
-            client_key=self.client_key,
-            secret_key=self.secret_key,
-            user_agent=self.user_agent,
-            partner_client_key=self.partner_client_key,
-            partner_secret_key=self.partner_secret_key,
-            signature_encoding=self.signature_encoding,
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("HTTP Method: %s", method)
+            log.debug("Request path: %s", path)
+            log.debug("Request Params: %s", params)
+            log.debug("Request Data: %s", data)
+            log.debug("Request Headers: %s", headers or self.headers)
+        # RequestSigner.prepare adds the default headers
+        request_headers = headers
+
+        cache_entry = self._cache_entry(method, path, params, add_storefront)
+        if cache_entry is None:
+            try:
+                res = self._send(
+                    method, path, params, data, request_headers, add_storefront
+                )
+            finally:
+                # a failed write may still have been applied
+                self._invalidate_cache(method, path)
+        else:
+            res = self.cache.fetch(
+                *cache_entry,
+                lambda: self._send(
+                    method, path, params, data, request_headers, add_storefront
+                ),
+            )
+        return self._check_response(res, res_no_data, bulk, wrap_list, method=method)
 
-        log.debug("Making request to URL: %s", prepared["url"])
-        res = self._transport.request(**prepared)
-        return self._check_response(res, res_no_data, bulk, wrap_list)
+    def _send(self, method, path, params, data, request_headers, add_storefront):
+        attempt = 0
+        while True:
+            attempt += 1
+            delay = self._admit(path)
+            if delay > 0:
+                log.debug("Rate limited, waiting %.3fs", delay)
+                time.sleep(delay)
+
+            # Signed per attempt, so every retry carries a fresh Shop-Timestamp.
+            prepared = self._prepare(
+                method, path, params, data, request_headers, add_storefront
+            )
+            log.debug("Making request to URL: %s", prepared["url"])
+            try:
+                res = self._transport.request(**prepared)
+            except Exception as exc:
+                self._observe(path, error=exc)
+                delay = self._retry_delay(attempt, method, error=exc)
+                if delay is None:
+                    raise
+            else:
+                self._observe(path, response=res)
+                delay = None
+                if res.status_code >= 400:
+                    delay = self._retry_delay(attempt, method, response=res)
+                if delay is None:
+                    return res
+
+            log.debug("Retrying %s %s in %.3fs", method, path, delay)
+            time.sleep(delay)
 
     def _check_response(
         self,
@@ -103,10 +155,12 @@ class Client(BaseClient):
         res_no_data: bool = False,
         bulk: bool = False,
         wrap_list: bool = False,
+        method: str | None = None,
     ) -> ApiResponse:
+        # self.method is shared by concurrent requests; prefer the explicit method
         response = parse_response(
             res,
-            method=self.method,
+            method=method or self.method,
             res_no_data=res_no_data,
             bulk=bulk,
             wrap_list=wrap_list,
@@ -114,8 +168,33 @@ class Client(BaseClient):
         log.debug("Response: %s", response)
         return response
 
+    def map(self, method, iterable, *, max_workers=8, ordered=True, **kwargs):
+        """Call ``method`` for every input on a thread pool sharing this client's
+        connection pool.
+
+        ``method`` is a generated method or its name on this client. Returns an
+        iterator of ``BatchResult``, see ``kaufland.base.batch.map_threaded``::
+
+            for result in client.map("get_order_unit", ids, max_workers=16):
+                ...
+        """
+        return map_threaded(
+            resolve_callable(self, method),
+            iterable,
+            max_workers=max_workers,
+            ordered=ordered,
+            **kwargs,
+        )
+
+    def imap_unordered(self, method, iterable, *, max_workers=8, **kwargs):
+        """Like ``map``, yielding results as they complete."""
+        return self.map(
+            method, iterable, max_workers=max_workers, ordered=False, **kwargs
+        )
+
     def close(self):
-        self._transport.close()
+        if self._owns_transport:
+            self._transport.close()
 
     def __enter__(self):
         return self
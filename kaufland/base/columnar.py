@@ -0,0 +1,184 @@
+import json
+from datetime import date, datetime
+from itertools import islice
+
+from ._schemas import SCHEMAS
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow export needs pyarrow: pip install 'python-kaufland-api[arrow]'"
+        ) from None
+    return pyarrow
+
+
+def _arrow_type(pa, spec):
+    if isinstance(spec, dict):
+        if "list" in spec:
+            return pa.list_(_arrow_type(pa, spec["list"]))
+        return pa.struct(
+            [pa.field(name, _arrow_type(pa, s)) for name, s in spec["struct"].items()]
+        )
+    if spec == "timestamp":
+        return pa.timestamp("s", tz="UTC")
+    if spec == "date":
+        return pa.date32()
+    if spec in ("json", "string"):
+        return pa.string()
+    if spec == "bool":
+        return pa.bool_()
+    return getattr(pa, spec)()
+
+
+def arrow_schema(schema):
+    """Return a ``pyarrow.Schema`` for a swagger schema name (``"OrderUnit"``,
+    ``"Unit"``, ``"Report"``) or a dict of column names to type specs."""
+    pa = _pyarrow()
+    if isinstance(schema, pa.Schema):
+        return schema
+    spec = SCHEMAS[schema] if isinstance(schema, str) else schema
+    return pa.schema([pa.field(name, _arrow_type(pa, s)) for name, s in spec.items()])
+
+
+def _parse_timestamp(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _parse_date(value):
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _converter(spec):
+    """Return a function fixing up a value for ``spec``, or None if pyarrow takes
+    the decoded JSON value as it is."""
+    if spec == "timestamp":
+        return lambda v: None if v is None else _parse_timestamp(v)
+    if spec == "date":
+        return lambda v: None if v is None else _parse_date(v)
+    if spec == "json":
+        return lambda v: v if v is None or isinstance(v, str) else json.dumps(v)
+    if not isinstance(spec, dict):
+        return None
+    if "list" in spec:
+        item = _converter(spec["list"])
+        if item is None:
+            return None
+        return lambda v: None if v is None else [item(i) for i in v]
+    fields = {name: _converter(s) for name, s in spec["struct"].items()}
+    fields = {name: f for name, f in fields.items() if f is not None}
+    if not fields:
+        return None
+
+    def struct(value):
+        if value is None:
+            return None
+        value = dict(value)
+        for name, convert in fields.items():
+            value[name] = convert(value.get(name))
+        return value
+
+    return struct
+
+
+def _spec(pa, arrow_type):
+    if pa.types.is_timestamp(arrow_type):
+        return "timestamp"
+    if pa.types.is_date(arrow_type):
+        return "date"
+    if pa.types.is_list(arrow_type):
+        return {"list": _spec(pa, arrow_type.value_type)}
+    if pa.types.is_struct(arrow_type):
+        return {"struct": {f.name: _spec(pa, f.type) for f in arrow_type}}
+    return str(arrow_type)
+
+
+def record_batches(rows, schema=None, *, batch_size=10000):
+    """Turn an iterable of row dicts into ``pyarrow.RecordBatch`` objects of up to
+    ``batch_size`` rows.
+
+    ``schema`` is a swagger schema name, a dict of type specs or a
+    ``pyarrow.Schema``; columns missing from a row are null and keys missing from
+    the schema are dropped. Without ``schema``, the keys of the first row become
+    string columns, which suits report CSV rows. Only one batch is held in memory
+    at a time.
+    """
+    pa = _pyarrow()
+    rows = iter(rows)
+    chunk = list(islice(rows, batch_size))
+    if not chunk:
+        return
+    if schema is None:
+        schema = {name: "string" for name in chunk[0]}
+    if isinstance(schema, str):
+        specs = SCHEMAS[schema]
+    elif isinstance(schema, dict):
+        specs = schema
+    else:
+        specs = {field.name: _spec(pa, field.type) for field in schema}
+    schema = arrow_schema(schema)
+    converters = [
+        (field.name, field.type, _converter(specs[field.name])) for field in schema
+    ]
+    while chunk:
+        arrays = []
+        for name, arrow_type, convert in converters:
+            values = [row.get(name) for row in chunk]
+            if convert is not None:
+                values = [convert(v) for v in values]
+            arrays.append(pa.array(values, type=arrow_type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        chunk = list(islice(rows, batch_size))
+
+
+def write_parquet(rows, path, schema=None, *, batch_size=10000, **options):
+    """Stream rows into a Parquet file and return the number of rows written.
+
+    ``options`` are passed to ``pyarrow.parquet.ParquetWriter``, e.g.
+    ``compression="zstd"``.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    count = 0
+    writer = None
+    try:
+        for batch in record_batches(rows, schema, batch_size=batch_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, **options)
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_ipc(rows, path, schema=None, *, batch_size=10000):
+    """Stream rows into an Arrow IPC (Feather v2) file and return the number of
+    rows written."""
+    pa = _pyarrow()
+    count = 0
+    writer = None
+    try:
+        for batch in record_batches(rows, schema, batch_size=batch_size):
+            if writer is None:
+                writer = pa.ipc.new_file(path, batch.schema)
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
@@ -2,6 +2,10 @@ import functools
 import re
 from urllib.parse import quote
 
+from ._core import endpoint_group, is_safe
+
+_PLACEHOLDER = re.compile(r"{[^}]*}")
+
 
 def kaufland_endpoint(path, method="GET"):
     def decorator(func):
@@ -35,3 +39,61 @@ def fill_query_params(path, *args, **kwargs):
         path = path.replace(match.group(0), quote(str(value), safe=""), 1)
 
     return path
+
+
+def _segment(value) -> str:
+    if type(value) is int:
+        return str(value)
+    value = str(value)
+    return value if is_safe(value) else quote(value, safe="")
+
+
+class Route:
+    """An API path compiled once into literal segments and parameter slots.
+
+    ``fill`` joins the quoted parameters into the path without searching the
+    template. Used as a decorator, a route tags the method with ``path``, ``method``
+    and ``route`` like ``kaufland_endpoint`` does, but leaves the call untouched::
+
+        _GET_UNIT = Route("/units/{}", "GET")
+
+        @_GET_UNIT
+        def get_unit(self, id_unit, **kwargs):
+            return self._request(_GET_UNIT.fill(id_unit), method="GET", params=kwargs)
+    """
+
+    __slots__ = ("template", "method", "add_storefront", "group", "params", "_literals")
+
+    def __init__(self, template, method="GET", *, add_storefront=True):
+        self.template = template
+        self.method = str(method).upper()
+        self.add_storefront = add_storefront
+        self.group = endpoint_group(template)
+        self._literals = tuple(_PLACEHOLDER.split(template))
+        self.params = len(self._literals) - 1
+
+    def fill(self, *args) -> str:
+        if len(args) != self.params:
+            raise TypeError(
+                f"{self.template} takes {self.params} path parameters, "
+                f"got {len(args)}"
+            )
+        literals = self._literals
+        if not args:
+            return self.template
+        if len(args) == 1:
+            return f"{literals[0]}{_segment(args[0])}{literals[1]}"
+        parts = [literals[0]]
+        for value, literal in zip(args, literals[1:]):
+            parts.append(_segment(value))
+            parts.append(literal)
+        return "".join(parts)
+
+    def __call__(self, func):
+        func.route = self
+        func.path = self.template
+        func.method = self.method
+        return func
+
+    def __repr__(self):
+        return f"Route({self.method} {self.template})"
@@ -23,3 +23,24 @@ class ApiException(KauflandException):
         if text:
             return f"API error {status_code}: {text}"
         return f"API error {status_code}"
+
+
+class CircuitOpenException(KauflandException):
+    """Raised instead of sending a request while an endpoint group's circuit is
+    open."""
+
+    def __init__(self, group, retry_in=None):
+        message = f"Circuit for endpoint group {group!r} is open"
+        if retry_in is not None:
+            message += f", next probe in {retry_in:.1f}s"
+        super().__init__(message)
+        self.group = group
+        self.retry_in = retry_in
+
+
+class ReportException(KauflandException):
+    """Raised when a report fails or is not done in time."""
+
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report
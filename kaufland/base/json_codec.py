@@ -0,0 +1,123 @@
+import json
+import os
+
+
+class JsonCodec:
+    """Standard library JSON codec producing compact UTF-8 bodies."""
+
+    name = "json"
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec; values orjson would encode differently from the standard
+    library go through ``JsonCodec``.
+
+    Datetimes, dataclasses and subclasses of ``str``, ``int``, ``dict`` and
+    ``list`` (e.g. enums) are passed through instead of being encoded, so they
+    fail or encode exactly as with ``JsonCodec``. UUIDs and plain enums are
+    still encoded by orjson, and NaN and infinity become ``null``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._option)
+        except TypeError:
+            # e.g. passed-through values, integers beyond 64 bit or non-str keys
+            return super().dumps(obj)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec codec. msgspec has no options to reject types, so unlike
+    ``JsonCodec`` it encodes datetimes, UUIDs, enums, dataclasses, decimals,
+    bytes and sets, and writes NaN and infinity as ``null``."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def _create(name):
+    try:
+        factory = CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec {name!r}") from None
+    return factory()
+
+
+def _auto():
+    name = os.environ.get("KAUFLAND_JSON_CODEC")
+    if name:
+        return _create(name.lower())
+    for name in ("orjson", "msgspec"):
+        try:
+            return _create(name)
+        except ImportError:
+            continue
+    return JsonCodec()
+
+
+codec = _auto()
+
+
+def get_codec() -> JsonCodec:
+    return codec
+
+
+def set_codec(value):
+    """Select the codec by name (``"orjson"``, ``"msgspec"``, ``"json"``) or
+    instance. ``None`` restores automatic selection."""
+    global codec
+    if value is None:
+        codec = _auto()
+    elif isinstance(value, str):
+        codec = _create(value.lower())
+    else:
+        codec = value
+    return codec
@@ -0,0 +1,46 @@
+def page_items(payload) -> list:
+    if isinstance(payload, dict):
+        return payload.get("data") or []
+    return []
+
+
+def page_total(payload):
+    if isinstance(payload, dict):
+        return (payload.get("pagination") or {}).get("total")
+    return None
+
+
+def next_offset(payload, offset, limit):
+    """Return the offset of the page after ``payload`` or None on the last page."""
+    count = len(page_items(payload))
+    if not count:
+        return None
+    offset += count
+    total = page_total(payload)
+    if total is not None:
+        return offset if offset < total else None
+    if limit and count < limit:
+        return None
+    return offset
+
+
+def paginate(method, *args, max_limit=None, **kwargs):
+    """Yield every page of a list endpoint as an ApiResponse.
+
+    ``limit`` defaults to ``max_limit``, the largest page size the endpoint allows;
+    ``offset`` sets the first item. Only one page is held at a time.
+    """
+    limit = kwargs.pop("limit", None) or max_limit
+    offset = kwargs.pop("offset", None) or 0
+    if limit:
+        kwargs["limit"] = limit
+    while offset is not None:
+        response = method(*args, offset=offset, **kwargs)
+        yield response
+        offset = next_offset(response.payload, offset, limit)
+
+
+def iter_items(method, *args, max_limit=None, **kwargs):
+    """Yield every item of a list endpoint, fetching it page by page."""
+    for page in paginate(method, *args, max_limit=max_limit, **kwargs):
+        yield from page_items(page.payload)
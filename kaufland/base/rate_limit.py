@@ -0,0 +1,109 @@
+import threading
+import time
+
+from ._core import _header_value, endpoint_group
+from .retry import parse_retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``reserve`` takes a token right away and returns how long the caller has to
+    wait before using it, so sync callers can ``time.sleep`` and async callers
+    ``asyncio.sleep`` without holding the lock.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst or max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._blocked_until - now)
+
+    def block(self, seconds):
+        """Hold back every request for ``seconds``, e.g. after a 429."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._blocked_until = max(self._blocked_until, until)
+            self._tokens = min(self._tokens, 0.0)
+
+
+def _reset_seconds(value):
+    """Return the seconds until an ``X-RateLimit-Reset`` value, a duration or an
+    epoch timestamp, or None."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    if seconds > 1_000_000_000:
+        # epoch timestamp rather than a duration
+        seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+class RateLimiter:
+    """Client-side request budget per ``Shop-Client-Key`` and endpoint group.
+
+    ``rate`` requests per second (bursts up to ``burst``) are shared by all endpoint
+    groups of a client key, except for groups listed in ``groups``, which map a
+    group name such as ``"units"`` or ``"order-units"`` to their own rate or
+    ``(rate, burst)`` tuple. One instance can be shared by any number of sync and
+    async clients. Budgets also adapt to ``Retry-After`` and
+    ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` response headers.
+    """
+
+    def __init__(self, rate=10.0, *, burst=None, groups=None):
+        self.rate = rate
+        self.burst = burst
+        self.groups = dict(groups or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, client_key, path) -> TokenBucket:
+        group = endpoint_group(path)
+        if group not in self.groups:
+            group = None
+        key = (client_key, group)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = self._create(group)
+        return bucket
+
+    def _create(self, group):
+        if group is None:
+            return TokenBucket(self.rate, self.burst)
+        budget = self.groups[group]
+        if isinstance(budget, tuple):
+            return TokenBucket(*budget)
+        return TokenBucket(budget)
+
+    def reserve(self, client_key, path) -> float:
+        """Take a token for a request and return the seconds to wait before it."""
+        return self.bucket(client_key, path).reserve()
+
+    def update(self, client_key, path, status_code, headers):
+        retry_after = parse_retry_after(_header_value(headers, "Retry-After"))
+        if retry_after is None and status_code != 429:
+            remaining = _header_value(headers, "X-RateLimit-Remaining")
+            if remaining is None or str(remaining).strip() != "0":
+                return
+            retry_after = _reset_seconds(_header_value(headers, "X-RateLimit-Reset"))
+        if retry_after is None:
+            retry_after = 1.0
+        self.bucket(client_key, path).block(retry_after)
@@ -0,0 +1,247 @@
+import codecs
+import csv
+import logging
+import time
+import zlib
+from collections import deque
+
+from ._core import raise_for_status
+from .batch import map_threaded, resolve_callable
+from .exceptions import ApiException, ReportException
+
+log = logging.getLogger(__name__)
+
+DONE_STATUSES = frozenset({"DONE"})
+FAILED_STATUSES = frozenset({"ERROR", "FAILED", "CANCELED", "CANCELLED"})
+DELIMITERS = ",;\t|"
+
+
+def report_state(report):
+    """Return ``"done"``, ``"failed"`` or ``"pending"`` for a ``Report``."""
+    status = str(report.get("status", "")).upper()
+    if status in DONE_STATUSES:
+        return "done"
+    if status in FAILED_STATUSES:
+        return "failed"
+    return "pending"
+
+
+def request_method(reports_client, report):
+    """Resolve ``new_sales``, ``request_new_sales_report`` or a callable to the
+    request method of ``reports_client``."""
+    if isinstance(report, str) and not hasattr(reports_client, report):
+        report = f"request_{report}_report"
+    return resolve_callable(reports_client, report)
+
+
+class CsvStream:
+    """Incremental CSV parser fed with raw byte chunks.
+
+    Gzip bodies are detected and inflated, a UTF-8 BOM is dropped and the
+    delimiter is guessed from the header unless given. Rows are dicts keyed by the
+    header, or lists with ``header=False``. Only complete records are parsed, so
+    quoted fields may span lines and chunks.
+    """
+
+    def __init__(self, *, delimiter=None, header=True):
+        self.delimiter = delimiter
+        self.header = header
+        self.fieldnames = None
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        self._inflate = None
+        self._started = False
+        self._text = ""
+        self._record = ""
+        self._quotes = 0
+        self._lines = deque()
+        self._reader = None
+
+    def feed(self, chunk):
+        """Consume a chunk of bytes and return the rows it completed."""
+        if not chunk:
+            return []
+        if not self._started:
+            self._started = True
+            if chunk[:2] == b"\x1f\x8b":
+                self._inflate = zlib.decompressobj(wbits=31)
+        if self._inflate is not None:
+            chunk = self._inflate.decompress(chunk)
+        return self._rows(self._decoder.decode(chunk))
+
+    def close(self):
+        """Return the rows left once the body has ended."""
+        tail = b"" if self._inflate is None else self._inflate.flush()
+        rows = self._rows(self._decoder.decode(tail, final=True))
+        if self._record or self._text:
+            rows += self._parse(self._record + self._text)
+            self._record = self._text = ""
+        return rows
+
+    def _rows(self, text):
+        *lines, self._text = (self._text + text).split("\n")
+        rows = []
+        for line in lines:
+            # a record ends on a line that leaves no quoted field open
+            self._quotes += line.count('"')
+            self._record += line + "\n"
+            if self._quotes % 2 == 0:
+                rows += self._parse(self._record)
+                self._record = ""
+                self._quotes = 0
+        return rows
+
+    def _parse(self, record):
+        if not record.strip():
+            return []
+        if self._reader is None:
+            if self.delimiter is None:
+                self.delimiter = max(DELIMITERS, key=record.count)
+            self._reader = csv.reader(_Lines(self._lines), delimiter=self.delimiter)
+        self._lines.append(record)
+        row = next(self._reader)
+        if not self.header:
+            return [row]
+        if self.fieldnames is None:
+            self.fieldnames = row
+            return []
+        return [dict(zip(self.fieldnames, row))]
+
+
+class _Lines:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._lines:
+            raise StopIteration
+        return self._lines.popleft()
+
+
+class ReportManager:
+    """Requests reports, waits for them and streams their CSV files.
+
+    Polling starts at ``poll_interval`` seconds and grows by ``backoff`` up to
+    ``max_interval`` while the status stays the same; a status change resets it.
+    ``timeout`` bounds the wait per report. Files are downloaded over the reports
+    client's transport in ``chunk_size`` pieces::
+
+        manager = ReportManager(session.reports)
+        id_report = manager.request(
+            "new_sales",
+            body={"date_from": "2024-01-01", "date_to": "2024-01-31"},
+            storefront="de",
+        )
+        for row in manager.rows(manager.wait(id_report)):
+            ...
+    """
+
+    def __init__(
+        self,
+        reports_client,
+        *,
+        poll_interval=2.0,
+        max_interval=60.0,
+        backoff=1.5,
+        timeout=3600.0,
+        chunk_size=65536,
+        max_workers=8,
+    ):
+        self.client = reports_client
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def request(self, report, **kwargs):
+        """Request a report and return its ``id_report``.
+
+        ``report`` is a request method of the reports client, its name, or the
+        short name between ``request_`` and ``_report``.
+        """
+        response = request_method(self.client, report)(**kwargs)
+        return response.payload["data"]["id_report"]
+
+    def get(self, id_report, **kwargs):
+        return self.client.get_report(id_report, **kwargs).payload["data"]
+
+    def wait(self, id_report, **kwargs):
+        """Poll until the report is done and return it."""
+        for report in self.as_completed([id_report], **kwargs):
+            return report
+
+    def as_completed(self, ids, **kwargs):
+        """Poll several reports at once and yield each as soon as it is done.
+
+        Raises ``ReportException`` when a report fails or the timeout expires.
+        """
+        pending = {id_report: None for id_report in ids}
+        deadline = time.monotonic() + self.timeout
+        interval = self.poll_interval
+        while pending:
+            changed = False
+            for result in map_threaded(
+                self.get, list(pending), max_workers=self.max_workers, **kwargs
+            ):
+                report = result.unwrap()
+                id_report = result.item
+                state = report_state(report)
+                if state == "failed":
+                    raise ReportException(
+                        f"Report {id_report} failed with status {report['status']}",
+                        report,
+                    )
+                if state == "done":
+                    del pending[id_report]
+                    yield report
+                    continue
+                changed = changed or pending[id_report] != report.get("status")
+                pending[id_report] = report.get("status")
+            if not pending:
+                return
+            if time.monotonic() + interval > deadline:
+                raise ReportException(
+                    f"Reports {sorted(pending)} not done after {self.timeout}s"
+                )
+            interval = (
+                self.poll_interval
+                if changed
+                else min(interval * self.backoff, self.max_interval)
+            )
+            log.debug("Reports %s pending, polling again in %.1fs", pending, interval)
+            time.sleep(interval)
+
+    def iter_bytes(self, report):
+        """Yield the file of a done report (or its URL) in chunks."""
+        url = report if isinstance(report, str) else report["url"]
+        transport = self.client._transport
+        if not hasattr(transport, "stream"):
+            yield raise_for_status(transport.request(method="GET", url=url)).content
+            return
+        with transport.stream(method="GET", url=url) as response:
+            if response.status_code >= 400:
+                body = b"".join(response.iter_bytes())
+                raise ApiException(
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    text=body.decode("utf-8", errors="replace"),
+                )
+            yield from response.iter_bytes(self.chunk_size)
+
+    def rows(self, report, *, delimiter=None, header=True):
+        """Yield the rows of a report's CSV file while it downloads."""
+        parser = CsvStream(delimiter=delimiter, header=header)
+        for chunk in self.iter_bytes(report):
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def download(self, report, path):
+        """Write a report's file to ``path`` without holding it in memory."""
+        with open(path, "wb") as f:
+            for chunk in self.iter_bytes(report):
+                f.write(chunk)
+        return path
@@ -0,0 +1,92 @@
+import random
+import time
+
+from ._core import _header_value
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value):
+    """Return the seconds requested by a ``Retry-After`` header, or None."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Requests are retried up to ``max_attempts`` in total on ``statuses`` and on
+    ``exceptions`` raised by the transport. Only idempotent methods (GET, PUT,
+    DELETE, ...) are retried unless ``retry_non_idempotent`` is set or ``methods``
+    lists the method explicitly. Waits use full-jitter exponential backoff
+    (``uniform(0, min(max_backoff, backoff * 2 ** n))``) unless the response carries
+    ``Retry-After``, which is honoured up to ``max_retry_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        *,
+        backoff=0.5,
+        max_backoff=30.0,
+        max_retry_after=120.0,
+        statuses=RETRY_STATUSES,
+        methods=IDEMPOTENT_METHODS,
+        retry_non_idempotent=False,
+        exceptions=None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.retry_non_idempotent = retry_non_idempotent
+        self._exceptions = None if exceptions is None else tuple(exceptions)
+
+    @property
+    def exceptions(self):
+        """Transport errors to retry on, ``httpx.TransportError`` by default."""
+        if self._exceptions is None:
+            import httpx
+
+            self._exceptions = (httpx.TransportError,)
+        return self._exceptions
+
+    def allows(self, method) -> bool:
+        return self.retry_non_idempotent or method.upper() in self.methods
+
+    def backoff_delay(self, attempt) -> float:
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+
+    def next_delay(self, attempt, method, *, response=None, error=None):
+        """Return the seconds to wait before the next attempt, or None to give up.
+
+        ``attempt`` is the number of the attempt that just failed, starting at 1.
+        """
+        if attempt >= self.max_attempts or not self.allows(method):
+            return None
+        if error is not None:
+            if not isinstance(error, self.exceptions):
+                return None
+            return self.backoff_delay(attempt)
+        if response is None or response.status_code not in self.statuses:
+            return None
+        retry_after = parse_retry_after(_header_value(response.headers, "Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return self.backoff_delay(attempt)
@@ -0,0 +1,62 @@
+import importlib
+
+from .client import Client
+
+
+def _class_name(name: str) -> str:
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+class EndpointGroups:
+    """Hands out generated endpoint groups bound to the owner's transport."""
+
+    api_package = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        endpoints = self.__dict__.setdefault("_endpoints", {})
+        if name not in endpoints:
+            endpoints[name] = self._bind(self._endpoint_class(name))
+        return endpoints[name]
+
+    def _endpoint_class(self, name):
+        api = importlib.import_module(self.api_package)
+        class_name = _class_name(name)
+        if class_name not in api.__all__:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no endpoint group {name!r}"
+            )
+        return getattr(api, class_name)
+
+    def _bind(self, cls):
+        return cls(
+            client_key=self.client_key,
+            secret_key=self.secret_key,
+            partner_client_key=self.partner_client_key,
+            partner_secret_key=self.partner_secret_key,
+            signature_encoding=self.signature_encoding,
+            endpoint=self.endpoint,
+            storefront=self.storefront,
+            proxies=self.proxies,
+            verify=self.verify,
+            timeout=self.timeout,
+            version=self.version,
+            limits=self.limits,
+            http2=self.http2,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            circuit_breaker=self.circuit_breaker,
+            cache=self.cache,
+            transport=self._transport,
+        )
+
+
+class Session(EndpointGroups, Client):
+    """Sync client that shares one connection pool across all endpoint groups.
+
+    Endpoint groups are exposed as attributes named after their module, e.g.
+    ``session.units`` or ``session.order_units``.
+    """
+
+    api_package = "kaufland.api"
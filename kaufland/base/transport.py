@@ -0,0 +1,28 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Interface the sync client expects from its transport.
+
+    ``request`` returns a response object exposing ``status_code``, ``headers``,
+    ``content`` and ``text``, e.g. an ``httpx.Response``. Responses without
+    ``content`` are decoded through their ``json()`` method instead.
+
+    Transports may also offer ``stream(*, method, url, headers=None)``, a context
+    manager yielding a response with ``status_code``, ``headers`` and
+    ``iter_bytes()``; downloads then never hold the whole body in memory.
+    """
+
+    def request(self, *, method, url, headers=None, content=None): ...
+
+    def close(self): ...
+
+
+@runtime_checkable
+class AsyncTransport(Protocol):
+    """Interface the asyncio client expects from its transport."""
+
+    async def request(self, *, method, url, headers=None, content=None): ...
+
+    async def close(self): ...
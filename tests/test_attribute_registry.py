@@ -0,0 +1,154 @@
+import pytest
+
+from kaufland import ApiException
+from kaufland.asyncio.attribute_registry import fetch_attribute_registry
+from kaufland.base.ApiResponse import ApiResponse
+from kaufland.base.attribute_registry import (
+    AttributeRegistry,
+    parse_shared_set_csv,
+    valid_ean,
+)
+
+ATTRIBUTES = [
+    {"id": 1, "name": "title", "is_multiple": False, "is_sharedset": False},
+    {"id": 2, "name": "manufacturer", "is_multiple": False, "is_sharedset": True},
+    {"id": 3, "name": "colour", "is_multiple": True, "is_sharedset": True},
+    {"id": 4, "name": "weight", "is_multiple": False, "type": "Float"},
+]
+SHARED_SETS = {
+    2: "value,label\nAcme,Acme Corp\nGlobex,Globex\n",
+    3: "red\nblue\n",
+}
+
+
+class CsvResponse:
+    headers = {}
+
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+class Transport:
+    def __init__(self):
+        self.urls = []
+        self.expired = False
+
+    def request(self, *, method, url, headers=None, content=None):
+        self.urls.append(url)
+        if self.expired:
+            return CsvResponse("<Error><Code>AccessDenied</Code></Error>", 403)
+        return CsvResponse(SHARED_SETS[int(url.rsplit("/", 1)[1])])
+
+
+class Attributes:
+    storefront = "de"
+
+    def __init__(self):
+        self._transport = Transport()
+
+    def iter_attribute_list(self, **params):
+        self.params = params
+        return iter(ATTRIBUTES)
+
+    def get_shared_set_csv_file_by_attribute_id(self, id_attribute, locale):
+        assert locale == "de-DE"
+        return ApiResponse(payload={"data": f"https://files/{id_attribute}"})
+
+
+@pytest.fixture
+def registry():
+    return AttributeRegistry.from_client(Attributes())
+
+
+def test_valid_ean():
+    assert valid_ean("4006381333931")
+    assert valid_ean("96385074")
+    assert not valid_ean("4006381333932")
+    assert not valid_ean("40063813339a1")
+
+
+def test_parse_shared_set_csv():
+    assert parse_shared_set_csv(SHARED_SETS[2]) == {"Acme", "Globex"}
+    assert parse_shared_set_csv(SHARED_SETS[3]) == {"red", "blue"}
+    assert parse_shared_set_csv("") == set()
+
+
+def test_from_client_prefetches_shared_sets(registry):
+    assert len(registry) == 4
+    assert registry.locale == "de-DE"
+    assert registry.shared_sets == {
+        "manufacturer": {"Acme", "Globex"},
+        "colour": {"red", "blue"},
+    }
+
+
+def test_from_client_raises_on_expired_shared_set_url():
+    client = Attributes()
+    client._transport.expired = True
+    with pytest.raises(ApiException) as excinfo:
+        AttributeRegistry.from_client(client)
+    assert excinfo.value.status_code == 403
+
+
+def test_validate(registry):
+    products = [
+        {
+            "ean": ["4006381333931"],
+            "attributes": {"title": ["Pan"], "manufacturer": ["Acme"]},
+        },
+        {
+            "ean": ["4006381333932"],
+            "attributes": {
+                "title": ["Pan", "Frying pan"],
+                "manufacturer": ["Initech"],
+                "colour": ["red", "green"],
+                "weight": ["heavy"],
+                "size": ["XL"],
+            },
+        },
+        {"ean": ["96385074"], "attributes": {"weight": ["1,5"], "colour": ["blue"]}},
+    ]
+    issues = registry.validate(products)
+    assert {issue.index for issue in issues} == {1}
+    assert sorted((issue.field, issue.message) for issue in issues) == [
+        ("colour", "value not in shared set"),
+        ("ean", "invalid EAN"),
+        ("manufacturer", "value not in shared set"),
+        ("size", "unknown attribute"),
+        ("title", "attribute takes a single value"),
+        ("weight", "not a valid Float"),
+    ]
+    assert len(registry.validate(products, allow_unknown=True)) == 5
+
+    valid, issues = registry.filter_valid(products)
+    assert valid == [products[0], products[2]]
+
+
+def test_save_and_load(registry, tmp_path):
+    registry.save(tmp_path / "attributes.json")
+    loaded = AttributeRegistry.load(tmp_path / "attributes.json")
+    assert loaded.storefront == "de"
+    assert loaded.shared_sets == registry.shared_sets
+    assert loaded["weight"]["type"] == "Float"
+
+
+@pytest.mark.anyio
+async def test_fetch_attribute_registry():
+    class AsyncTransport(Transport):
+        async def request(self, **kwargs):
+            return super().request(**kwargs)
+
+    class AsyncAttributes:
+        storefront = "de"
+        _transport = AsyncTransport()
+
+        async def iter_attribute_list(self, **params):
+            for attribute in ATTRIBUTES:
+                yield attribute
+
+        async def get_shared_set_csv_file_by_attribute_id(self, id_attribute, locale):
+            return ApiResponse(payload={"data": f"https://files/{id_attribute}"})
+
+    registry = await fetch_attribute_registry(AsyncAttributes())
+    assert registry.shared_sets["colour"] == {"red", "blue"}
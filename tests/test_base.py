@@ -2,7 +2,11 @@ import httpx
 import pytest
 
 from kaufland.asyncio._transport_httpx import HttpxAsyncTransport
-from kaufland.base._transport_httpx import HttpxTransport
+from kaufland.base._transport_httpx import (
+    HttpxTransport,
+    client_kwargs,
+    shared_ssl_context,
+)
 from kaufland.base.ApiResponse import ApiResponse
 from kaufland.base.base_client import BaseClient
 from kaufland.base.decorators import kaufland_endpoint
@@ -20,6 +24,37 @@ def test_api_response_errors_property():
     assert resp.errors == ["a"]
 
 
+def test_api_response_lazy_payload(monkeypatch):
+    from kaufland.base import json_codec
+
+    calls = []
+
+    class CountingCodec(json_codec.JsonCodec):
+        def loads(self, data):
+            calls.append(data)
+            return super().loads(data)
+
+    monkeypatch.setattr(json_codec, "codec", CountingCodec())
+    resp = ApiResponse.from_content(
+        b'[{"id_unit": 1}]', status_code=207, wrap="responses"
+    )
+    assert not hasattr(resp, "__dict__")
+    assert calls == []
+    assert resp.payload == {"responses": [{"id_unit": 1}]}
+    assert resp.payload is resp.payload
+    assert len(calls) == 1
+    assert resp.raw == '[{"id_unit": 1}]'
+
+    resp.payload = {"replaced": True}
+    assert resp.payload == {"replaced": True}
+
+
+def test_api_response_lazy_text_payload():
+    resp = ApiResponse.from_content(b"plain", status_code=200)
+    assert resp.payload == "plain"
+    assert resp.errors is None
+
+
 def test_kaufland_endpoint_decorator():
     @kaufland_endpoint("/products/{}", method="GET")
     def func(**kwargs):
@@ -41,3 +76,72 @@ async def test_httpx_async_transport():
     transport = HttpxAsyncTransport(timeout=1)
     assert isinstance(transport._client, httpx.AsyncClient)
     await transport.close()
+
+
+def test_httpx_transport_limits_and_http2(monkeypatch):
+    captured = {}
+
+    class RecordingClient:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+    monkeypatch.setattr(httpx, "Client", RecordingClient)
+    transport = HttpxTransport(
+        limits={"max_connections": 5, "keepalive_expiry": 2}, http2=True
+    )
+    assert captured == {}
+    transport._client
+    assert captured["limits"].max_connections == 5
+    assert captured["limits"].keepalive_expiry == 2
+    assert captured["http2"] is True
+
+    captured.clear()
+    HttpxTransport()._client
+    assert "limits" not in captured
+    assert "http2" not in captured
+
+
+def test_httpx_transport_is_lazy_and_shares_ssl_context(monkeypatch):
+    created = []
+    create_ssl_context = httpx.create_ssl_context
+
+    def counting_create_ssl_context(**kwargs):
+        created.append(kwargs)
+        return create_ssl_context(**kwargs)
+
+    monkeypatch.setattr(httpx, "create_ssl_context", counting_create_ssl_context)
+    shared_ssl_context.cache_clear()
+    transport = HttpxTransport()
+    other = HttpxTransport()
+    assert transport._httpx_client is None
+    transport.close()
+    assert created == []
+    assert transport._client is transport._client
+    assert other._client is not transport._client
+    assert len(created) == 1
+
+    options = dict(timeout=None, proxies=None, limits=None, http2=False)
+    first = client_kwargs(verify=True, transport=None, **options)
+    second = client_kwargs(verify=True, transport=None, **options)
+    assert first["verify"] is second["verify"] is shared_ssl_context(True, False)
+    transport.close()
+    other.close()
+
+
+def test_client_forwards_pool_options(monkeypatch):
+    import kaufland.base.client as client_module
+
+    captured = {}
+
+    class RecordingTransport:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+
+    monkeypatch.setattr(client_module, "HttpxTransport", RecordingTransport)
+    limits = httpx.Limits(max_connections=7)
+    client = client_module.Client(
+        client_key="ck", secret_key="sk", limits=limits, http2=True
+    )
+    assert captured["limits"] is limits
+    assert captured["http2"] is True
+    assert client.limits is limits
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kaufland import Client
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.asyncio.batch import map_concurrent
+from kaufland.base.batch import BatchResult, call_arguments, map_threaded
+
+
+def test_call_arguments():
+    assert call_arguments(5, {"storefront": "de"}) == ((5,), {"storefront": "de"})
+    assert call_arguments((1, 2), {}) == ((1, 2), {})
+    assert call_arguments({"id_unit": 3}, {"storefront": "de"}) == (
+        (),
+        {"storefront": "de", "id_unit": 3},
+    )
+
+
+def test_batch_result_unwrap():
+    assert BatchResult(0, 1, result="x").unwrap() == "x"
+    failed = BatchResult(1, 2, error=KeyError("missing"))
+    assert not failed.ok
+    with pytest.raises(KeyError):
+        failed.unwrap()
+
+
+@pytest.mark.anyio
+async def test_map_concurrent_is_bounded_and_captures_errors():
+    running = 0
+    peak = 0
+
+    async def fetch(value, storefront=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (value % 3))
+        running -= 1
+        if value == 4:
+            raise ValueError("bad id")
+        return value * 10, storefront
+
+    consumed = []
+
+    def ids():
+        for value in range(10):
+            consumed.append(value)
+            yield value
+
+    results = []
+    async for result in map_concurrent(fetch, ids(), concurrency=3, storefront="de"):
+        # inputs are pulled lazily, never more than the window ahead
+        assert len(consumed) <= result.index + 1 + 3
+        results.append(result)
+
+    assert peak == 3
+    assert [r.index for r in results] == list(range(10))
+    assert results[1].result == (10, "de")
+    assert isinstance(results[4].error, ValueError)
+
+
+@pytest.mark.anyio
+async def test_map_concurrent_unordered_with_async_input():
+    async def fetch(value):
+        await asyncio.sleep(0.001 * (5 - value))
+        return value
+
+    async def ids():
+        for value in range(5):
+            yield value
+
+    results = [r async for r in map_concurrent(fetch, ids(), ordered=False)]
+    assert sorted(r.result for r in results) == list(range(5))
+    assert [r.result for r in results] != list(range(5))
+
+
+@pytest.mark.anyio
+async def test_client_map_resolves_method_names():
+    class Units(AsyncClient):
+        async def get_unit(self, id_unit, storefront=None):
+            return id_unit, storefront
+
+    client = Units(client_key="client", secret_key="secret", transport=object())
+    results = [r.result async for r in client.map("get_unit", [1, 2], storefront="de")]
+    assert results == [(1, "de"), (2, "de")]
+
+
+def test_map_threaded_is_bounded_and_ordered():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def fetch(value):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.002 * (value % 3))
+        with lock:
+            running -= 1
+        if value == 2:
+            raise ValueError("bad id")
+        return value
+
+    results = list(map_threaded(fetch, range(12), max_workers=4))
+    assert peak <= 4
+    assert [r.index for r in results] == list(range(12))
+    assert [r.result for r in results if r.ok] == [v for v in range(12) if v != 2]
+    assert isinstance(results[2].error, ValueError)
+
+
+def test_imap_unordered_on_shared_transport():
+    class Transport:
+        def __init__(self):
+            self.threads = set()
+
+        def request(self, *, method, url, headers=None, content=None):
+            self.threads.add(threading.get_ident())
+            time.sleep(0.001)
+            return Response(method)
+
+    class Response:
+        def __init__(self, method):
+            self.status_code = 200
+            self.headers = {}
+            self.content = ('{"data": {"method": "%s"}}' % method).encode()
+            self.text = self.content.decode()
+
+    class Units(Client):
+        def get_unit(self, id_unit):
+            return self._request(f"/units/{id_unit}", params={"_method": "GET"})
+
+        def delete_unit(self, id_unit):
+            return self._request(f"/units/{id_unit}", params={"_method": "DELETE"})
+
+    transport = Transport()
+    client = Units(client_key="client", secret_key="secret", transport=transport)
+    methods = [client.get_unit, client.delete_unit] * 10
+
+    results = list(
+        client.imap_unordered(lambda m, i: m(i), list(zip(methods, range(20))))
+    )
+    assert sorted(r.index for r in results) == list(range(20))
+    for result in results:
+        expected = "GET" if result.index % 2 == 0 else "DELETE"
+        assert result.result.payload["data"] == {"method": expected}
+    assert len(transport.threads) > 1
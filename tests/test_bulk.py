@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from kaufland.api.units import Units
+from kaufland.asyncio.api.units import Units as AsyncUnits
+from kaufland.asyncio.bulk import bulk_update_units as async_bulk_update_units
+from kaufland.base.ApiResponse import ApiResponse
+from kaufland.base.bulk import (
+    NoResult,
+    bulk_update_units,
+    chunk_units,
+    dedupe_units,
+    merge_chunk_result,
+)
+from kaufland.base.exceptions import ApiException
+
+
+def bulk_response(body, fail_unit=None):
+    if fail_unit is not None and any(u["id_unit"] == fail_unit for u in body):
+        raise ApiException(status_code=500, payload={"message": "boom"})
+    data = [
+        {"id_unit": u["id_unit"], "status_code": 200, "unit": u["unit_data"]}
+        for u in body
+    ]
+    return ApiResponse(payload={"data": data}, status_code=207)
+
+
+class DummyUnits(Units):
+    def __init__(self, fail_unit=None):
+        self.bodies = []
+        self.params = []
+        self.fail_unit = fail_unit
+        self.lock = threading.Lock()
+
+    def _request(self, path, **kwargs):
+        assert path == "/units/bulk"
+        with self.lock:
+            self.bodies.append(kwargs["data"])
+            self.params.append(kwargs["params"])
+        return bulk_response(kwargs["data"], self.fail_unit)
+
+
+class DummyAsyncUnits(AsyncUnits):
+    def __init__(self, fail_unit=None):
+        self.bodies = []
+        self.fail_unit = fail_unit
+
+    async def _request(self, path, **kwargs):
+        self.bodies.append(kwargs["data"])
+        return bulk_response(kwargs["data"], self.fail_unit)
+
+
+def updates(count, price=100):
+    return (
+        {"id_unit": i, "unit_data": {"listing_price": price + i}}
+        for i in range(1, count + 1)
+    )
+
+
+def test_dedupe_last_write_wins():
+    units = [
+        {"id_unit": 1, "unit_data": {"listing_price": 1}},
+        {"id_unit": 2, "unit_data": {"listing_price": 2}},
+        {"id_unit": 1, "unit_data": {"listing_price": 3}},
+    ]
+    assert dedupe_units(units) == [
+        {"id_unit": 1, "unit_data": {"listing_price": 3}},
+        {"id_unit": 2, "unit_data": {"listing_price": 2}},
+    ]
+
+
+def test_chunk_units_limit():
+    assert [len(c) for c in chunk_units(list(range(320)))] == [150, 150, 20]
+    with pytest.raises(ValueError):
+        chunk_units([], 151)
+
+
+def test_bulk_update_units_chunks_and_merges():
+    client = DummyUnits()
+    units = list(updates(400)) + [{"id_unit": 5, "unit_data": {"listing_price": 1}}]
+    results = bulk_update_units(client, units, storefront="de")
+
+    assert sorted(len(body) for body in client.bodies) == [100, 150, 150]
+    assert all(params["storefront"] == "de" for params in client.params)
+    assert len(results) == 400
+    assert results[5]["unit"] == {"listing_price": 1}
+    assert results[400]["status_code"] == 200
+
+
+def test_bulk_update_units_failed_chunk():
+    client = DummyUnits(fail_unit=160)
+    results = bulk_update_units(client, updates(300))
+    assert isinstance(results[151], ApiException)
+    assert isinstance(results[300], ApiException)
+    assert results[150]["status_code"] == 200
+
+
+def test_units_missing_from_the_response_get_no_result():
+    internal_error = {"status_code": 500, "message": "internal error"}
+    response = ApiResponse(
+        payload={"data": [{"id_unit": 1, "status_code": 200}, internal_error]},
+        status_code=207,
+    )
+    results = merge_chunk_result({}, [{"id_unit": 1}, {"id_unit": 2}], response)
+    assert results[1] == {"id_unit": 1, "status_code": 200}
+    assert isinstance(results[2], NoResult)
+    assert results[2].entries == [internal_error]
+
+
+@pytest.mark.anyio
+async def test_async_bulk_update_units():
+    client = DummyAsyncUnits(fail_unit=1)
+    results = await async_bulk_update_units(
+        client, updates(1000), concurrency=3, storefront="de"
+    )
+    assert len(client.bodies) == 7
+    assert all(len(body) <= 150 for body in client.bodies)
+    assert isinstance(results[150], ApiException)
+    assert results[151]["status_code"] == 200
+    assert len(results) == 1000
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kaufland import Client
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.base import cache as cache_module
+from kaufland.base.cache import MemoryCache, ResponseCache, SqliteCache
+
+
+class DummyResponse:
+    def __init__(self, status_code=200, content=b'{"data": [1]}'):
+        self.status_code = status_code
+        self.headers = {"Content-Type": "application/json"}
+        self.content = content
+        self.text = content.decode()
+
+
+class CountingTransport:
+    def __init__(self, status_code=200, delay=0):
+        self.status_code = status_code
+        self.delay = delay
+        self.urls = []
+
+    def request(self, *, method, url, headers=None, content=None):
+        self.urls.append(url)
+        time.sleep(self.delay)
+        return DummyResponse(self.status_code)
+
+
+def categories_client(transport, **kwargs):
+    class Categories(Client):
+        def get_category_tree(self, **params):
+            return self._request(
+                "/categories/tree", params={**params, "_method": "GET"}
+            )
+
+        def get_units(self):
+            return self._request("/units/", params={"_method": "GET"})
+
+    return Categories(
+        client_key="client", secret_key="secret", transport=transport, **kwargs
+    )
+
+
+def test_ttl_uses_longest_prefix():
+    cache = ResponseCache(ttls={"/categories": 100, "/categories/tree": 5})
+    assert cache.ttl("/categories/tree") == 5
+    assert cache.ttl("/categories/12") == 100
+    assert cache.ttl("/categoriesx") is None
+    assert cache.ttl("/units/") is None
+    assert ResponseCache().ttl("/info/locale") == cache_module.DEFAULT_TTLS["/info"]
+
+
+def test_memory_cache_expires_and_evicts(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    backend = MemoryCache(maxsize=2)
+    backend.set("a", DummyResponse(), 10)
+    backend.set("b", DummyResponse(), 10)
+    assert backend.get("a").content == b'{"data": [1]}'
+    backend.set("c", DummyResponse(), 10)
+    assert backend.get("b") is None
+    now[0] += 11
+    assert backend.get("a") is None
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    backend = SqliteCache(tmp_path / "cache.db", maxsize=1)
+    backend.set("a", DummyResponse(), 60)
+    cached = SqliteCache(tmp_path / "cache.db").get("a")
+    assert cached.status_code == 200
+    assert cached.headers["content-type"] == "application/json"
+    assert cached.content == b'{"data": [1]}'
+    backend.set("b", DummyResponse(), 60)
+    assert backend.get("a") is None
+    backend.close()
+
+
+def test_client_serves_reference_endpoints_from_cache():
+    transport = CountingTransport()
+    client = categories_client(transport, cache=ResponseCache(), storefront="de")
+
+    first = client.get_category_tree()
+    second = client.get_category_tree()
+    assert second.payload == first.payload == {"data": [1]}
+    client.get_category_tree(locale="en-GB")
+    client.get_units()
+    client.get_units()
+    assert len(transport.urls) == 4
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_writes_invalidate_cached_reads(tmp_path, backend):
+    class ShippingGroups(Client):
+        def get_shipping_groups(self, **params):
+            return self._request("/shipping-groups", method="GET", params=params)
+
+        def update_shipping_group(self, id_shipping_group, body):
+            return self._request(
+                f"/shipping-groups/{id_shipping_group}", method="PATCH", data=body
+            )
+
+    if backend == "memory":
+        backend = MemoryCache()
+    else:
+        backend = SqliteCache(tmp_path / "cache.db")
+    transport = CountingTransport()
+    client = ShippingGroups(
+        client_key="client",
+        secret_key="secret",
+        transport=transport,
+        cache=ResponseCache(backend),
+        storefront="de",
+    )
+    backend.set("client GET http://other/categories", DummyResponse(), 60)
+
+    client.get_shipping_groups()
+    client.get_shipping_groups()
+    assert len(transport.urls) == 1
+    client.update_shipping_group(5, {"name": "Express"})
+    client.get_shipping_groups()
+    assert len(transport.urls) == 3
+    assert backend.get("client GET http://other/categories") is not None
+
+
+def test_errors_are_not_cached():
+    transport = CountingTransport(status_code=500)
+    client = categories_client(transport, cache=ResponseCache())
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client.get_category_tree()
+    assert len(transport.urls) == 2
+
+
+def test_concurrent_misses_are_coalesced():
+    transport = CountingTransport(delay=0.05)
+    client = categories_client(transport, cache=ResponseCache())
+    barrier = threading.Barrier(5)
+    payloads = []
+
+    def fetch():
+        barrier.wait()
+        payloads.append(client.get_category_tree().payload)
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(transport.urls) == 1
+    assert payloads == [{"data": [1]}] * 5
+
+
+@pytest.mark.anyio
+async def test_async_concurrent_misses_are_coalesced():
+    class Transport:
+        calls = 0
+
+        async def request(self, **kwargs):
+            Transport.calls += 1
+            await asyncio.sleep(0.01)
+            return DummyResponse()
+
+    class Info(AsyncClient):
+        async def get_all_locales(self):
+            return await self._request("/info/locale", params={"_method": "GET"})
+
+    client = Info(
+        client_key="client",
+        secret_key="secret",
+        transport=Transport(),
+        cache=ResponseCache(),
+    )
+    responses = await asyncio.gather(*(client.get_all_locales() for _ in range(5)))
+    assert Transport.calls == 1
+    assert {r.payload["data"][0] for r in responses} == {1}
@@ -0,0 +1,80 @@
+import pytest
+
+from kaufland.asyncio.category_index import fetch_category_index
+from kaufland.base.ApiResponse import ApiResponse
+from kaufland.base.category_index import CategoryIndex
+
+
+def node(id_category, name, parent, *children):
+    return {
+        "id_category": id_category,
+        "name": name,
+        "id_parent_category": parent,
+        "title_singular": name,
+        "title_plural": name + "s",
+        "children": list(children),
+    }
+
+
+TREE = {
+    "data": node(
+        1,
+        "root",
+        1,
+        node(2, "Garden", 1, node(4, "Lawn Mower", 2), node(5, "Hose", 2)),
+        node(3, "Kitchen", 1, node(6, "Pan", 3, node(7, "Frying Pan", 6))),
+    )
+}
+
+
+@pytest.fixture
+def index():
+    return CategoryIndex.from_payload(TREE, storefront="de", locale="de-DE")
+
+
+def test_lookup_and_ancestry(index):
+    assert len(index) == 7
+    assert index[7]["name"] == "Frying Pan"
+    assert "children" not in index[7]
+    assert index.get(99) is None
+    assert index.parent(1) is None
+    assert index.parent(7)["id_category"] == 6
+    assert [c["id_category"] for c in index.ancestors(7)] == [6, 3, 1]
+    assert [c["name"] for c in index.path(4)] == ["root", "Garden", "Lawn Mower"]
+    assert [c["id_category"] for c in index.children(2)] == [4, 5]
+    assert [c["id_category"] for c in index.descendants(3)] == [6, 7]
+    assert index.is_leaf(5) and not index.is_leaf(6)
+    assert index.is_descendant(7, 3) and not index.is_descendant(7, 2)
+
+
+def test_search(index):
+    assert [c["id_category"] for c in index.by_name("pan")] == [6]
+    assert [c["id_category"] for c in index.search("PAN")] == [6, 7]
+    assert [c["id_category"] for c in index.search("pan", leaves_only=True)] == [7]
+    assert len(index.search("a", limit=2)) == 2
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / "categories.json"
+    index.save(path)
+    loaded = CategoryIndex.load(path, storefront="de")
+    assert loaded.locale == "de-DE"
+    assert [c["id_category"] for c in loaded.path(7)] == [1, 3, 6, 7]
+    with pytest.raises(ValueError):
+        CategoryIndex.load(path, storefront="fr")
+
+
+@pytest.mark.anyio
+async def test_fetch_category_index():
+    class Categories:
+        storefront = "cz"
+
+        async def get_category_tree(self, **params):
+            self.params = params
+            return ApiResponse(payload=TREE)
+
+    client = Categories()
+    index = await fetch_category_index(client, locale="cs-CZ")
+    assert client.params == {"storefront": "cz", "locale": "cs-CZ"}
+    assert index.storefront == "cz"
+    assert len(index) == 7
@@ -0,0 +1,166 @@
+import json
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs
+
+import pytest
+
+from kaufland import Session, WSGITransport
+from kaufland.asyncio.changes import ChangeSync as AsyncChangeSync
+from kaufland.base.changes import (
+    ChangeSync,
+    JsonCheckpoint,
+    MemoryCheckpoint,
+    SqliteCheckpoint,
+    parse_timestamp,
+)
+
+
+class OrderUnitServer:
+    """Serves /order-units with the timestamp filter, sorting and pagination."""
+
+    def __init__(self, units):
+        self.units = units
+        self.queries = []
+
+    def __call__(self, environ, start_response):
+        query = {k: v[0] for k, v in parse_qs(environ["QUERY_STRING"]).items()}
+        self.queries.append(query)
+        units = list(self.units.values())
+        since = parse_timestamp(query.get("ts_updated_from_iso"))
+        if since is not None:
+            units = [u for u in units if parse_timestamp(u["ts_updated_iso"]) >= since]
+        units.sort(key=lambda u: u["ts_updated_iso"], reverse=True)
+        offset, limit = int(query.get("offset", 0)), int(query["limit"])
+        body = {
+            "data": units[offset : offset + limit],
+            "pagination": {"offset": offset, "limit": limit, "total": len(units)},
+        }
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps(body).encode("utf-8")]
+
+
+def unit(id_order_unit, minutes):
+    updated = datetime(2024, 5, 1, 12, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+    return {
+        "id_order_unit": id_order_unit,
+        "ts_updated_iso": updated.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+@pytest.fixture
+def server():
+    return OrderUnitServer({i: unit(i, i) for i in range(1, 251)})
+
+
+@pytest.fixture
+def session(server):
+    return Session(
+        client_key="ck",
+        secret_key="sk",
+        storefront="de",
+        endpoint="http://testserver/v2",
+        transport=WSGITransport(server),
+    )
+
+
+def keys(upserts):
+    return sorted(upsert.key for upsert in upserts)
+
+
+def test_first_run_reads_everything_and_sets_mark(session, server):
+    sync = ChangeSync(session, MemoryCheckpoint(), lookback=120)
+    upserts = list(sync.changes("order_units"))
+
+    assert keys(upserts) == list(range(1, 251))
+    assert upserts[0].storefront == "de"
+    assert server.queries[0]["sort"] == "ts_updated:desc"
+    assert server.queries[0]["storefront"] == "de"
+    assert "ts_updated_from_iso" not in server.queries[0]
+    assert sync.mark("order_units") == datetime(2024, 5, 1, 16, 10, tzinfo=timezone.utc)
+
+
+def test_next_run_only_emits_changes(session, server):
+    sync = ChangeSync(session, MemoryCheckpoint(), lookback=120)
+    list(sync.changes("order_units"))
+    server.queries.clear()
+
+    assert list(sync.changes("order_units")) == []
+    assert server.queries[0]["ts_updated_from_iso"] == "2024-05-01T16:08:00Z"
+
+    # Changed in the same second as the mark, and a late commit inside the window.
+    server.units[3] = unit(3, 250)
+    server.units[251] = unit(251, 249)
+    assert keys(sync.changes("order_units")) == [3, 251]
+    assert list(sync.changes("order_units")) == []
+
+
+def test_mark_is_kept_if_the_loop_stops_early(session, server):
+    sync = ChangeSync(session, MemoryCheckpoint())
+    for _upsert in sync.changes("order_units"):
+        break
+    assert sync.mark("order_units") is None
+
+    sync.reset("order_units")
+    sync = ChangeSync(session, MemoryCheckpoint(), start="2024-05-01T16:00:00Z")
+    assert keys(sync.changes("order_units")) == list(range(240, 251))
+
+
+def test_marks_are_kept_per_storefront(session, server):
+    sync = ChangeSync(session, MemoryCheckpoint())
+    list(sync.changes("order_units", storefront="cz"))
+    assert server.queries[-1]["storefront"] == "cz"
+    assert sync.mark("order_units", storefront="cz") is not None
+    assert sync.mark("order_units") is None
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_checkpoints_persist(tmp_path, session, backend):
+    def checkpoint():
+        if backend == "json":
+            return JsonCheckpoint(tmp_path / "changes.json")
+        return SqliteCheckpoint(tmp_path / "changes.db")
+
+    list(ChangeSync(session, checkpoint()).changes("order_units"))
+    sync = ChangeSync(session, checkpoint())
+    assert sync.mark("order_units") == datetime(2024, 5, 1, 16, 10, tzinfo=timezone.utc)
+    assert list(sync.changes("order_units")) == []
+
+    sync.reset("order_units")
+    assert sync.mark("order_units") is None
+
+
+def test_unknown_resource(session):
+    with pytest.raises(ValueError, match="Unknown resource"):
+        list(ChangeSync(session, MemoryCheckpoint()).changes("units"))
+
+
+class AsyncTickets:
+    storefront = None
+
+    def __init__(self, tickets):
+        self.tickets = tickets
+        self.params = []
+
+    async def iter_tickets(self, **params):
+        self.params.append(params)
+        since = parse_timestamp(params.get("ts_updated_from_iso"))
+        for ticket in self.tickets:
+            if since is None or parse_timestamp(ticket["ts_updated_iso"]) >= since:
+                yield ticket
+
+
+@pytest.mark.anyio
+async def test_async_change_sync():
+    tickets = AsyncTickets(
+        [
+            {"id_ticket": "a", "ts_updated_iso": "2024-05-01T12:00:00+02:00"},
+            {"id_ticket": "b", "ts_updated_iso": "2024-05-01T09:30:00Z"},
+        ]
+    )
+    sync = AsyncChangeSync(tickets, MemoryCheckpoint(), lookback=60)
+    assert [u.key async for u in sync.changes("tickets")] == ["a", "b"]
+    assert tickets.params[0] == {"sort": "ts_updated_iso:desc"}
+
+    tickets.tickets.append({"id_ticket": "c", "ts_updated_iso": "2024-05-01T10:05Z"})
+    assert [u.key async for u in sync.changes("tickets")] == ["c"]
+    assert tickets.params[1]["ts_updated_from_iso"] == "2024-05-01T09:59:00Z"
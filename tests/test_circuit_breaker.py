@@ -0,0 +1,149 @@
+import httpx
+import pytest
+
+from kaufland import Client
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.base import circuit_breaker
+from kaufland.base.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from kaufland.base.exceptions import CircuitOpenException, KauflandException
+
+
+class DummyResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b'{"data": {}}'
+        self.text = '{"data": {}}'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def fail(breaker, path, times=1):
+    for _ in range(times):
+        breaker.before(path)
+        breaker.record(path, response=DummyResponse(503))
+
+
+def test_opens_on_failure_rate_per_group(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, minimum_calls=4)
+    breaker.before("/units/")
+    breaker.record("/units/", response=DummyResponse(200))
+    fail(breaker, "/units/{}", 2)
+    assert breaker.state("/units/") == CLOSED
+    fail(breaker, "/units/")
+    assert breaker.state("/units/") == OPEN
+
+    with pytest.raises(CircuitOpenException) as info:
+        breaker.before("/units/bulk")
+    assert isinstance(info.value, KauflandException)
+    assert info.value.group == "units"
+    breaker.before("/orders/")
+
+
+def test_client_errors_do_not_count(clock):
+    breaker = CircuitBreaker(minimum_calls=2)
+    for _ in range(5):
+        breaker.record("/units/", response=DummyResponse(404))
+    breaker.record("/units/", error=httpx.ConnectError("boom"))
+    assert breaker.state("/units/") == CLOSED
+
+
+def test_window_expires_outcomes(clock):
+    breaker = CircuitBreaker(minimum_calls=3, window=10)
+    fail(breaker, "/units/", 2)
+    clock.now += 11
+    fail(breaker, "/units/")
+    assert breaker.metrics()["groups"]["units"]["calls"] == 1
+    assert breaker.state("/units/") == CLOSED
+
+
+def test_half_open_probes(clock):
+    changes = []
+    breaker = CircuitBreaker(
+        minimum_calls=1,
+        reset_timeout=30,
+        on_state_change=lambda *change: changes.append(change),
+    )
+    fail(breaker, "/reports/")
+    clock.now += 30
+
+    breaker.before("/reports/")
+    assert breaker.state("/reports/") == HALF_OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before("/reports/")
+    breaker.record("/reports/", response=DummyResponse(500))
+    assert breaker.state("/reports/") == OPEN
+
+    clock.now += 30
+    breaker.before("/reports/")
+    breaker.record("/reports/", response=DummyResponse(200))
+    assert breaker.state("/reports/") == CLOSED
+
+    assert changes == [
+        ("reports", CLOSED, OPEN),
+        ("reports", OPEN, HALF_OPEN),
+        ("reports", HALF_OPEN, OPEN),
+        ("reports", OPEN, HALF_OPEN),
+        ("reports", HALF_OPEN, CLOSED),
+    ]
+    metrics = breaker.metrics()
+    assert metrics["transitions"][("reports", CLOSED, OPEN)] == 1
+    assert metrics["transitions"][("reports", OPEN, HALF_OPEN)] == 2
+    assert metrics["groups"]["reports"]["rejected"] == 1
+
+
+class FailingTransport:
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        return DummyResponse(503)
+
+
+def test_client_fails_fast_when_open(clock):
+    transport = FailingTransport()
+    client = Client(
+        client_key="client",
+        secret_key="secret",
+        transport=transport,
+        circuit_breaker=CircuitBreaker(minimum_calls=2),
+    )
+    for _ in range(2):
+        with pytest.raises(Exception) as info:
+            client._request("/units/", params={"_method": "GET"})
+        assert not isinstance(info.value, CircuitOpenException)
+    with pytest.raises(CircuitOpenException):
+        client._request("/units/", params={"_method": "GET"})
+    assert transport.calls == 2
+
+
+@pytest.mark.anyio
+async def test_async_client_records_transport_errors(clock):
+    class Transport:
+        async def request(self, **kwargs):
+            raise httpx.ConnectError("down")
+
+    client = AsyncClient(
+        client_key="client",
+        secret_key="secret",
+        transport=Transport(),
+        circuit_breaker=CircuitBreaker(minimum_calls=1),
+    )
+    with pytest.raises(httpx.ConnectError):
+        await client._request("/orders/", params={"_method": "GET"})
+    with pytest.raises(CircuitOpenException):
+        await client._request("/orders/", params={"_method": "GET"})
@@ -118,6 +118,40 @@ def test_client_partner_headers():
     assert "Shop-Partner-Signature" in headers
 
 
+def test_client_reuses_signing_keys():
+    client = Client(
+        client_key="ck",
+        secret_key="sk",
+        partner_client_key="pck",
+        partner_secret_key="psk",
+    )
+    client._transport = DummyTransport(DummyResponse(json_data={"ok": True}))
+    key = client._signing_key("sk")
+    assert client._signing_key("sk") is key
+    assert client._signing_key("psk") is not key
+    assert client._signing_key(None) is None
+
+    headers = {"Shop-Timestamp": "1411055926"}
+    client._request("/units/", headers=headers)
+    req = client._transport.last_request
+    assert req["headers"]["Shop-Signature"] == sign_request(
+        "GET", req["url"], "", 1411055926, "sk"
+    )
+    assert req["headers"]["Shop-Partner-Signature"] == sign_request(
+        "GET", req["url"], "", 1411055926, "psk"
+    )
+
+    signer = client._request_signer()
+    assert client._request_signer() is signer
+    client.secret_key = "rotated"
+    assert client._request_signer() is not signer
+    client._request("/units/", headers=headers)
+    req = client._transport.last_request
+    assert req["headers"]["Shop-Signature"] == sign_request(
+        "GET", req["url"], "", 1411055926, "rotated"
+    )
+
+
 def test_client_error_raises_api_exception():
     response = DummyResponse(status_code=400, json_data={"error": "bad"})
     transport = DummyTransport(response)
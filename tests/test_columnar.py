@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from kaufland.base._schemas import SCHEMAS
+from kaufland.base.columnar import (
+    arrow_schema,
+    record_batches,
+    write_ipc,
+    write_parquet,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+def order_unit(i):
+    return {
+        "id_order_unit": 314567896580917 + i,
+        "id_order": f"MB7UW{i}",
+        "ts_created_iso": "2021-07-24T19:26:05Z",
+        "status": "sent",
+        "price": 200 + i,
+        "vat": 19,
+        "buyer": {"id_buyer": 21631426, "email": None},
+        "product": {"id_product": 362524873, "eans": ["0194252013212"]},
+        "unknown": "dropped",
+    }
+
+
+def test_schemas_are_generated_from_swagger():
+    assert SCHEMAS["Unit"]["id_unit"] == "int64"
+    assert SCHEMAS["OrderUnit"]["ts_created_iso"] == "timestamp"
+    assert SCHEMAS["Report"]["parameters"]["list"]["struct"]["value"] == "json"
+
+
+def test_record_batches_are_typed_and_bounded():
+    batches = list(record_batches(map(order_unit, range(5)), "OrderUnit", batch_size=2))
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    schema = batches[0].schema
+    assert schema == arrow_schema("OrderUnit")
+    assert schema.field("price").type == pa.int32()
+    assert schema.field("vat").type == pa.float32()
+    assert "unknown" not in schema.names
+
+    row = batches[0].to_pylist()[1]
+    assert row["id_order_unit"] == 314567896580918
+    assert row["ts_created_iso"] == datetime(
+        2021, 7, 24, 19, 26, 5, tzinfo=timezone.utc
+    )
+    assert row["buyer"] == {"id_buyer": 21631426, "email": None}
+    assert row["product"]["eans"] == ["0194252013212"]
+    assert row["note"] is None
+
+
+def test_report_parameters_become_json():
+    report = {
+        "id_report": 1,
+        "parameters": [{"name": "id_category", "value": 5}],
+    }
+    (batch,) = record_batches([report], "Report")
+    assert batch.to_pylist()[0]["parameters"] == [{"name": "id_category", "value": "5"}]
+
+
+def test_write_parquet_and_ipc(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [{"id_offer": str(i), "price": "1.5"} for i in range(25)]
+    assert write_parquet(rows, tmp_path / "report.parquet", batch_size=10) == 25
+    table = pq.read_table(tmp_path / "report.parquet")
+    assert table.num_rows == 25
+    assert table.schema.field("price").type == pa.string()
+
+    units = [{"id_unit": i, "amount": 3} for i in range(3)]
+    assert write_ipc(units, tmp_path / "units.arrow", "Unit") == 3
+    table = pa.ipc.open_file(tmp_path / "units.arrow").read_all()
+    assert table.column("amount").to_pylist() == [3, 3, 3]
@@ -1,20 +1,35 @@
 import base64
 import hashlib
 import hmac
+from enum import Enum, IntEnum
+from urllib.parse import urlencode
 
+import httpx
 import pytest
 
 from kaufland.base._core import (
+    encode_query,
     parse_response,
     prepare_request,
+    request_url,
     resolve_method,
     sign_request,
+    signing_key,
 )
 from kaufland.base.ApiResponse import ApiResponse
-from kaufland.base.decorators import fill_query_params
+from kaufland.base.decorators import Route, fill_query_params
 from kaufland.base.exceptions import ApiException
 
 
+class Storefront(str, Enum):
+    DE = "de"
+    CZ = "cz"
+
+
+class Count(IntEnum):
+    ONE = 1
+
+
 class DummyResponse:
     def __init__(
         self, status_code=200, headers=None, text="", json_data=None, json_raises=False
@@ -59,6 +74,91 @@ def test_sign_request_base64():
     )
 
 
+def test_sign_request_with_signing_key():
+    key = signing_key("secret")
+    args = ("GET", "https://sellerapi.kaufland.com/v2/units/", "", 1411055926)
+    assert sign_request(*args, key) == sign_request(*args, "secret")
+    assert sign_request(*args, key) == sign_request(*args, key)
+    assert sign_request(*args, key, encoding="base64") == sign_request(
+        *args, "secret", encoding="base64"
+    )
+
+
+@pytest.mark.parametrize("secret", ["sk", "x" * 64, "y" * 100, "ü" * 40])
+def test_signing_key_matches_hmac(secret):
+    args = ("POST", "https://sellerapi.kaufland.com/v2/units/", "{}", 1411055926)
+    keyed = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+    for encoding in ("hex", "base64"):
+        expected = sign_request(*args, keyed, encoding=encoding)
+        assert sign_request(*args, signing_key(secret), encoding=encoding) == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"embedded": ["category", "units"], "limit": 100, "offset": 0},
+        {"q": "a b/c", "flag": True, "price": 1.5, "id": -1, "ü": "ß"},
+        {"ts_updated_from_iso": "2024-01-01T00:00:00Z", "storefront": "de"},
+        {"empty": [], "none": None, "raw": b"\xff", "nested": {"a": 1}},
+        {"one": 1, "true": True, "float": 1.0},
+        {"storefront": Storefront.DE, "ids": [Storefront.CZ, "sk"], "n": Count.ONE},
+    ],
+)
+def test_encode_query_matches_urlencode(params):
+    assert encode_query(params) == urlencode(params, doseq=True)
+
+
+def test_request_url_appends_storefront():
+    endpoint = "https://sellerapi.kaufland.com/v2/"
+    assert (
+        request_url(endpoint, "/units/", {"limit": 1}, True, "de", None)
+        == "https://sellerapi.kaufland.com/v2/units/?limit=1&storefront=de"
+    )
+    assert (
+        request_url(endpoint, "units", None, True, "de", None)
+        == "https://sellerapi.kaufland.com/v2/units?storefront=de"
+    )
+    assert (
+        request_url(endpoint, "/units?x=1", {"storefront": "cz"}, True, "de", None)
+        == "https://sellerapi.kaufland.com/v2/units?x=1&storefront=cz"
+    )
+    assert (
+        request_url(endpoint, "units", None, True, Storefront.CZ, None)
+        == "https://sellerapi.kaufland.com/v2/units?storefront=cz"
+    )
+    assert (
+        request_url(endpoint, "/<version>/info", None, False, "de", "v1")
+        == "https://sellerapi.kaufland.com/v2/v1/info"
+    )
+
+
+def test_route_fill():
+    route = Route("/products/{id_product}/units/{}", "get", add_storefront=False)
+    assert route.method == "GET"
+    assert route.group == "products"
+    assert route.params == 2
+    assert route.fill(456, "a b/c") == "/products/456/units/a%20b%2Fc"
+    assert route.fill("ean-1_2.3", 7) == fill_query_params(
+        "/products/{}/units/{}", "ean-1_2.3", 7
+    )
+    assert Route("/units").fill() == "/units"
+    with pytest.raises(TypeError):
+        route.fill(1)
+
+
+def test_route_decorator_tags_function():
+    route = Route("/units/{}", "PATCH")
+
+    @route
+    def patch_unit(self, id_unit, **kwargs):
+        return kwargs
+
+    assert patch_unit.route is route
+    assert patch_unit.path == "/units/{}"
+    assert patch_unit.method == "PATCH"
+    assert patch_unit(None, 1, a=2) == {"a": 2}
+
+
 def test_prepare_request_adds_storefront_and_partner_headers():
     prepared = prepare_request(
         method="POST",
@@ -125,6 +225,40 @@ def test_parse_response_text_on_json_error():
     assert parsed.payload == "not json"
 
 
+def test_parse_response_decodes_content_once():
+    class BytesResponse:
+        status_code = 200
+        headers = httpx.Headers({"X-Request-Id": "abc"})
+        content = '{"data": [{"name": "Ä"}]}'.encode("utf-8")
+
+        @property
+        def text(self):
+            raise AssertionError("text must not be decoded on the fast path")
+
+        def json(self):
+            raise AssertionError("json must not be called on the fast path")
+
+    res = BytesResponse()
+    parsed = parse_response(res, method="GET")
+    assert parsed.payload == {"data": [{"name": "Ä"}]}
+    assert parsed.headers is res.headers
+    assert parsed.headers["x-request-id"] == "abc"
+    assert parsed.content is res.content
+    assert parsed.raw == '{"data": [{"name": "Ä"}]}'
+
+
+def test_parse_response_httpx_response():
+    res = httpx.Response(200, content=b"not json")
+    parsed = parse_response(res, method="GET")
+    assert parsed.payload == "not json"
+    assert parsed.raw == "not json"
+
+    res = httpx.Response(204)
+    parsed = parse_response(res, method="DELETE")
+    assert parsed.payload is None
+    assert parsed.raw == ""
+
+
 def test_parse_response_error_raises():
     res = DummyResponse(status_code=400, headers={}, json_data={"error": "bad"})
     with pytest.raises(ApiException) as exc:
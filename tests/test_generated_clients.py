@@ -37,8 +37,11 @@ def test_generated_products_path_params():
     client.get_product(123, embedded="category")
     path, kwargs = client.last
     assert path == "/products/123"
-    assert kwargs["params"]["embedded"] == "category"
+    assert kwargs["method"] == "GET"
+    assert kwargs["params"] == {"embedded": "category"}
     assert kwargs["add_storefront"] is True
+    assert Products.get_product.route.template == "/products/{}"
+    assert Products.get_product.method == "GET"
 
 
 def test_generated_post_body():
@@ -46,6 +49,7 @@ def test_generated_post_body():
     client.create_shipping_label(body={"ids_order_units": [1]})
     path, kwargs = client.last
     assert path == "/shipping-labels"
+    assert kwargs["method"] == "POST"
     assert kwargs["data"] == {"ids_order_units": [1]}
     assert kwargs["add_storefront"] is False
 
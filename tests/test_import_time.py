@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Eager imports of all clients and httpx took ~200ms; lazy loading is ~50ms.
+IMPORT_BUDGET_US = 150_000
+DEFERRED = ("httpx", "asyncio", "sqlite3", "email.utils")
+
+
+def profile_import(statement):
+    """Run ``statement`` in a fresh interpreter and return the modules it loaded
+    and the cumulative import time in microseconds per module."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}; import sys; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return set(result.stdout.split()), times
+
+
+def test_importing_api_package_is_lazy():
+    modules, times = profile_import("import kaufland.api")
+    assert [m for m in modules if m.startswith("kaufland.api.")] == []
+    assert [m for m in DEFERRED if m in modules] == []
+    assert times["kaufland.api"] < IMPORT_BUDGET_US
+
+
+def test_client_modules_load_on_first_access():
+    modules, _ = profile_import("from kaufland.asyncio.api import Orders")
+    loaded = [m for m in modules if m.startswith("kaufland.asyncio.api.")]
+    assert loaded == ["kaufland.asyncio.api.orders"]
+    assert "httpx" not in modules
+
+
+def test_webhook_receiver_does_not_load_httpx():
+    modules, _ = profile_import("from kaufland.asyncio.webhooks import WebhookReceiver")
+    assert "httpx" not in modules
+
+
+def test_lazy_exports():
+    import kaufland.api
+
+    assert "Units" in dir(kaufland.api)
+    assert kaufland.api.Units.__module__ == "kaufland.api.units"
+    assert sorted(kaufland.api.__all__) == sorted(kaufland.api._MODULES)
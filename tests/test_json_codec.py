@@ -0,0 +1,84 @@
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from kaufland.base import json_codec
+from kaufland.base._core import prepare_request, sign_request
+
+PAYLOAD = [{"id_unit": 1, "unit_data": {"note": "Größe XL", "listing_price": 1999}}]
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def codec(request):
+    try:
+        selected = json_codec.set_codec(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    yield selected
+    json_codec.set_codec(None)
+
+
+def test_codec_round_trip(codec):
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+    with pytest.raises(ValueError):
+        codec.loads(b"not json")
+
+
+def test_codec_compact_utf8_output(codec):
+    assert codec.dumps({"a": "ä", "b": [1, 2]}) == '{"a":"ä","b":[1,2]}'.encode()
+
+
+class Storefront(str, Enum):
+    DE = "de"
+
+
+def test_codec_matches_stdlib_for_datetimes_and_subclasses(codec):
+    assert codec.dumps({"storefront": Storefront.DE}) == b'{"storefront":"de"}'
+    if codec.name == "msgspec":
+        assert (
+            codec.dumps({"ts": datetime(2024, 5, 1)}) == b'{"ts":"2024-05-01T00:00:00"}'
+        )
+        return
+    with pytest.raises(TypeError):
+        codec.dumps({"ts": datetime(2024, 5, 1)})
+
+
+def test_signature_matches_sent_body(codec):
+    prepared = prepare_request(
+        method="POST",
+        endpoint="https://sellerapi.kaufland.com/v2",
+        path="/units/bulk",
+        params=None,
+        data=PAYLOAD,
+        headers={"Shop-Timestamp": "1411055926"},
+        add_storefront=False,
+        storefront=None,
+        version=None,
+        client_key="ck",
+        secret_key="sk",
+        user_agent="ua",
+        partner_client_key=None,
+        partner_secret_key=None,
+        signature_encoding="hex",
+    )
+    expected = sign_request(
+        "POST", prepared["url"], prepared["content"].decode("utf-8"), 1411055926, "sk"
+    )
+    assert prepared["headers"]["Shop-Signature"] == expected
+
+
+def test_set_codec_unknown_name():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("yaml")
+
+
+def test_codec_from_environment(monkeypatch):
+    monkeypatch.setenv("KAUFLAND_JSON_CODEC", "json")
+    try:
+        assert type(json_codec.set_codec(None)) is json_codec.JsonCodec
+    finally:
+        monkeypatch.delenv("KAUFLAND_JSON_CODEC")
+        json_codec.set_codec(None)
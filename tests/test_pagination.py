@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from kaufland.api.attributes import Attributes
+from kaufland.api.units import Units
+from kaufland.asyncio.api.order_units import OrderUnits as AsyncOrderUnits
+from kaufland.base.ApiResponse import ApiResponse
+from kaufland.base.pagination import iter_items, next_offset
+
+
+def listing(params, total, with_total=True):
+    offset, limit = params["offset"], params["limit"]
+    data = [{"id": i} for i in range(offset, min(offset + limit, total))]
+    payload = {"data": data}
+    if with_total:
+        payload["pagination"] = {"offset": offset, "limit": limit, "total": total}
+    return ApiResponse(payload=payload, status_code=200)
+
+
+class DummyUnits(Units):
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def _request(self, path, **kwargs):
+        self.calls.append((path, dict(kwargs["params"])))
+        return listing(kwargs["params"], self.total)
+
+
+class DummyAttributes(Attributes):
+    def __init__(self):
+        self.calls = []
+
+    def _request(self, path, **kwargs):
+        self.calls.append((path, dict(kwargs["params"])))
+        return listing(kwargs["params"], 150)
+
+
+class DummyAsyncOrderUnits(AsyncOrderUnits):
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    async def _request(self, path, **kwargs):
+        self.calls.append((path, dict(kwargs["params"])))
+        return listing(kwargs["params"], self.total)
+
+
+def test_iter_units_uses_max_limit_and_stops_at_total():
+    client = DummyUnits(total=250)
+    items = list(client.iter_units(storefront="de"))
+    assert [item["id"] for item in items] == list(range(250))
+    assert [params["offset"] for _, params in client.calls] == [0, 100, 200]
+    assert all(params["limit"] == 100 for _, params in client.calls)
+    assert all(params["storefront"] == "de" for _, params in client.calls)
+
+
+def test_paginate_units_honours_limit_and_offset():
+    client = DummyUnits(total=95)
+    pages = list(client.paginate_units(limit=30, offset=10))
+    assert len(pages) == 3
+    assert [params["offset"] for _, params in client.calls] == [10, 40, 70]
+
+
+def test_paginate_empty_listing():
+    client = DummyUnits(total=0)
+    assert list(client.iter_units()) == []
+    assert len(client.calls) == 1
+
+
+def test_paginate_with_path_params():
+    client = DummyAttributes()
+    items = list(client.iter_shared_set_list_by_search_and_attribute_id(7))
+    assert len(items) == 150
+    assert client.calls[0][0] == "/attributes/7/shared-set"
+
+
+def test_paginate_without_total_stops_on_short_page():
+    calls = []
+
+    def method(**params):
+        calls.append(params)
+        return listing(params, 45, with_total=False)
+
+    assert len(list(iter_items(method, max_limit=20))) == 45
+    assert len(calls) == 3
+    assert next_offset({"data": []}, 0, 20) is None
+
+
+@pytest.mark.anyio
+async def test_async_iter_order_units():
+    client = DummyAsyncOrderUnits(total=120)
+    items = [item async for item in client.iter_order_units(storefront="de")]
+    assert len(items) == 120
+    assert [params["offset"] for _, params in client.calls] == [0, 100]
+    pages = [page async for page in client.paginate_order_units(limit=50)]
+    assert len(pages) == 3
+
+
+class SlowAsyncOrderUnits(DummyAsyncOrderUnits):
+    def __init__(self, total, with_total=True):
+        super().__init__(total)
+        self.with_total = with_total
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, path, **kwargs):
+        params = dict(kwargs["params"])
+        self.calls.append((path, params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later pages finish first to exercise ordering
+        await asyncio.sleep(0.001 * (10 - params["offset"] // 100 % 10))
+        self.in_flight -= 1
+        return listing(params, self.total, self.with_total)
+
+
+@pytest.mark.anyio
+async def test_async_parallel_pagination_in_order():
+    client = SlowAsyncOrderUnits(total=1050)
+    items = [item async for item in client.iter_order_units(concurrency=4)]
+    assert [item["id"] for item in items] == list(range(1050))
+    assert client.max_in_flight <= 4
+    assert len(client.calls) == 11
+
+
+@pytest.mark.anyio
+async def test_async_parallel_pagination_as_completed():
+    client = SlowAsyncOrderUnits(total=1050)
+    items = [
+        item async for item in client.iter_order_units(concurrency=8, ordered=False)
+    ]
+    ids = [item["id"] for item in items]
+    assert sorted(ids) == list(range(1050))
+    assert ids != list(range(1050))
+    assert client.max_in_flight <= 8
+
+
+@pytest.mark.anyio
+async def test_async_parallel_pagination_without_total():
+    client = SlowAsyncOrderUnits(total=250, with_total=False)
+    pages = [page async for page in client.paginate_order_units(concurrency=4)]
+    assert len(pages) == 3
+    assert client.max_in_flight == 1
+
+
+class CappedAsyncOrderUnits(DummyAsyncOrderUnits):
+    """Returns at most 50 items per page whatever limit is asked for."""
+
+    async def _request(self, path, **kwargs):
+        params = dict(kwargs["params"])
+        self.calls.append((path, params))
+        return listing({**params, "limit": min(params["limit"], 50)}, self.total)
+
+
+@pytest.mark.anyio
+async def test_async_parallel_pagination_with_capped_pages():
+    client = CappedAsyncOrderUnits(total=250)
+    items = [item async for item in client.iter_order_units(limit=100, concurrency=4)]
+    assert [item["id"] for item in items] == list(range(250))
+    assert [params["offset"] for _, params in client.calls] == [0, 50, 100, 150, 200]
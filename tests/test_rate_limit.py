@@ -0,0 +1,137 @@
+import pytest
+
+import kaufland.base.client as client_module
+from kaufland import Client
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.base import rate_limit
+from kaufland.base._core import endpoint_group
+from kaufland.base.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+class DummyResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b"{}"
+        self.text = "{}"
+
+
+class DummyTransport:
+    def __init__(self, response):
+        self.response = response
+
+    def request(self, **kwargs):
+        return self.response
+
+
+class DummyAsyncTransport(DummyTransport):
+    async def request(self, **kwargs):
+        return self.response
+
+
+def test_endpoint_group():
+    assert endpoint_group("/units/123") == "units"
+    assert endpoint_group("/order-units?offset=0") == "order-units"
+    assert endpoint_group("https://sellerapi.kaufland.com/v2/reports/1") == "reports"
+
+
+def test_token_bucket_burst_then_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_block(clock):
+    bucket = TokenBucket(rate=100)
+    bucket.block(5)
+    assert bucket.reserve() == pytest.approx(5)
+    clock.now += 5
+    assert bucket.reserve() == 0
+
+
+def test_rate_limiter_buckets_per_key_and_group(clock):
+    limiter = RateLimiter(rate=1, groups={"reports": (5, 5)})
+    assert limiter.bucket("ck", "/units") is limiter.bucket("ck", "/orders/1")
+    assert limiter.bucket("ck", "/units") is not limiter.bucket("other", "/units")
+    assert limiter.bucket("ck", "/reports").rate == 5
+
+    assert limiter.reserve("ck", "/units") == 0
+    assert limiter.reserve("ck", "/orders") == pytest.approx(1)
+    assert limiter.reserve("ck", "/reports/1") == 0
+
+
+def test_rate_limiter_adapts_to_headers(clock):
+    limiter = RateLimiter(rate=100)
+    limiter.update("ck", "/units", 429, {"Retry-After": "3"})
+    assert limiter.reserve("ck", "/units") == pytest.approx(3)
+
+    limiter.update("ck2", "/units", 200, {"x-ratelimit-remaining": "5"})
+    assert limiter.reserve("ck2", "/units") == 0
+    limiter.update(
+        "ck2",
+        "/units",
+        200,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"},
+    )
+    assert limiter.reserve("ck2", "/units") == pytest.approx(2)
+
+
+def test_rate_limiter_reads_http_date_retry_after(monkeypatch, clock):
+    # Wed, 01 May 2024 12:00:00 GMT
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 1714564800.0)
+    limiter = RateLimiter(rate=100)
+    limiter.update(
+        "ck", "/units", 429, {"Retry-After": "Wed, 01 May 2024 12:00:10 GMT"}
+    )
+    assert limiter.reserve("ck", "/units") == pytest.approx(10)
+
+
+def test_client_waits_for_rate_limiter(monkeypatch, clock):
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    limiter = RateLimiter(rate=1)
+    client = Client(client_key="ck", secret_key="sk", rate_limiter=limiter)
+    client._transport = DummyTransport(DummyResponse(headers={"Retry-After": "4"}))
+
+    client._request("/units")
+    assert sleeps == []
+    client._request("/units")
+    assert sleeps == [pytest.approx(4)]
+
+
+@pytest.mark.anyio
+async def test_async_client_uses_rate_limiter():
+    calls = []
+
+    class RecordingLimiter:
+        def reserve(self, client_key, path):
+            calls.append(("reserve", client_key, path))
+            return 0.001
+
+        def update(self, client_key, path, status_code, headers):
+            calls.append(("update", client_key, status_code))
+
+    client = AsyncClient(
+        client_key="ck", secret_key="sk", rate_limiter=RecordingLimiter()
+    )
+    client._transport = DummyAsyncTransport(DummyResponse())
+    await client._request("/units")
+    assert calls == [("reserve", "ck", "/units"), ("update", "ck", 200)]
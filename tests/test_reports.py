@@ -0,0 +1,198 @@
+import gzip
+import json
+
+import pytest
+
+from kaufland import WSGITransport
+from kaufland.api.reports import Reports
+from kaufland.asyncio import ASGITransport
+from kaufland.asyncio.api.reports import Reports as AsyncReports
+from kaufland.asyncio.reports import ReportManager as AsyncReportManager
+from kaufland.base import reports as reports_module
+from kaufland.base.exceptions import ApiException, ReportException
+from kaufland.base.reports import CsvStream, ReportManager, report_state
+
+CSV = (
+    '\ufeffid_offer;title;note\n1;Pan;"fine"\n2;"Pot; large";"two\nlines"\n3;Lid;\n'
+).encode("utf-8")
+
+
+def parse(data, size, **kwargs):
+    stream = CsvStream(**kwargs)
+    rows = []
+    for start in range(0, len(data), size):
+        rows += stream.feed(data[start : start + size])
+    return rows + stream.close()
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(CSV)])
+def test_csv_stream_across_chunks(size):
+    assert parse(CSV, size) == [
+        {"id_offer": "1", "title": "Pan", "note": "fine"},
+        {"id_offer": "2", "title": "Pot; large", "note": "two\nlines"},
+        {"id_offer": "3", "title": "Lid", "note": ""},
+    ]
+
+
+def test_csv_stream_gzip_without_trailing_newline():
+    data = gzip.compress(b"a,b\n1,2\n3,4")
+    assert parse(data, 5, header=False) == [["a", "b"], ["1", "2"], ["3", "4"]]
+
+
+def test_report_state():
+    assert report_state({"status": "done"}) == "done"
+    assert report_state({"status": "ERROR"}) == "failed"
+    assert report_state({"status": "NEW"}) == "pending"
+
+
+class ReportServer:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.polls = 0
+
+    def report(self):
+        status = self.statuses[min(self.polls, len(self.statuses) - 1)]
+        self.polls += 1
+        return {
+            "id_report": 7,
+            "status": status,
+            "url": "http://testserver/files/7.csv",
+        }
+
+    def route(self, method, path):
+        if method == "POST" and path == "/v2/reports/sales-new":
+            return json.dumps({"data": {"id_report": 7}}).encode()
+        if path == "/v2/reports/7":
+            return json.dumps({"data": self.report()}).encode()
+        if path == "/files/7.csv":
+            return CSV
+        raise AssertionError(path)
+
+    def wsgi(self, environ, start_response):
+        body = self.route(environ["REQUEST_METHOD"], environ["PATH_INFO"])
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [body]
+
+    async def asgi(self, scope, receive, send):
+        await receive()
+        body = self.route(scope["method"], scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(reports_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def reports_client(server, cls=Reports, transport=WSGITransport):
+    return cls(
+        client_key="client",
+        secret_key="secret",
+        endpoint="http://testserver/v2",
+        storefront="de",
+        transport=transport(server.wsgi if cls is Reports else server.asgi),
+    )
+
+
+def test_request_wait_and_stream_rows(sleeps):
+    server = ReportServer(["NEW", "NEW", "NEW", "PROCESSING", "DONE"])
+    manager = ReportManager(reports_client(server), poll_interval=1, backoff=2)
+
+    id_report = manager.request(
+        "new_sales", body={"date_from": "2024-01-01", "date_to": "2024-01-31"}
+    )
+    report = manager.wait(id_report)
+    assert report["status"] == "DONE"
+    assert sleeps == [1, 2, 4, 1]
+    assert [row["title"] for row in manager.rows(report)] == [
+        "Pan",
+        "Pot; large",
+        "Lid",
+    ]
+
+
+def test_failed_report_raises(sleeps):
+    manager = ReportManager(reports_client(ReportServer(["NEW", "ERROR"])))
+    with pytest.raises(ReportException) as info:
+        manager.wait(7)
+    assert info.value.report["status"] == "ERROR"
+
+
+def test_timeout(sleeps):
+    manager = ReportManager(reports_client(ReportServer(["NEW"])), timeout=0.5)
+    with pytest.raises(ReportException):
+        manager.wait(7)
+
+
+def test_download(sleeps, tmp_path):
+    server = ReportServer(["DONE"])
+    manager = ReportManager(reports_client(server))
+    path = manager.download(manager.wait(7), tmp_path / "report.csv")
+    assert path.read_bytes() == CSV
+
+
+def test_download_without_stream_checks_status():
+    class Expired:
+        status_code = 403
+        headers = {}
+        text = "<Error><Code>AccessDenied</Code></Error>"
+        content = text.encode()
+
+    class Transport:
+        def request(self, *, method, url, headers=None, content=None):
+            return Expired()
+
+    client = Reports(client_key="client", secret_key="secret", transport=Transport())
+    with pytest.raises(ApiException) as info:
+        list(ReportManager(client).rows("https://files/7.csv"))
+    assert info.value.status_code == 403
+
+
+EXPIRED = b"<Error><Code>AccessDenied</Code></Error>"
+
+
+def test_streamed_download_checks_status():
+    def expired(environ, start_response):
+        start_response("403 Forbidden", [("Content-Type", "application/xml")])
+        return [EXPIRED]
+
+    client = Reports(
+        client_key="client", secret_key="secret", transport=WSGITransport(expired)
+    )
+    with pytest.raises(ApiException) as info:
+        list(ReportManager(client).rows("http://testserver/files/7.csv"))
+    assert info.value.status_code == 403
+    assert info.value.text == EXPIRED.decode()
+
+
+@pytest.mark.anyio
+async def test_async_streamed_download_checks_status():
+    async def expired(scope, receive, send):
+        await send({"type": "http.response.start", "status": 403, "headers": []})
+        await send({"type": "http.response.body", "body": EXPIRED})
+
+    client = AsyncReports(
+        client_key="client", secret_key="secret", transport=ASGITransport(expired)
+    )
+    with pytest.raises(ApiException) as info:
+        [row async for row in AsyncReportManager(client).rows("http://testserver/x")]
+    assert info.value.status_code == 403
+    assert info.value.text == EXPIRED.decode()
+
+
+@pytest.mark.anyio
+async def test_async_manager(monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr("kaufland.asyncio.reports.asyncio.sleep", no_sleep)
+    server = ReportServer(["NEW", "DONE"])
+    manager = AsyncReportManager(
+        reports_client(server, AsyncReports, ASGITransport), chunk_size=4
+    )
+    report = await manager.wait(await manager.request("new_sales", body={}))
+    rows = [row async for row in manager.rows(report)]
+    assert [row["id_offer"] for row in rows] == ["1", "2", "3"]
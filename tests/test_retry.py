@@ -0,0 +1,136 @@
+import itertools
+
+import httpx
+import pytest
+
+import kaufland.base.client as client_module
+from kaufland import Client
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.base import _core, retry
+from kaufland.base.exceptions import ApiException
+from kaufland.base.retry import RetryPolicy, parse_retry_after
+
+
+class DummyResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b'{"ok": true}'
+        self.text = '{"ok": true}'
+
+
+class SequenceTransport:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def _next(self, kwargs):
+        self.requests.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class SyncSequenceTransport(SequenceTransport):
+    def request(self, **kwargs):
+        return self._next(kwargs)
+
+
+class AsyncSequenceTransport(SequenceTransport):
+    async def request(self, **kwargs):
+        return self._next(kwargs)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    clock = itertools.count(1411055926)
+    monkeypatch.setattr(_core.time, "time", lambda: next(clock))
+    return sleeps
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_policy_idempotency():
+    policy = RetryPolicy()
+    assert policy.allows("GET") and policy.allows("put") and policy.allows("DELETE")
+    assert not policy.allows("POST") and not policy.allows("PATCH")
+    assert RetryPolicy(retry_non_idempotent=True).allows("POST")
+    assert RetryPolicy(methods={"GET", "POST"}).allows("POST")
+
+
+def test_policy_delays(monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    policy = RetryPolicy(max_attempts=4, backoff=1, max_backoff=3)
+    error = DummyResponse(503)
+    assert policy.next_delay(1, "GET", response=error) == 1
+    assert policy.next_delay(2, "GET", response=error) == 2
+    assert policy.next_delay(3, "GET", response=error) == 3
+    assert policy.next_delay(4, "GET", response=error) is None
+    assert policy.next_delay(1, "GET", response=DummyResponse(404)) is None
+    assert policy.next_delay(1, "POST", response=error) is None
+    limited = DummyResponse(429, {"Retry-After": "7"})
+    assert policy.next_delay(1, "GET", response=limited) == 7
+    assert policy.next_delay(1, "GET", error=httpx.ConnectError("x")) == 1
+    assert policy.next_delay(1, "GET", error=ValueError("x")) is None
+
+
+def test_client_retries_with_fresh_signature(sleeps):
+    transport = SyncSequenceTransport(
+        DummyResponse(503), DummyResponse(429, {"Retry-After": "2"}), DummyResponse()
+    )
+    client = Client(client_key="ck", secret_key="sk", retry=RetryPolicy())
+    client._transport = transport
+
+    response = client._request("/units")
+    assert response.status_code == 200
+    assert len(transport.requests) == 3
+    assert sleeps[1] == 2
+    timestamps = {r["headers"]["Shop-Timestamp"] for r in transport.requests}
+    signatures = {r["headers"]["Shop-Signature"] for r in transport.requests}
+    assert len(timestamps) == 3
+    assert len(signatures) == 3
+
+
+def test_client_does_not_retry_post_by_default(sleeps):
+    transport = SyncSequenceTransport(DummyResponse(503), DummyResponse())
+    client = Client(client_key="ck", secret_key="sk", retry=RetryPolicy())
+    client._transport = transport
+
+    with pytest.raises(ApiException):
+        client._request("/units", data={"a": 1})
+    assert len(transport.requests) == 1
+
+
+def test_client_retries_transport_errors(sleeps):
+    transport = SyncSequenceTransport(httpx.ConnectError("down"), DummyResponse())
+    client = Client(client_key="ck", secret_key="sk", retry=RetryPolicy())
+    client._transport = transport
+    assert client._request("/units").status_code == 200
+
+    transport = SyncSequenceTransport(*[httpx.ConnectError("down")] * 3)
+    client._transport = transport
+    with pytest.raises(httpx.ConnectError):
+        client._request("/units")
+    assert len(transport.requests) == 3
+
+
+@pytest.mark.anyio
+async def test_async_client_retries():
+    transport = AsyncSequenceTransport(DummyResponse(502), DummyResponse())
+    client = AsyncClient(
+        client_key="ck",
+        secret_key="sk",
+        retry=RetryPolicy(backoff=0.001, retry_non_idempotent=True),
+    )
+    client._transport = transport
+    response = await client._request("/units", data={"a": 1})
+    assert response.status_code == 200
+    assert len(transport.requests) == 2
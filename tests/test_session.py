@@ -0,0 +1,74 @@
+import pytest
+
+from kaufland import Session
+from kaufland.api.orders import Orders
+from kaufland.api.units import Units
+from kaufland.asyncio import Session as AsyncSession
+from kaufland.asyncio.api.order_units import OrderUnits as AsyncOrderUnits
+
+
+class DummyTransport:
+    def __init__(self):
+        self.closed = 0
+
+    def request(self, **kwargs):
+        raise AssertionError("not expected")
+
+    def close(self):
+        self.closed += 1
+
+
+class DummyAsyncTransport(DummyTransport):
+    async def close(self):
+        self.closed += 1
+
+
+def test_session_shares_transport():
+    transport = DummyTransport()
+    session = Session(
+        client_key="ck", secret_key="sk", storefront="de", transport=transport
+    )
+
+    assert isinstance(session.units, Units)
+    assert isinstance(session.orders, Orders)
+    assert session.units is session.units
+    assert session.units._transport is transport
+    assert session.orders._transport is transport
+    assert session.units.storefront == "de"
+    assert session.units.client_key == "ck"
+
+
+def test_session_closes_shared_transport_once():
+    transport = DummyTransport()
+    session = Session(client_key="ck", secret_key="sk")
+    session._transport = transport
+    units = session.units
+    units.close()
+    assert transport.closed == 0
+    session.close()
+    assert transport.closed == 1
+
+
+def test_session_leaves_injected_transport_open():
+    transport = DummyTransport()
+    with Session(client_key="ck", secret_key="sk", transport=transport) as session:
+        session.units.close()
+    assert transport.closed == 0
+
+
+def test_session_unknown_group():
+    session = Session(client_key="ck", secret_key="sk", transport=DummyTransport())
+    with pytest.raises(AttributeError):
+        session.not_an_endpoint
+
+
+@pytest.mark.anyio
+async def test_async_session_shares_transport():
+    transport = DummyAsyncTransport()
+    async with AsyncSession(
+        client_key="ck", secret_key="sk", transport=transport
+    ) as session:
+        assert isinstance(session.order_units, AsyncOrderUnits)
+        assert session.order_units._transport is transport
+        await session.order_units.close()
+    assert transport.closed == 0
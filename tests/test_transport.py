@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from kaufland import AsyncTransport, Client, Transport, WSGITransport
+from kaufland.asyncio import ASGITransport, HttpxAsyncTransport
+from kaufland.asyncio import Client as AsyncClient
+from kaufland.base._core import sign_request
+
+
+def wsgi_app(environ, start_response):
+    length = int(environ.get("CONTENT_LENGTH") or 0)
+    body = environ["wsgi.input"].read(length).decode("utf-8")
+    url = "http://testserver" + environ["PATH_INFO"]
+    if environ.get("QUERY_STRING"):
+        url += "?" + environ["QUERY_STRING"]
+    expected = sign_request(
+        environ["REQUEST_METHOD"],
+        url,
+        body,
+        int(environ["HTTP_SHOP_TIMESTAMP"]),
+        "sk",
+    )
+    valid = expected == environ["HTTP_SHOP_SIGNATURE"]
+    payload = json.dumps({"valid": valid, "body": body}).encode("utf-8")
+    start_response("200 OK", [("Content-Type", "application/json")])
+    return [payload]
+
+
+async def asgi_app(scope, receive, send):
+    message = await receive()
+    body = json.dumps({"path": scope["path"], "body": message["body"].decode()})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body.encode("utf-8")})
+
+
+def test_transport_protocols():
+    assert isinstance(WSGITransport(wsgi_app), Transport)
+    assert isinstance(HttpxAsyncTransport(), AsyncTransport)
+
+
+def test_client_with_wsgi_transport():
+    client = Client(
+        client_key="ck",
+        secret_key="sk",
+        storefront="de",
+        endpoint="http://testserver/v2",
+        transport=WSGITransport(wsgi_app),
+    )
+    response = client._request("/units/bulk", data=[{"id_unit": 1}])
+    assert response.status_code == 200
+    assert response.payload == {"valid": True, "body": '[{"id_unit":1}]'}
+
+
+@pytest.mark.anyio
+async def test_async_client_with_asgi_transport():
+    async with AsyncClient(
+        client_key="ck",
+        secret_key="sk",
+        endpoint="http://testserver/v2",
+        transport=ASGITransport(asgi_app),
+    ) as client:
+        response = await client._request("/units", data={"a": 1})
+    assert response.payload == {"path": "/v2/units", "body": '{"a":1}'}
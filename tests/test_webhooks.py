@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import pytest
+
+from kaufland.asyncio.webhooks import WebhookReceiver, WebhookReplayer
+
+SECRET = "webhook-secret"
+
+
+def events(count):
+    return [
+        {"id_event": i, "event_name": "order_unit_new", "payload": {"id_order_unit": i}}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.anyio
+async def test_replayed_events_are_batched_and_deduplicated():
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    receiver = WebhookReceiver(
+        handler, secret_key=SECRET, batch_size=10, batch_wait=0.01
+    )
+    async with receiver, WebhookReplayer(receiver, secret_key=SECRET) as replayer:
+        sent = events(25)
+        responses = await replayer.replay(sent + sent[:5])
+
+    assert {r.status_code for r in responses} == {200}
+    assert [r.json()["status"] for r in responses[25:]] == ["duplicate"] * 5
+    received = [event for batch in batches for event in batch]
+    assert sorted(e["id_event"] for e in received) == list(range(25))
+    assert max(len(batch) for batch in batches) <= 10
+    assert receiver.stats["accepted"] == 25
+    assert receiver.stats["duplicates"] == 5
+    assert receiver.stats["handled"] == 25
+
+
+@pytest.mark.anyio
+async def test_invalid_signatures_are_rejected():
+    receiver = WebhookReceiver(lambda batch: None, secret_key=SECRET)
+    async with WebhookReplayer(receiver, secret_key="wrong") as replayer:
+        assert (await replayer.send({"id_event": 1})).status_code == 401
+    async with WebhookReplayer(receiver, secret_key=SECRET) as replayer:
+        stale = await replayer.send({"id_event": 1}, timestamp=1)
+        assert stale.status_code == 401
+        assert (await replayer.send(b"not json")).status_code == 400
+    assert receiver.stats["rejected"] == 3
+    await receiver.stop()
+
+
+@pytest.mark.anyio
+async def test_full_queue_applies_backpressure():
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(batch):
+        await release.wait()
+        handled.extend(batch)
+
+    receiver = WebhookReceiver(
+        handler,
+        secret_key=SECRET,
+        queue_size=1,
+        batch_size=1,
+        enqueue_timeout=0.01,
+    )
+    async with WebhookReplayer(receiver, secret_key=SECRET) as replayer:
+        statuses = [(await replayer.send(e)).status_code for e in events(4)]
+        assert statuses == [200, 200, 503, 503]
+        release.set()
+        # the throttled event is accepted when it is delivered again
+        assert (await replayer.send(events(3)[2])).status_code == 200
+        await receiver.stop()
+    assert sorted(e["id_event"] for e in handled) == [0, 1, 2]
+    assert receiver.stats["throttled"] == 2
+
+
+@pytest.mark.anyio
+async def test_sync_handler_runs_in_thread():
+    handled = []
+    receiver = WebhookReceiver(handled.extend, secret_key=SECRET, batch_wait=0)
+    async with receiver, WebhookReplayer(receiver, secret_key=SECRET) as replayer:
+        await replayer.replay(events(3))
+    assert len(handled) == 3
+
+
+@pytest.mark.anyio
+async def test_failed_batches_go_to_on_error():
+    dead = []
+
+    def handler(batch):
+        raise RuntimeError("database down")
+
+    async def on_error(batch, exc):
+        dead.append((batch, exc))
+
+    receiver = WebhookReceiver(
+        handler, secret_key=SECRET, batch_wait=0, on_error=on_error
+    )
+    async with receiver, WebhookReplayer(receiver, secret_key=SECRET) as replayer:
+        await replayer.send(events(1)[0])
+    [(batch, exc)] = dead
+    assert batch == events(1)
+    assert isinstance(exc, RuntimeError)
+    assert receiver.stats["failed"] == 1
+
+
+async def post_raw(app, headers, body):
+    """Call the ASGI app directly with raw header and body bytes."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/webhooks",
+        "query_string": b"",
+        "server": ("testserver", 80),
+        "headers": [(b"host", b"testserver"), *headers],
+    }
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+
+@pytest.mark.anyio
+async def test_malformed_requests_get_client_errors():
+    receiver = WebhookReceiver(lambda batch: None, secret_key=SECRET)
+    timestamp = str(int(time.time())).encode()
+    signed = [(b"shop-timestamp", timestamp), (b"shop-signature", b"0" * 64)]
+
+    non_ascii_signature = [(b"shop-timestamp", timestamp), (b"shop-signature", b"\xe9")]
+    assert await post_raw(receiver, non_ascii_signature, b"{}") == 401
+    assert await post_raw(receiver, signed, b'{"a": "\xff"}') == 401
+    assert await post_raw(receiver, [*signed, (b"x-note", b"\xff\xfe")], b"{}") == 401
+    assert receiver.stats["rejected"] == 3
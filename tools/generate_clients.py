@@ -3,6 +3,7 @@ import argparse
 import json
 import keyword
 import re
+import textwrap
 from pathlib import Path
 
 
@@ -49,6 +50,87 @@ def has_storefront_param(op: dict) -> bool:
     return False
 
 
+def resolve_ref(schema: dict | None, schemas: dict) -> dict:
+    while schema and "$ref" in schema:
+        schema = schemas.get(schema["$ref"].split("/")[-1], {})
+    return schema or {}
+
+
+def is_paginated(method: str, op: dict, schemas: dict) -> bool:
+    if method.lower() != "get":
+        return False
+    query = {p.get("name") for p in op.get("parameters", []) or []}
+    if not {"limit", "offset"} <= query:
+        return False
+    response = (op.get("responses") or {}).get("200") or {}
+    content = response.get("content") or {}
+    schema = resolve_ref((content.get("application/json") or {}).get("schema"), schemas)
+    return "pagination" in (schema.get("properties") or {})
+
+
+def max_page_size(op: dict, schemas: dict) -> int | None:
+    for param in op.get("parameters", []) or []:
+        if param.get("name") != "limit":
+            continue
+        maximum = resolve_ref(param.get("schema"), schemas).get("maximum")
+        if maximum:
+            return int(maximum)
+        match = re.search(
+            r"max(?:imum)?(?: is)?:?\s*(\d+)", param.get("description") or ""
+        )
+        if match:
+            return int(match.group(1))
+    return None
+
+
+# Schemas exported to Arrow column types, see kaufland/base/columnar.py
+EXPORT_SCHEMAS = ("OrderUnit", "Report", "Unit")
+
+
+def arrow_type(schema: dict | None, schemas: dict, seen: tuple = ()):
+    schema = schema or {}
+    if "$ref" in schema:
+        name = schema["$ref"].split("/")[-1]
+        if name in seen:
+            return "json"
+        return arrow_type(schemas.get(name), schemas, seen + (name,))
+    for key in ("allOf", "oneOf", "anyOf"):
+        if key in schema:
+            parts = schema[key]
+            return arrow_type(parts[0], schemas, seen) if len(parts) == 1 else "json"
+    kind = schema.get("type")
+    fmt = schema.get("format")
+    if kind == "integer":
+        return "int32" if fmt == "int32" else "int64"
+    if kind == "number":
+        return "float32" if fmt == "float" else "float64"
+    if kind == "boolean":
+        return "bool"
+    if kind == "string":
+        return {"date-time": "timestamp", "date": "date"}.get(fmt, "string")
+    if kind == "array":
+        return {"list": arrow_type(schema.get("items"), schemas, seen)}
+    if schema.get("properties"):
+        return {
+            "struct": {
+                name: arrow_type(prop, schemas, seen)
+                for name, prop in schema["properties"].items()
+            }
+        }
+    return "json"
+
+
+def generate_schema_module(schemas: dict) -> str:
+    types = {
+        name: arrow_type({"$ref": f"#/components/schemas/{name}"}, schemas)["struct"]
+        for name in EXPORT_SCHEMAS
+    }
+    return (
+        '"""Column types of swagger schemas, generated by tools/generate_clients.py."""'
+        f"\n\nSCHEMAS = {types!r}\n"
+    )
+
+
 def get_path_params(path: str) -> list[str]:
     return re.findall(r"{([^}]+)}", path)
 
@@ -142,22 +224,75 @@ def collect_args(op: dict) -> list[str]:
     return args
 
 
+def generate_pagination_methods(
+    method_name: str,
+    param_names: list[str],
+    max_limit: int | None,
+    used: set[str],
+    *,
+    async_mode: bool,
+) -> list[str]:
+    lines = []
+    base = method_name[4:] if method_name.startswith("get_") else method_name
+    iterator = "AsyncIterator" if async_mode else "Iterator"
+    params = "".join(f"{name}, " for name in param_names)
+    page_size = f", {max_limit} per request" if max_limit else ""
+    for prefix, helper, item_type, what in (
+        ("paginate", "paginate", "ApiResponse", "page"),
+        ("iter", "iter_items", "dict", "item"),
+    ):
+        name = unique_name(f"{prefix}_{base}", used)
+        args = ", ".join([f"self.{method_name}", *param_names])
+        lines.append(
+            f"    def {name}(self, {params}**kwargs) -> {iterator}[{item_type}]:"
+        )
+        # 77 columns leave room for the indent and both sets of quotes
+        summary = textwrap.wrap(f"Yield every {what} of {method_name}{page_size}.", 77)
+        summary = [f"        {line}" for line in summary]
+        summary[0] = summary[0].replace("        ", '        """', 1)
+        if async_mode:
+            lines.extend(summary)
+            lines.append("")
+            lines.append(
+                "        Pass concurrency=N to fetch the remaining pages in parallel."
+            )
+            lines.append('        """')
+        else:
+            summary[-1] += '"""'
+            lines.extend(summary)
+        lines.append(
+            f"        return {helper}({args}, max_limit={max_limit}, **kwargs)"
+        )
+        lines.append("")
+    return lines
+
+
 def generate_class_code(
     class_name: str, operations: list[dict], *, async_mode: bool
 ) -> str:
     lines = []
+    paginated = any(op["paginated"] for op in operations)
+    if paginated:
+        iterator = "AsyncIterator" if async_mode else "Iterator"
+        lines.append(f"from collections.abc import {iterator}")
+        lines.append("")
     if async_mode:
         lines.append("from kaufland.asyncio import Client")
     else:
         lines.append("from kaufland import Client")
-    lines.append(
-        "from kaufland.base import ApiResponse, fill_query_params, kaufland_endpoint"
-    )
+    if paginated:
+        package = "kaufland.asyncio" if async_mode else "kaufland.base"
+        lines.append(f"from {package}.pagination import iter_items, paginate")
+    lines.append("from kaufland.base import ApiResponse, Route")
+    lines.append("")
+    routes_at = len(lines)
+    routes = []
     lines.append("")
     lines.append("")
     lines.append(f"class {class_name}(Client):")
     lines.append(f'    """{class_name} Kaufland API Client."""')
     lines.append("")
+    header_length = len(lines)
 
     used_method_names: set[str] = set()
     for op in operations:
@@ -174,9 +309,13 @@ def generate_class_code(
         else:
             signature = "(self, **kwargs) -> ApiResponse"
 
-        lines.append(
-            f'    @kaufland_endpoint("{op["decorator_path"]}", method="{method}")'
+        add_storefront = "True" if op["add_storefront"] else "False"
+        route = f"_{method_name.upper()}"
+        routes.append(
+            f'{route} = Route("{op["decorator_path"]}", "{method}", '
+            f"add_storefront={add_storefront})"
         )
+        lines.append(f"    @{route}")
         lines.append(
             f"    {'async ' if async_mode else ''}def {method_name}{signature}:"
         )
@@ -200,20 +339,19 @@ def generate_class_code(
         else:
             lines.append('        """""')
 
-        if path_params:
-            path_expr = (
-                f"fill_query_params(kwargs.pop('path'), {', '.join(param_names)})"
-            )
-        else:
-            path_expr = "kwargs.pop('path')"
-
-        add_storefront = "True" if op["add_storefront"] else "False"
+        path_expr = f"{route}.fill({', '.join(param_names)})"
         has_body = op["has_body"]
         if has_body:
             lines.append("        body = kwargs.pop('body', None)")
-            request = f"{path_expr}, data=body, params=kwargs, add_storefront={add_storefront}"
+            request = (
+                f'{path_expr}, method="{method}", data=body, params=kwargs, '
+                f"add_storefront={add_storefront}"
+            )
         else:
-            request = f"{path_expr}, params=kwargs, add_storefront={add_storefront}"
+            request = (
+                f'{path_expr}, method="{method}", params=kwargs, '
+                f"add_storefront={add_storefront}"
+            )
 
         if async_mode:
             lines.append(f"        return await self._request({request})")
@@ -221,12 +359,63 @@ def generate_class_code(
             lines.append(f"        return self._request({request})")
         lines.append("")
 
-    if len(lines) == 5:
+        if op["paginated"]:
+            lines.extend(
+                generate_pagination_methods(
+                    method_name,
+                    param_names,
+                    op["max_limit"],
+                    used_method_names,
+                    async_mode=async_mode,
+                )
+            )
+
+    if len(lines) == header_length:
         lines.append("    pass")
+    lines[routes_at:routes_at] = ["", *routes] if routes else []
 
     return "\n".join(lines).rstrip() + "\n"
 
 
+def generate_init_code(exports: dict[str, str]) -> str:
+    """Package init that imports each client module on first attribute access."""
+    lines = [
+        '"""Generated API clients, imported on first use."""',
+        "",
+        "from importlib import import_module",
+        "from typing import TYPE_CHECKING",
+        "",
+        "if TYPE_CHECKING:",
+    ]
+    for name, module in exports.items():
+        lines.append(f"    from .{module} import {name}")
+    lines += ["", "_MODULES = {"]
+    for name, module in exports.items():
+        lines.append(f'    "{name}": "{module}",')
+    lines += [
+        "}",
+        "",
+        "__all__ = [",
+        *(f'    "{name}",' for name in exports),
+        "]",
+        "",
+        "",
+        "def __getattr__(name):",
+        "    module = _MODULES.get(name)",
+        "    if module is None:",
+        "        raise AttributeError("
+        'f"module {__name__!r} has no attribute {name!r}")',
+        '    value = getattr(import_module(f".{module}", __name__), name)',
+        "    globals()[name] = value",
+        "    return value",
+        "",
+        "",
+        "def __dir__():",
+        "    return sorted(set(globals()) | set(__all__))",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Generate Kaufland API clients from swagger.json"
@@ -234,10 +423,12 @@ def main() -> int:
     parser.add_argument("--swagger", default="swagger.json")
     parser.add_argument("--sync-out", default="kaufland/api")
     parser.add_argument("--async-out", default="kaufland/asyncio/api")
+    parser.add_argument("--schemas-out", default="kaufland/base/_schemas.py")
     args = parser.parse_args()
 
     swagger_path = Path(args.swagger)
     data = json.loads(swagger_path.read_text(encoding="utf-8"))
+    schemas = (data.get("components") or {}).get("schemas") or {}
 
     groups: dict[str, list[dict]] = {}
     for path, ops in data.get("paths", {}).items():
@@ -255,6 +446,8 @@ def main() -> int:
                 "path_params": get_path_params(path),
                 "has_body": "requestBody" in op,
                 "add_storefront": has_storefront_param(op),
+                "paginated": is_paginated(method, op, schemas),
+                "max_limit": max_page_size(op, schemas),
                 "raw": op,
             }
             groups.setdefault(segment, []).append(entry)
@@ -264,8 +457,7 @@ def main() -> int:
     sync_out.mkdir(parents=True, exist_ok=True)
     async_out.mkdir(parents=True, exist_ok=True)
 
-    sync_init_lines = []
-    async_init_lines = []
+    exports: dict[str, str] = {}
 
     used_modules: set[str] = set()
     for segment, ops in sorted(groups.items()):
@@ -280,29 +472,12 @@ def main() -> int:
         file_path.write_text(sync_code, encoding="utf-8")
         async_file_path.write_text(async_code, encoding="utf-8")
 
-        sync_init_lines.append(f"from .{module_name} import {class_name}")
-        async_init_lines.append(f"from .{module_name} import {class_name}")
-
-    sync_init_lines.append("")
-    sync_init_lines.append("__all__ = [")
-    for line in sync_init_lines[:-2]:
-        name = line.split()[-1]
-        sync_init_lines.append(f"    '{name}',")
-    sync_init_lines.append("]")
-
-    async_init_lines.append("")
-    async_init_lines.append("__all__ = [")
-    for line in async_init_lines[:-2]:
-        name = line.split()[-1]
-        async_init_lines.append(f"    '{name}',")
-    async_init_lines.append("]")
-
-    (sync_out / "__init__.py").write_text(
-        "\n".join(sync_init_lines) + "\n", encoding="utf-8"
-    )
-    (async_out / "__init__.py").write_text(
-        "\n".join(async_init_lines) + "\n", encoding="utf-8"
-    )
+        exports[class_name] = module_name
+
+    init_code = generate_init_code(exports)
+    (sync_out / "__init__.py").write_text(init_code, encoding="utf-8")
+    (async_out / "__init__.py").write_text(init_code, encoding="utf-8")
+    Path(args.schemas_out).write_text(generate_schema_module(schemas), encoding="utf-8")
 
     return 0
 